@@ -8,9 +8,12 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from functools import partial
 from weakref import proxy
+import asyncio
 
 from .connection import Connection
+from .history_columns import HistoryColumns
 
 class Homee(object):
     """
@@ -28,18 +31,51 @@ The "Homee" class is the main entry point to communicate with a homee.
     """
 Timeout in seconds to wait for an expected API response.
     """
+    HISTORY_CONCURRENT_REQUESTS = 4
+    """
+Maximum number of history page requests sent concurrently.
+    """
+    HISTORY_PAGE_DURATION = 86400
+    """
+Time range in seconds requested per history page.
+    """
+    HISTORY_RESPONSE_TIMEOUT = 10
+    """
+Timeout in seconds to wait for a history page response.
+    """
+    API_RESPONSE_KEYS = { "all": "all",
+                          "groups": "groups",
+                          "homeegrams": "homeegrams",
+                          "nodes": "nodes",
+                          "plans": "plans",
+                          "relationships": "relationships",
+                          "settings": "settings",
+                          "users": "users"
+                        }
+    """
+Map of "GET:" request paths and the message type key of the response
+    """
 
-    def __init__(self, address, username, password):
+    def __init__(self, address, username, password, **kwargs):
         """
-Constructor __init__(Connection)
+Constructor __init__(Homee)
+
+:param address: homee address to connect to
+:param username: homee user name
+:param password: homee user password
+:param kwargs: Additional keyword arguments for the homee connection
 
 :since: 1.0.0
         """
 
-        self._connection = Connection(address, username, password)
+        self._connection = Connection(address, username, password, **kwargs)
         """
 homee connection
         """
+        self._refresh_tasks = { }
+        """
+Refresh requests currently in flight
+        """
     #
 
     async def __aenter__(self):
@@ -65,6 +101,56 @@ awaitable.
         return False
     #
 
+    @property
+    def connector(self):
+        """
+Returns the aiohttp connector shared with other connections.
+
+:return: (object) aiohttp connector; None for an own one
+:since:  1.1.0
+        """
+
+        return self._connection.connector
+    #
+
+    @connector.setter
+    def connector(self, connector):
+        """
+Sets the aiohttp connector shared with other connections. It is used for
+the next connection established.
+
+:param connector: aiohttp connector; None for an own one
+
+:since: 1.1.0
+        """
+
+        self._connection.connector = connector
+    #
+
+    @property
+    def is_connected(self):
+        """
+Returns true if the connection to homee is ready.
+
+:return: (bool) True if ready
+:since:  1.1.0
+        """
+
+        return self._connection.is_connected
+    #
+
+    @property
+    def registry(self):
+        """
+Returns the nodes registry of the homee connection.
+
+:return: (object) Nodes registry instance
+:since:  1.1.0
+        """
+
+        return self._connection.registry
+    #
+
     @property
     def _registry(self):
         """
@@ -77,6 +163,20 @@ Returns the nodes registry connected to this instance.
         return self._connection.registry
     #
 
+    def add_registry_listener(self, callback, event_types = None):
+        """
+Adds a callback called with registry events. It stays attached across
+reconnects and receives the events of the initial state download.
+
+:param callback: Callback receiving the event instance
+:param event_types: Event types the callback is interested in; None for all
+
+:since: 1.1.0
+        """
+
+        self._connection.add_registry_listener(callback, event_types)
+    #
+
     async def connect(self):
         """
 Establishes a connection to homee.
@@ -98,6 +198,46 @@ Disconnects from homee.
         await self._connection.disconnect()
     #
 
+    async def get_attribute_values(self, keys, default = None):
+        """
+Returns the values of the given node attributes as one consistent snapshot.
+
+:param keys: Iterable of node ID, attribute type name and instance tuples
+:param default: Default value if a node or attribute is not defined
+
+:return: (list) Attribute values in the order of the keys given
+:since:  1.1.0
+        """
+
+        async with self: return self._registry.get_attribute_values(keys, default)
+    #
+
+    async def get_group_nodes(self, group_name_or_id):
+        """
+Returns all known nodes in the group given.
+
+:param group_name_or_id: homee group ID or name
+
+:return: (list) Node instances
+:since:  1.1.0
+        """
+
+        async with self:
+            group_id = (group_name_or_id
+                        if (type(group_name_or_id) is int) else
+                        self._connection.groups.get_id_for_name(group_name_or_id)
+                       )
+
+            _return = [ ]
+
+            for node_id in sorted(self._connection.relationships.get_node_ids(group_id)):
+                if (self._registry.is_node_known(node_id)): _return.append(self._registry.get_node(node_id))
+            #
+
+            return _return
+        #
+    #
+
     async def get_node(self, node_name_or_id):
         """
 Returns the node for the ID given.
@@ -118,6 +258,169 @@ Returns the node for the ID given.
         #
     #
 
+    async def get_node_groups(self, node_name_or_id):
+        """
+Returns all known groups the node given is a member of.
+
+:param node_name_or_id: homee node ID or name
+
+:return: (list) Group item instances
+:since:  1.1.0
+        """
+
+        async with self:
+            node_id = (node_name_or_id
+                       if (type(node_name_or_id) is int) else
+                       self._registry.get_node_id_for_name(node_name_or_id)
+                      )
+
+            groups = self._connection.groups
+            return [ groups.get(group_id) for group_id in sorted(self._connection.relationships.get_group_ids(node_id)) if (group_id in groups) ]
+        #
+    #
+
+    async def get_attribute_history(self, node_id, attribute_id, timestamp_from, timestamp_till, limit = None):
+        """
+Returns the history of the given node attribute within the given time range.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param timestamp_from: UNIX timestamp of the time range start
+:param timestamp_till: UNIX timestamp of the time range end
+:param limit: Maximum number of history entries returned
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        return await self._get_history("/nodes/{0:d}/attributes/{1:d}/history".format(node_id, attribute_id),
+                                       "attribute_history",
+                                       { "node_id": node_id, "attribute_id": attribute_id },
+                                       timestamp_from,
+                                       timestamp_till,
+                                       limit
+                                      )
+    #
+
+    async def _get_history(self, path, response_key, ids, timestamp_from, timestamp_till, limit):
+        """
+Requests the history for the given API path in pages of
+"HISTORY_PAGE_DURATION" seconds sent concurrently and returns the merged
+result. The limit is requested for each page and applied to the merged
+result again.
+
+:param path: homee API history path
+:param response_key: Message type key of the responses expected
+:param ids: Dictionary of IDs the responses expected must contain
+:param timestamp_from: UNIX timestamp of the time range start
+:param timestamp_till: UNIX timestamp of the time range end
+:param limit: Maximum number of history entries returned
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        timestamp_from = int(timestamp_from)
+        timestamp_till = int(timestamp_till)
+
+        page_duration = self.__class__.HISTORY_PAGE_DURATION
+        semaphore = asyncio.Semaphore(self.__class__.HISTORY_CONCURRENT_REQUESTS)
+
+        pages = [ ]
+
+        for page_from in range(timestamp_from, timestamp_till, page_duration):
+            # homee includes both range ends so pages end one second before the next one starts
+            page_till = (timestamp_till if (page_from + page_duration >= timestamp_till) else page_from + page_duration - 1)
+            request = "GET:{0}?from={1:d}&till={2:d}".format(path, page_from, page_till)
+
+            if (limit is not None): request += "&limit={0:d}".format(limit)
+
+            pages.append(self._get_history_page(request, response_key, ids, semaphore))
+        #
+
+        pages = [ history_columns for history_columns in await asyncio.gather(*pages) if len(history_columns) > 0 ]
+
+        # Responses do not identify the page requested but pages never overlap
+        pages.sort(key = lambda history_columns: history_columns.timestamps[0])
+
+        _return = HistoryColumns(ids.get("node_id"), ids.get("attribute_id"), ids.get("homeegram_id"))
+        for history_columns in pages: _return.extend(history_columns)
+
+        # Entries missing from a page cut off by the limit lie beyond the first limit entries merged
+        if (limit is not None): _return.truncate(limit)
+
+        return _return
+    #
+
+    async def _get_history_page(self, request, response_key, ids, semaphore):
+        """
+Sends the given history page request and returns the response received.
+
+:param request: homee API history page request
+:param response_key: Message type key of the response expected
+:param ids: Dictionary of IDs the response expected must contain
+:param semaphore: Semaphore limiting concurrent history page requests
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        async with semaphore:
+            message = await self.send_and_receive_messages(request,
+                                                           response_key,
+                                                           partial(self._is_history_response, response_key, ids),
+                                                           self.__class__.HISTORY_RESPONSE_TIMEOUT
+                                                          )
+        #
+
+        if (message is None): raise asyncio.TimeoutError("Timeout waiting for response to '{0}'".format(request))
+        return HistoryColumns.from_dict(message[response_key])
+    #
+
+    async def get_homeegram_history(self, homeegram_id, timestamp_from, timestamp_till, limit = None):
+        """
+Returns the history of the given homeegram within the given time range.
+
+:param homeegram_id: homee homeegram ID
+:param timestamp_from: UNIX timestamp of the time range start
+:param timestamp_till: UNIX timestamp of the time range end
+:param limit: Maximum number of history entries returned
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        return await self._get_history("/homeegrams/{0:d}/history".format(homeegram_id),
+                                       "homeegram_history",
+                                       { "homeegram_id": homeegram_id },
+                                       timestamp_from,
+                                       timestamp_till,
+                                       limit
+                                      )
+    #
+
+    async def get_node_history(self, node_id, timestamp_from, timestamp_till, limit = None):
+        """
+Returns the history of the given node within the given time range.
+
+:param node_id: homee node ID
+:param timestamp_from: UNIX timestamp of the time range start
+:param timestamp_till: UNIX timestamp of the time range end
+:param limit: Maximum number of history entries returned
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        return await self._get_history("/nodes/{0:d}/history".format(node_id),
+                                       "node_history",
+                                       { "node_id": node_id },
+                                       timestamp_from,
+                                       timestamp_till,
+                                       limit
+                                      )
+    #
+
     async def is_node_known(self, node_name_or_id):
         """
 Returns true if the node ID given is registered.
@@ -139,6 +442,58 @@ Returns true if the node ID given is registered.
         #
     #
 
+    async def _refresh(self, request):
+        """
+Sends the given refresh request unless an identical one or a "GET:all"
+request is already in flight. Concurrent callers await the same request.
+
+:param request: homee API refresh request
+
+:since: 1.1.0
+        """
+
+        task = self._refresh_tasks.get("GET:all")
+        if (task is None): task = self._refresh_tasks.get(request)
+
+        if (task is None):
+            task = asyncio.ensure_future(self.send_and_receive_messages(request))
+            self._refresh_tasks[request] = task
+
+            task.add_done_callback(partial(self._on_refresh_done, request))
+        #
+
+        await asyncio.shield(task)
+    #
+
+    def _on_refresh_done(self, request, task):
+        """
+Removes the finished refresh request from the ones in flight.
+
+:param request: homee API refresh request
+:param task: Finished refresh task
+
+:since: 1.1.0
+        """
+
+        if (self._refresh_tasks.get(request) is task): del self._refresh_tasks[request]
+    #
+
+    def _is_history_response(self, response_key, ids, message):
+        """
+Returns true if the given message is a history response for the given IDs.
+
+:param response_key: Message type key of the response expected
+:param ids: Dictionary of IDs the response expected must contain
+:param message: Message dictionary
+
+:return: (bool) True if expected
+:since:  1.1.0
+        """
+
+        data = message[response_key]
+        return (type(data) is dict and all(data.get(key) == ids[key] for key in ids))
+    #
+
     async def refreshAll(self):
         """
 Refreshes all data types exposed by the homee API.
@@ -146,7 +501,7 @@ Refreshes all data types exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:all")
+        await self._refresh("GET:all")
     #
 
     async def refreshGroups(self):
@@ -156,7 +511,7 @@ Refreshes all groups exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:groups")
+        await self._refresh("GET:groups")
     #
 
     async def refreshHomeegrams(self):
@@ -166,7 +521,7 @@ Refreshes all homeegrams exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:homeegrams")
+        await self._refresh("GET:homeegrams")
     #
 
     async def refreshNodes(self):
@@ -176,7 +531,7 @@ Refreshes all nodes exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:nodes")
+        await self._refresh("GET:nodes")
     #
 
     async def refreshPlans(self):
@@ -186,7 +541,7 @@ Refreshes all plans exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:plans")
+        await self._refresh("GET:plans")
     #
 
     async def refreshRelationships(self):
@@ -196,7 +551,7 @@ Refreshes all data relationships exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:relationships")
+        await self._refresh("GET:relationships")
     #
 
     async def refreshSettings(self):
@@ -206,7 +561,7 @@ Refreshes all settings exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:settings")
+        await self._refresh("GET:settings")
     #
 
     async def refreshUsers(self):
@@ -216,7 +571,39 @@ Refreshes all users exposed by the homee API.
 :since: 1.0.0
         """
 
-        await self.send_and_receive_messages("GET:users")
+        await self._refresh("GET:users")
+    #
+
+    def _get_response_key(self, request):
+        """
+Returns the message type key of the response expected for the given request.
+
+:param request: homee API request
+
+:return: (str) Message type key; None if unknown
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (request.startswith("GET:")):
+            path = request[4:].split("?", 1)[0].strip("/")
+            _return = self.__class__.API_RESPONSE_KEYS.get(path)
+        #
+
+        return _return
+    #
+
+    def remove_registry_listener(self, callback):
+        """
+Removes a registry event callback previously added.
+
+:param callback: Callback receiving the event instance
+
+:since: 1.1.0
+        """
+
+        self._connection.remove_registry_listener(callback)
     #
 
     async def send(self, request):
@@ -231,18 +618,72 @@ Sends the given request to the homee API.
         async with self: await self._connection.send(request)
     #
 
-    async def send_and_receive_messages(self, request):
+    async def send_and_receive_messages(self, request, response_key = None, predicate = None, timeout = None):
         """
-Sends the given request to the homee API and wait for responses.
+Sends the given request to the homee API and wait for responses. Requests
+with a known response type return as soon as the response has been handled
+so that multiple requests may run concurrently.
 
 :param request: homee API request
-
-:since: 1.0.0
+:param response_key: Message type key of the response expected; None to
+                     detect it for known requests
+:param predicate: Callable receiving a message dictionary returning true if
+                  it is the response expected
+:param timeout: Time in seconds to wait for the response; None for the
+                default API response timeout
+
+:return: (dict) Response message dictionary if known and received in time
+:since:  1.0.0
         """
 
+        _return = None
+
+        if (timeout is None): timeout = self.__class__.API_RESPONSE_TIMEOUT
+
         async with self:
-            await self.send(request)
-            await self._connection.receive_and_handle_messages(self.__class__.API_RESPONSE_TIMEOUT)
+            if (response_key is None): response_key = self._get_response_key(request)
+
+            if (response_key is None):
+                await self.send(request)
+                await self._connection.receive_and_handle_messages(timeout)
+            else:
+                future = self._connection.create_message_waiter(response_key, predicate)
+
+                try:
+                    await self.send(request)
+                    _return = await self._connection.wait_for_message(timeout = timeout, future = future)
+                except asyncio.TimeoutError: pass
+                finally:
+                    if (not future.done()): self._connection.cancel_message_waiter(future)
+                #
+            #
         #
+
+        return _return
+    #
+
+    async def wait_for_node(self, node_id, timeout = None):
+        """
+Returns the node for the ID given as soon as it has been received.
+
+:param node_id: homee node ID
+:param timeout: Time in seconds to wait; None to wait without timeout
+
+:return: (object) Node instance
+:since:  1.1.0
+        """
+
+        return await self._registry.wait_for_node(node_id, timeout)
+    #
+
+    async def wait_for_disconnect(self):
+        """
+Handles all messages received until the connection to homee has been
+closed.
+
+:since: 1.1.0
+        """
+
+        if (self._connection.is_connected): await self._connection.receive_and_handle_messages(0)
     #
 #
@@ -8,6 +8,7 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from time import monotonic
 from urllib.parse import unquote
 import asyncio
 
@@ -325,21 +326,26 @@ The "Attribute" class provides access to node attribute properties.
 :license:    Mozilla Public License, v. 2.0
     """
 
-    def __init__(self, node, attribute_dict):
+    def __init__(self, node, attribute_dict, is_quoted = True):
         """
 Constructor __init__(Attribute)
 
 :param node: Node instance of the attribute
 :param attribute_dict: Attribute dictionary
+:param is_quoted: False if data, name and unit have already been unquoted
 
 :since: 1.0.0
         """
 
-        if (type(attribute_dict.get("data")) is str): attribute_dict['data'] = unquote(attribute_dict['data'])
-        if (type(attribute_dict.get("name")) is str): attribute_dict['name'] = unquote(attribute_dict['name'])
-        if (type(attribute_dict.get("unit")) is str): attribute_dict['unit'] = unquote(attribute_dict['unit'])
+        if (is_quoted):
+            if (type(attribute_dict.get("data")) is str): attribute_dict['data'] = unquote(attribute_dict['data'])
+            if (type(attribute_dict.get("name")) is str): attribute_dict['name'] = unquote(attribute_dict['name'])
+            if (type(attribute_dict.get("unit")) is str): attribute_dict['unit'] = unquote(attribute_dict['unit'])
+        #
 
         self._data = attribute_dict
+        self._generation = 0
+        self._last_update = monotonic()
         self._node = node
     #
 
@@ -403,6 +409,18 @@ Returns the homee attribute ID.
         return self._data.get("id")
     #
 
+    @property
+    def generation(self):
+        """
+Returns the registry generation the attribute value has been changed last.
+
+:return: (int) Registry generation
+:since:  1.1.0
+        """
+
+        return self._generation
+    #
+
     @property
     def instance(self):
         """
@@ -427,6 +445,18 @@ Returns true if the attribute is editable.
         return bool(self._data.get("editable", 0))
     #
 
+    @property
+    def last_update(self):
+        """
+Returns the monotonic clock time the attribute has been reported last.
+
+:return: (float) Monotonic clock time of the last update
+:since:  1.1.0
+        """
+
+        return self._last_update
+    #
+
     @property
     def max(self):
         """
@@ -551,8 +581,10 @@ Sets the attribute value(s).
 
         if (type(value) is dict):
             for key in value:
-                if (self._data[key] != value[key]): self._data[key] = value[key]
+                if (self._data.get(key) != value[key]): self._data[key] = value[key]
             #
         else: self._data['current_value'] = value
+
+        self._last_update = monotonic()
     #
 #
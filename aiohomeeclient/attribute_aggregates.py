@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from numbers import Number
+
+from .attribute import ATTRIBUTES
+from .node_interfaces import INTERFACE_SENSOR_MULTILEVEL_MAP
+
+AGGREGATED_ATTRIBUTE_TYPES = frozenset(INTERFACE_SENSOR_MULTILEVEL_MAP)
+"""
+Attribute type IDs running aggregates are maintained for
+"""
+
+class RunningAggregate(object):
+    """
+The "RunningAggregate" class maintains count, sum, minimum, maximum and mean
+of a set of keyed numeric values updated in place. The sum is compensated
+for the rounding errors of floating point additions.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(RunningAggregate)
+
+:since: 1.1.0
+        """
+
+        self._max = None
+        """
+Maximum value; None if it needs to be recalculated
+        """
+        self._min = None
+        """
+Minimum value; None if it needs to be recalculated
+        """
+        self._sum = 0
+        """
+Uncompensated sum of all values
+        """
+        self._sum_compensation = 0
+        """
+Rounding errors lost in the uncompensated sum
+        """
+        self._values = { }
+        """
+Values aggregated by key
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of values aggregated
+:since:  1.1.0
+        """
+
+        return len(self._values)
+    #
+
+    def _add(self, value):
+        """
+Adds the given value to the sum using Neumaier's compensated summation.
+
+:param value: Value
+
+:since: 1.1.0
+        """
+
+        total = self._sum + value
+
+        if (abs(self._sum) >= abs(value)): self._sum_compensation += (self._sum - total) + value
+        else: self._sum_compensation += (value - total) + self._sum
+
+        self._sum = total
+    #
+
+    @property
+    def count(self):
+        """
+Returns the number of values aggregated.
+
+:return: (int) Number of values aggregated
+:since:  1.1.0
+        """
+
+        return len(self._values)
+    #
+
+    @property
+    def max(self):
+        """
+Returns the maximum value. It is only recalculated if the previous maximum
+value has been decreased or removed.
+
+:return: (mixed) Maximum value; None if empty
+:since:  1.1.0
+        """
+
+        if (self._max is None and len(self._values) > 0): self._max = max(self._values.values())
+        return self._max
+    #
+
+    @property
+    def mean(self):
+        """
+Returns the arithmetic mean of all values.
+
+:return: (float) Mean value; None if empty
+:since:  1.1.0
+        """
+
+        return (self.sum / len(self._values) if (len(self._values) > 0) else None)
+    #
+
+    @property
+    def min(self):
+        """
+Returns the minimum value. It is only recalculated if the previous minimum
+value has been increased or removed.
+
+:return: (mixed) Minimum value; None if empty
+:since:  1.1.0
+        """
+
+        if (self._min is None and len(self._values) > 0): self._min = min(self._values.values())
+        return self._min
+    #
+
+    def remove(self, key):
+        """
+Removes the value for the given key.
+
+:param key: Value key
+
+:since: 1.1.0
+        """
+
+        if (key in self._values):
+            value = self._values.pop(key)
+            self._add(-value)
+
+            if (len(self._values) < 1): self._sum = self._sum_compensation = 0
+            if (value == self._max): self._max = None
+            if (value == self._min): self._min = None
+        #
+    #
+
+    def set(self, key, value):
+        """
+Sets the value for the given key. Non-numeric values remove the key.
+
+:param key: Value key
+:param value: Value
+
+:since: 1.1.0
+        """
+
+        if (not isinstance(value, Number) or isinstance(value, bool)): self.remove(key)
+        else:
+            previous_value = self._values.get(key)
+            self._values[key] = value
+
+            self._add(value)
+
+            if (previous_value is not None):
+                self._add(-previous_value)
+
+                if (previous_value == self._max and value < previous_value): self._max = None
+                if (previous_value == self._min and value > previous_value): self._min = None
+            #
+
+            if (self._max is not None and value > self._max): self._max = value
+            if (self._min is not None and value < self._min): self._min = value
+
+            if (len(self._values) == 1): self._max = self._min = value
+        #
+    #
+
+    @property
+    def sum(self):
+        """
+Returns the sum of all values.
+
+:return: (mixed) Sum of all values
+:since:  1.1.0
+        """
+
+        return self._sum + self._sum_compensation
+    #
+
+    def to_dict(self):
+        """
+Returns the aggregated values as a dictionary.
+
+:return: (dict) Aggregate dictionary
+:since:  1.1.0
+        """
+
+        return { "count": self.count, "sum": self.sum, "min": self.min, "max": self.max, "mean": self.mean }
+    #
+#
+
+class AttributeAggregates(object):
+    """
+The "AttributeAggregates" class maintains running aggregates of attribute
+values per attribute type across all nodes and per group and attribute
+type.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(AttributeAggregates)
+
+:since: 1.1.0
+        """
+
+        self._group_aggregates = { }
+        """
+Running aggregates per group ID and attribute type ID
+        """
+        self._type_aggregates = { }
+        """
+Running aggregates per attribute type ID
+        """
+    #
+
+    def add_node(self, node, group_ids = ( )):
+        """
+Adds the attribute values of the given node.
+
+:param node: Node instance
+:param group_ids: homee group IDs of the node
+
+:since: 1.1.0
+        """
+
+        for attribute in self._get_aggregated_attributes(node):
+            self.update_attribute(node.id, attribute, group_ids)
+        #
+    #
+
+    def _get_aggregated_attributes(self, node):
+        """
+Returns all attributes of the given node aggregated.
+
+:param node: Node instance
+
+:return: (list) Attribute instances
+:since:  1.1.0
+        """
+
+        _return = [ ]
+
+        for type_id in node._attributes:
+            if (type_id in AGGREGATED_ATTRIBUTE_TYPES): _return += node._attributes[type_id]
+        #
+
+        return _return
+    #
+
+    def get_group_aggregate(self, group_id, attribute_type):
+        """
+Returns the running aggregate of all attributes of the given type of nodes
+in the given group.
+
+:param group_id: homee group ID
+:param attribute_type: Attribute type name
+
+:return: (object) RunningAggregate instance; None if not available
+:since:  1.1.0
+        """
+
+        return self._group_aggregates.get(( group_id, ATTRIBUTES[attribute_type] ))
+    #
+
+    def get_type_aggregate(self, attribute_type):
+        """
+Returns the running aggregate of all attributes of the given type.
+
+:param attribute_type: Attribute type name
+
+:return: (object) RunningAggregate instance; None if not available
+:since:  1.1.0
+        """
+
+        return self._type_aggregates.get(ATTRIBUTES[attribute_type])
+    #
+
+    def remove_node(self, node, group_ids = ( )):
+        """
+Removes the attribute values of the given node.
+
+:param node: Node instance
+:param group_ids: homee group IDs of the node
+
+:since: 1.1.0
+        """
+
+        for attribute in self._get_aggregated_attributes(node):
+            key = ( node.id, attribute.id )
+            type_id = attribute['type']
+
+            if (type_id in self._type_aggregates): self._type_aggregates[type_id].remove(key)
+
+            for group_id in group_ids:
+                group_key = ( group_id, type_id )
+                if (group_key in self._group_aggregates): self._group_aggregates[group_key].remove(key)
+            #
+        #
+    #
+
+    def set_node_group_ids(self, node, previous_group_ids, group_ids):
+        """
+Moves the attribute values of the given node from the group aggregates of
+groups it has left to the ones of groups it has joined.
+
+:param node: Node instance
+:param previous_group_ids: homee group IDs of the node before
+:param group_ids: homee group IDs of the node
+
+:since: 1.1.0
+        """
+
+        for attribute in self._get_aggregated_attributes(node):
+            key = ( node.id, attribute.id )
+            type_id = attribute['type']
+
+            for group_id in previous_group_ids:
+                group_key = ( group_id, type_id )
+
+                if (group_id not in group_ids and group_key in self._group_aggregates):
+                    self._group_aggregates[group_key].remove(key)
+                #
+            #
+
+            for group_id in group_ids:
+                if (group_id in previous_group_ids): continue
+
+                group_key = ( group_id, type_id )
+
+                if (group_key not in self._group_aggregates): self._group_aggregates[group_key] = RunningAggregate()
+                self._group_aggregates[group_key].set(key, attribute.value)
+            #
+        #
+    #
+
+    def update_attribute(self, node_id, attribute, group_ids = ( )):
+        """
+Updates the aggregates for the current value of the given attribute.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance
+:param group_ids: homee group IDs of the node
+
+:since: 1.1.0
+        """
+
+        type_id = attribute['type']
+
+        if (type_id in AGGREGATED_ATTRIBUTE_TYPES):
+            key = ( node_id, attribute.id )
+            value = attribute.value
+
+            if (type_id not in self._type_aggregates): self._type_aggregates[type_id] = RunningAggregate()
+            self._type_aggregates[type_id].set(key, value)
+
+            for group_id in group_ids:
+                group_key = ( group_id, type_id )
+
+                if (group_key not in self._group_aggregates): self._group_aggregates[group_key] = RunningAggregate()
+                self._group_aggregates[group_key].set(key, value)
+            #
+        #
+    #
+#
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from numbers import Number
+from time import time
+
+try: import numpy
+except ImportError: numpy = None
+
+from .attribute import ATTRIBUTES
+
+class RingBuffer(object):
+    """
+The "RingBuffer" class stores a fixed number of the latest timestamp and
+value samples in "array" storage. Each sample is written twice so that any
+number of the latest samples is available as one contiguous slice without
+copying.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, capacity):
+        """
+Constructor __init__(RingBuffer)
+
+:param capacity: Number of samples stored
+
+:since: 1.1.0
+        """
+
+        if (capacity < 1): raise ValueError("Capacity '{0!r}' given is invalid".format(capacity))
+
+        self.capacity = capacity
+        """
+Number of samples stored
+        """
+        self._position = 0
+        """
+Position the next sample is written to
+        """
+        self._size = 0
+        """
+Number of samples available
+        """
+        self._timestamps = array("d", bytes(16 * capacity))
+        """
+Sample timestamps
+        """
+        self._values = array("d", bytes(16 * capacity))
+        """
+Sample values
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of samples available
+:since:  1.1.0
+        """
+
+        return self._size
+    #
+
+    def append(self, timestamp, value):
+        """
+Appends a sample and overwrites the oldest one if the buffer is full.
+
+:param timestamp: UNIX timestamp of the sample
+:param value: Sample value
+
+:since: 1.1.0
+        """
+
+        position = self._position
+
+        self._timestamps[position] = timestamp
+        self._timestamps[position + self.capacity] = timestamp
+        self._values[position] = value
+        self._values[position + self.capacity] = value
+
+        self._position = (position + 1) % self.capacity
+        if (self._size < self.capacity): self._size += 1
+    #
+
+    def _get_views(self, start, end, as_numpy):
+        """
+Returns views of the given range of the latest samples.
+
+:param start: Index of the first sample within the latest samples
+:param end: Index after the last sample within the latest samples
+:param as_numpy: True to return NumPy arrays sharing the buffer
+
+:return: (tuple) Timestamps and values views
+:since:  1.1.0
+        """
+
+        offset = self._position + self.capacity - self._size
+
+        timestamps = memoryview(self._timestamps)[offset + start:offset + end]
+        values = memoryview(self._values)[offset + start:offset + end]
+
+        if (as_numpy):
+            if (numpy is None): raise RuntimeError("NumPy is not available")
+
+            timestamps = numpy.frombuffer(timestamps, dtype = numpy.float64)
+            values = numpy.frombuffer(values, dtype = numpy.float64)
+        #
+
+        return ( timestamps, values )
+    #
+
+    def get_last(self, count = None, as_numpy = False):
+        """
+Returns views of the latest samples in chronological order. The views share
+the buffer and are only valid until further samples are appended.
+
+:param count: Number of latest samples; None for all available
+:param as_numpy: True to return NumPy arrays sharing the buffer
+
+:return: (tuple) Timestamps and values views
+:since:  1.1.0
+        """
+
+        if (count is None or count > self._size): count = self._size
+        return self._get_views(self._size - count, self._size, as_numpy)
+    #
+
+    def get_window(self, timestamp_from, timestamp_till = None, as_numpy = False):
+        """
+Returns views of the samples within the given time window in chronological
+order. The views share the buffer and are only valid until further samples
+are appended.
+
+:param timestamp_from: UNIX timestamp of the first sample included
+:param timestamp_till: UNIX timestamp of the last sample included; None for
+                       the latest one
+:param as_numpy: True to return NumPy arrays sharing the buffer
+
+:return: (tuple) Timestamps and values views
+:since:  1.1.0
+        """
+
+        timestamps = self.get_last()[0]
+
+        start = bisect_left(timestamps, timestamp_from)
+        end = (self._size if (timestamp_till is None) else bisect_right(timestamps, timestamp_till))
+
+        return self._get_views(start, max(start, end), as_numpy)
+    #
+#
+
+class AttributeHistoryStore(object):
+    """
+The "AttributeHistoryStore" class keeps ring buffers of reported values for
+tracked node attributes.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, capacity = 512):
+        """
+Constructor __init__(AttributeHistoryStore)
+
+:param capacity: Number of samples stored per attribute
+
+:since: 1.1.0
+        """
+
+        self._buffers = { }
+        """
+Ring buffers per node and attribute ID
+        """
+        self.capacity = capacity
+        """
+Number of samples stored per attribute
+        """
+        self._tracked_attributes = set()
+        """
+Node and attribute IDs tracked
+        """
+        self._tracked_types = set()
+        """
+Attribute type IDs tracked
+        """
+    #
+
+    def get_buffer(self, node_id, attribute_id):
+        """
+Returns the ring buffer for the given node and attribute ID.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+
+:return: (object) Ring buffer instance; None if no samples are recorded
+:since:  1.1.0
+        """
+
+        return self._buffers.get(( node_id, attribute_id ))
+    #
+
+    def get_last(self, node_id, attribute_id, count = None, as_numpy = False):
+        """
+Returns views of the latest samples recorded for the given node and
+attribute ID.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param count: Number of latest samples; None for all available
+:param as_numpy: True to return NumPy arrays sharing the buffer
+
+:return: (tuple) Timestamps and values views; None if no samples are
+         recorded
+:since:  1.1.0
+        """
+
+        buffer = self.get_buffer(node_id, attribute_id)
+        return (None if (buffer is None) else buffer.get_last(count, as_numpy))
+    #
+
+    def get_window(self, node_id, attribute_id, timestamp_from, timestamp_till = None, as_numpy = False):
+        """
+Returns views of the samples recorded within the given time window for the
+given node and attribute ID.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param timestamp_from: UNIX timestamp of the first sample included
+:param timestamp_till: UNIX timestamp of the last sample included; None for
+                       the latest one
+:param as_numpy: True to return NumPy arrays sharing the buffer
+
+:return: (tuple) Timestamps and values views; None if no samples are
+         recorded
+:since:  1.1.0
+        """
+
+        buffer = self.get_buffer(node_id, attribute_id)
+
+        return (None
+                if (buffer is None) else
+                buffer.get_window(timestamp_from, timestamp_till, as_numpy)
+               )
+    #
+
+    def is_tracked(self, node_id, attribute):
+        """
+Returns true if values of the given attribute are recorded.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance
+
+:return: (bool) True if tracked
+:since:  1.1.0
+        """
+
+        return (attribute['type'] in self._tracked_types
+                or ( node_id, attribute.id ) in self._tracked_attributes
+               )
+    #
+
+    def record(self, node_id, attribute, timestamp = None):
+        """
+Records the current value of the given attribute if it is tracked and
+numeric.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance
+:param timestamp: UNIX timestamp of the sample; None for now
+
+:since: 1.1.0
+        """
+
+        value = attribute.value
+
+        if (isinstance(value, Number) and self.is_tracked(node_id, attribute)):
+            key = ( node_id, attribute.id )
+            buffer = self._buffers.get(key)
+
+            if (buffer is None):
+                buffer = RingBuffer(self.capacity)
+                self._buffers[key] = buffer
+            #
+
+            buffer.append((time() if (timestamp is None) else timestamp), value)
+        #
+    #
+
+    def track(self, node_id, attribute_id):
+        """
+Starts recording values of the given node and attribute ID.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+
+:since: 1.1.0
+        """
+
+        self._tracked_attributes.add(( node_id, attribute_id ))
+    #
+
+    def track_attribute_type(self, attribute_type):
+        """
+Starts recording values of all attributes of the given type.
+
+:param attribute_type: Attribute type name
+
+:since: 1.1.0
+        """
+
+        self._tracked_types.add(ATTRIBUTES[attribute_type])
+    #
+
+    def untrack(self, node_id, attribute_id):
+        """
+Stops recording values of the given node and attribute ID and removes the
+samples recorded.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+
+:since: 1.1.0
+        """
+
+        key = ( node_id, attribute_id )
+
+        self._tracked_attributes.discard(key)
+        self._buffers.pop(key, None)
+    #
+
+    def untrack_attribute_type(self, attribute_type):
+        """
+Stops recording values of all attributes of the given type. Samples
+recorded are kept.
+
+:param attribute_type: Attribute type name
+
+:since: 1.1.0
+        """
+
+        self._tracked_types.discard(ATTRIBUTES[attribute_type])
+    #
+#
@@ -129,7 +129,10 @@ Returns a new "AttributePropertyInterface" instance for the attribute given.
             interfaces.add(base.__name__)
         #
 
-        dynamic_class = new_class(AttributePropertyInterface.__name__, tuple(bases), { "_interfaces": interfaces })
+        dynamic_class = new_class(AttributePropertyInterface.__name__,
+                                  tuple(bases),
+                                  exec_body = lambda namespace: namespace.update(_interfaces = interfaces)
+                                 )
         return dynamic_class(node, attribute)
     #
 #
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from numbers import Number
+
+try: import numpy
+except ImportError: numpy = None
+
+from .attribute import ATTRIBUTES
+from .node_interfaces.abstract_sensor import ALTERNATIVE_MAP
+
+class AttributeTypeIndex(object):
+    """
+The "AttributeTypeIndex" class maps attribute types to the attributes of
+all registered nodes implementing them.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(AttributeTypeIndex)
+
+:since: 1.1.0
+        """
+
+        self._slots = { }
+        """
+Attributes sorted by instance per attribute type ID and node ID
+        """
+    #
+
+    def add_node(self, node):
+        """
+Adds the attributes of the given node to the index.
+
+:param node: Node instance
+
+:since: 1.1.0
+        """
+
+        for type_id in node._attributes:
+            if (type_id not in self._slots): self._slots[type_id] = { }
+            self._slots[type_id][node.id] = node._attributes[type_id]
+        #
+    #
+
+    def get_slots(self, attribute_type, use_alternatives = True):
+        """
+Returns the attributes of the given type per node ID. Nodes not
+implementing the type are included with the first alternative type
+implemented if requested.
+
+:param attribute_type: Attribute type name
+:param use_alternatives: True to include alternative sensor types
+
+:return: (dict) Attributes sorted by instance per node ID
+:since:  1.1.0
+        """
+
+        _return = dict(self._slots.get(ATTRIBUTES[attribute_type], { }))
+
+        if (use_alternatives):
+            for alternative_type in ALTERNATIVE_MAP.get(attribute_type, ( )):
+                for ( node_id, attributes ) in self._slots.get(ATTRIBUTES[alternative_type], { }).items():
+                    if (node_id not in _return): _return[node_id] = attributes
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def get_values(self, attribute_type, instance = 0, use_alternatives = True):
+        """
+Returns NumPy arrays of node IDs, values and units of the given attribute
+type instance for all nodes implementing it. Non-numeric values are
+returned as NaN.
+
+:param attribute_type: Attribute type name
+:param instance: Attribute instance
+:param use_alternatives: True to include alternative sensor types
+
+:return: (tuple) Node IDs, values and units NumPy arrays
+:since:  1.1.0
+        """
+
+        if (numpy is None): raise RuntimeError("NumPy is not available")
+
+        node_ids = [ ]
+        values = [ ]
+        units = [ ]
+
+        nan = float("nan")
+
+        for ( node_id, attributes ) in self.get_slots(attribute_type, use_alternatives).items():
+            if (instance >= len(attributes)): continue
+
+            attribute = attributes[instance]
+            value = attribute.value
+
+            node_ids.append(node_id)
+            values.append(value if (isinstance(value, Number)) else nan)
+            units.append(attribute.unit)
+        #
+
+        return ( numpy.array(node_ids, dtype = numpy.int64),
+                 numpy.array(values, dtype = numpy.float64),
+                 numpy.array(units, dtype = object)
+               )
+    #
+
+    def remove_node(self, node):
+        """
+Removes the attributes of the given node from the index.
+
+:param node: Node instance
+
+:since: 1.1.0
+        """
+
+        for type_id in node._attributes:
+            slots = self._slots.get(type_id)
+
+            if (slots is not None and slots.get(node.id) is node._attributes[type_id]):
+                del slots[node.id]
+                if (len(slots) < 1): del self._slots[type_id]
+            #
+        #
+    #
+#
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import monotonic
+import asyncio
+
+from .attribute import ATTRIBUTES
+
+class AttributeUpdateCoalescer(object):
+    """
+The "AttributeUpdateCoalescer" class limits attribute change events passed
+on to at most one per configured window and attribute. Events suppressed
+within a window are merged into the next one passed on carrying the latest
+value and the number of skipped updates.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, callback):
+        """
+Constructor __init__(AttributeUpdateCoalescer)
+
+:param callback: Callback receiving events passed on
+
+:since: 1.1.0
+        """
+
+        self._callback = callback
+        """
+Callback receiving events passed on
+        """
+        self._states = { }
+        """
+Coalescing state per node and attribute ID
+        """
+        self._windows = { }
+        """
+Coalescing window in seconds per attribute type ID
+        """
+    #
+
+    def flush(self):
+        """
+Passes on all pending events.
+
+:since: 1.1.0
+        """
+
+        for key in list(self._states):
+            if (self._states[key]['event'] is not None): self._flush_key(key)
+        #
+    #
+
+    def _flush_key(self, key):
+        """
+Passes on the pending event of the given node and attribute ID.
+
+:param key: Node and attribute ID tuple
+
+:since: 1.1.0
+        """
+
+        state = self._states[key]
+
+        if (state['timer'] is not None):
+            state['timer'].cancel()
+            state['timer'] = None
+        #
+
+        event = state['event']
+
+        if (event is not None):
+            state['event'] = None
+            state['emitted'] = monotonic()
+
+            self._callback(event.copy(skipped_count = state['skipped_count']))
+            state['skipped_count'] = 0
+        #
+    #
+
+    def get_window(self, attribute_type):
+        """
+Returns the coalescing window for the given attribute type.
+
+:param attribute_type: Attribute type name
+
+:return: (float) Coalescing window in seconds
+:since:  1.1.0
+        """
+
+        return self._windows.get(ATTRIBUTES[attribute_type], 0)
+    #
+
+    def set_window(self, attribute_type, window):
+        """
+Sets the coalescing window for the given attribute type.
+
+:param attribute_type: Attribute type name
+:param window: Coalescing window in seconds; 0 to disable coalescing
+
+:since: 1.1.0
+        """
+
+        type_id = ATTRIBUTES[attribute_type]
+
+        if (window > 0): self._windows[type_id] = window
+        elif (type_id in self._windows): del self._windows[type_id]
+    #
+
+    def submit(self, event):
+        """
+Passes on the given attribute change event or holds it back until the
+coalescing window of the attribute has elapsed.
+
+:param event: Attribute change event
+
+:since: 1.1.0
+        """
+
+        window = self._windows.get(ATTRIBUTES.get(event.attribute_type), 0)
+        key = ( event.node_id, event.attribute_id )
+
+        if (window <= 0):
+            if (key in self._states): self._flush_key(key)
+            self._callback(event)
+        else:
+            now = monotonic()
+            state = self._states.get(key)
+
+            if (state is None):
+                state = { "emitted": None, "event": None, "skipped_count": 0, "timer": None }
+                self._states[key] = state
+            #
+
+            if (state['event'] is not None and now - state['emitted'] >= window): self._flush_key(key)
+
+            if (state['emitted'] is None or now - state['emitted'] >= window):
+                state['emitted'] = now
+                self._callback(event)
+            else:
+                if (state['event'] is not None):
+                    event = event.copy(previous_value = state['event'].previous_value)
+                    state['skipped_count'] += 1
+                #
+
+                state['event'] = event
+
+                if (state['timer'] is None):
+                    try:
+                        state['timer'] = asyncio.get_running_loop().call_later(window - (now - state['emitted']),
+                                                                               self._flush_key,
+                                                                               key
+                                                                              )
+                    except RuntimeError: pass
+                #
+            #
+        #
+    #
+#
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from bisect import bisect_left, insort
+
+from .event import EVENT_BATTERY_LOW, EVENT_BATTERY_RECOVERED
+
+class BatteryLevelIndex(object):
+    """
+The "BatteryLevelIndex" class keeps the battery levels of nodes sorted to
+find the lowest ones and the ones below a threshold without a scan.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, threshold = 20):
+        """
+Constructor __init__(BatteryLevelIndex)
+
+:param threshold: Battery level below which a node is considered low
+
+:since: 1.1.0
+        """
+
+        self._entries = [ ]
+        """
+Battery level and node ID tuples sorted ascending
+        """
+        self._levels = { }
+        """
+Battery level per node ID
+        """
+        self._low_node_ids = set()
+        """
+Node IDs with a battery level below the threshold
+        """
+        self._threshold = threshold
+        """
+Battery level below which a node is considered low
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of nodes indexed
+:since:  1.1.0
+        """
+
+        return len(self._entries)
+    #
+
+    @property
+    def threshold(self):
+        """
+Returns the battery level below which a node is considered low.
+
+:return: (float) Battery level threshold
+:since:  1.1.0
+        """
+
+        return self._threshold
+    #
+
+    def get_below(self, threshold = None):
+        """
+Returns the node IDs and battery levels below the given threshold sorted
+ascending.
+
+:param threshold: Battery level threshold; None for the configured one
+
+:return: (list) Node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        if (threshold is None): threshold = self._threshold
+
+        position = bisect_left(self._entries, ( threshold, ))
+        return [ ( node_id, level ) for ( level, node_id ) in self._entries[:position] ]
+    #
+
+    def get_level(self, node_id):
+        """
+Returns the battery level indexed for the given node ID.
+
+:param node_id: homee node ID
+
+:return: (float) Battery level; None if not indexed
+:since:  1.1.0
+        """
+
+        return self._levels.get(node_id)
+    #
+
+    def get_lowest(self, count):
+        """
+Returns the node IDs and battery levels of the given number of nodes with
+the lowest battery levels sorted ascending.
+
+:param count: Number of nodes
+
+:return: (list) Node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        return [ ( node_id, level ) for ( level, node_id ) in self._entries[:count] ]
+    #
+
+    def remove(self, node_id):
+        """
+Removes the given node ID.
+
+:param node_id: homee node ID
+
+:since: 1.1.0
+        """
+
+        level = self._levels.pop(node_id, None)
+
+        if (level is not None):
+            del self._entries[bisect_left(self._entries, ( level, node_id ))]
+            self._low_node_ids.discard(node_id)
+        #
+    #
+
+    def set_level(self, node_id, level):
+        """
+Sets the battery level of the given node ID.
+
+:param node_id: homee node ID
+:param level: Battery level; None to remove the node ID
+
+:return: (str) Event type if the level has crossed the threshold; None
+         otherwise
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (level is None): self.remove(node_id)
+        elif (self._levels.get(node_id) != level):
+            previous_level = self._levels.get(node_id)
+
+            if (previous_level is not None): del self._entries[bisect_left(self._entries, ( previous_level, node_id ))]
+
+            self._levels[node_id] = level
+            insort(self._entries, ( level, node_id ))
+
+            _return = self._update_low_state(node_id, level)
+        #
+
+        return _return
+    #
+
+    def set_threshold(self, threshold):
+        """
+Sets the battery level below which a node is considered low.
+
+:param threshold: Battery level threshold
+
+:return: (list) Node ID and event type tuples for nodes crossing the new
+         threshold
+:since:  1.1.0
+        """
+
+        self._threshold = threshold
+        _return = [ ]
+
+        for ( level, node_id ) in self._entries:
+            event_type = self._update_low_state(node_id, level)
+            if (event_type is not None): _return.append(( node_id, event_type ))
+        #
+
+        return _return
+    #
+
+    def _update_low_state(self, node_id, level):
+        """
+Updates the low battery state of the given node ID.
+
+:param node_id: homee node ID
+:param level: Battery level
+
+:return: (str) Event type if the level has crossed the threshold; None
+         otherwise
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (level < self._threshold):
+            if (node_id not in self._low_node_ids):
+                self._low_node_ids.add(node_id)
+                _return = EVENT_BATTERY_LOW
+            #
+        elif (node_id in self._low_node_ids):
+            self._low_node_ids.discard(node_id)
+            _return = EVENT_BATTERY_RECOVERED
+        #
+
+        return _return
+    #
+#
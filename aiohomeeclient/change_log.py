@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import deque
+
+class ChangeLog(object):
+    """
+The "ChangeLog" class keeps a bounded log of registry changes ordered by
+generation to answer what has changed since a given generation.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, maxlen = 4096):
+        """
+Constructor __init__(ChangeLog)
+
+:param maxlen: Maximum number of changes logged
+
+:since: 1.1.0
+        """
+
+        self._entries = deque(maxlen = maxlen)
+        """
+Generation, node ID, attribute ID and value tuples
+        """
+        self._truncated_generation = 0
+        """
+Generation of the newest change no longer logged
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of changes logged
+:since:  1.1.0
+        """
+
+        return len(self._entries)
+    #
+
+    def append(self, generation, node_id, attribute_id = None, value = None):
+        """
+Logs a change. Changes without an attribute ID stand for a node added or
+replaced as a whole.
+
+:param generation: Registry generation of the change
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID; None for the whole node
+:param value: Attribute value
+
+:since: 1.1.0
+        """
+
+        if (len(self._entries) == self._entries.maxlen): self._truncated_generation = self._entries[0][0]
+        self._entries.append(( generation, node_id, attribute_id, value ))
+    #
+
+    def get_since(self, generation):
+        """
+Returns the changes newer than the given generation. Only the latest change
+per node attribute is returned.
+
+:param generation: Registry generation known to the caller
+
+:return: (list) Generation, node ID, attribute ID and value tuples ordered
+         by generation; None if changes since the generation given are no
+         longer logged
+:since:  1.1.0
+        """
+
+        if (generation < self._truncated_generation): return None
+
+        changes = { }
+
+        for entry in reversed(self._entries):
+            if (entry[0] <= generation): break
+
+            key = ( entry[1], entry[2] )
+            if (key not in changes): changes[key] = entry
+        #
+
+        return sorted(changes.values(), key = ChangeLog._get_generation)
+    #
+
+    @staticmethod
+    def _get_generation(entry):
+        """
+Returns the generation of the given change log entry.
+
+:param entry: Change log entry
+
+:return: (int) Registry generation
+:since:  1.1.0
+        """
+
+        return entry[0]
+    #
+#
@@ -11,15 +11,27 @@ obtain one at http://mozilla.org/MPL/2.0/.
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from hashlib import sha512
 from json import loads as parseJson
+from logging import getLogger
 from time import time
 from urllib.parse import quote_plus
 import asyncio
 import sys
 
-from aiohttp import ClientSession, ClientTimeout, WSMsgType
+from aiohttp import ClientSession, ClientTimeout, WSMsgType, WSServerHandshakeError
 
-from .registry import Registry
+from .frame_parser import FrameParser
+from .inbound_queue import OVERFLOW_BLOCK, InboundQueue
+from .item import Item
+from .item_registry import ItemRegistry
 from .node import Node
+from .node_stream_decoder import NodeStreamDecoder
+from .registry import Registry
+from .relationship_registry import RelationshipRegistry
+
+_LOG = getLogger(__name__)
+"""
+Logger instance
+"""
 
 class Connection(object):
     """
@@ -37,10 +49,32 @@ homee brain.
     API_MESSAGE_TIMEOUT = 0.25
     """
 Timeout in seconds to wait for a message.
+    """
+    HANDLE_MESSAGES_BATCH_SIZE = 25
+    """
+Number of messages queued handled in a burst before other tasks may run.
+    """
+    HANDLE_NODES_BATCH_SIZE = 25
+    """
+Number of nodes of a list built before other tasks may run.
+    """
+    INBOUND_QUEUE_OVERFLOW_POLICY = OVERFLOW_BLOCK
+    """
+Policy applied if the queue of messages received but not handled yet is
+full.
+    """
+    INBOUND_QUEUE_SIZE = 1000
+    """
+Maximum number of messages received but not handled yet.
     """
     IO_TIMEOUT = 5
     """
 Timeout in seconds for communication.
+    """
+    LARGE_FRAME_THRESHOLD = 1048576
+    """
+Size in characters above which frames are decoded in the executor given or
+streamed if enabled.
     """
     TOKEN_TIMEOUT_THRESHOLD = 30
     """
@@ -51,10 +85,40 @@ Threshold in seconds before a token expires to request a new one.
 Local homee websocket port
     """
 
-    def __init__(self, address, username, password):
+    def __init__(self,
+                 address,
+                 username,
+                 password,
+                 inbound_queue_size = None,
+                 inbound_queue_overflow_policy = None,
+                 connector = None,
+                 large_frame_executor = None,
+                 large_frame_threshold = None,
+                 stream_large_frames = False,
+                 recorder = None
+                ):
         """
 Constructor __init__(Connection)
 
+:param address: homee address to connect to
+:param username: homee user name
+:param password: homee user password
+:param inbound_queue_size: Maximum number of messages received but not
+                           handled yet
+:param inbound_queue_overflow_policy: Policy applied if the inbound queue is
+                                      full
+:param connector: aiohttp connector shared with other connections; None
+                  for an own one
+:param large_frame_executor: concurrent.futures executor to decode frames
+                             above the threshold in; None to decode all
+                             frames in the event loop
+:param large_frame_threshold: Size in characters above which frames are
+                              decoded in the executor or streamed
+:param stream_large_frames: True to handle each node of frames above the
+                            threshold as soon as it has been decoded
+:param recorder: Traffic recorder to append all frames received and sent
+                 to; None to not record
+
 :since: 1.0.0
         """
 
@@ -69,18 +133,100 @@ True if the given homee address is not the remote proxy one
         self._client_session = None
         """
 aiohttp client session instance
+        """
+        self._connector = connector
+        """
+aiohttp connector shared with other connections
+        """
+        self._groups = None
+        """
+Groups registry connected to this instance
+        """
+        self._handler_task = None
+        """
+Task handling all messages received
+        """
+        self._homeegrams = None
+        """
+Homeegrams registry connected to this instance
+        """
+        self._inbound_queue = None
+        """
+Queue of messages received but not handled yet
+        """
+        self._inbound_queue_overflow_policy = (self.__class__.INBOUND_QUEUE_OVERFLOW_POLICY
+                                               if (inbound_queue_overflow_policy is None) else
+                                               inbound_queue_overflow_policy
+                                              )
+        """
+Policy applied if the inbound queue is full
+        """
+        self._inbound_queue_size = (self.__class__.INBOUND_QUEUE_SIZE
+                                    if (inbound_queue_size is None) else
+                                    inbound_queue_size
+                                   )
+        """
+Maximum number of messages received but not handled yet
+        """
+        self._message_listeners = [ ]
+        """
+Callbacks called for each message received
+        """
+        self._message_waiters = [ ]
+        """
+Futures waiting for a message received
+        """
+        self._large_frame_executor = large_frame_executor
+        """
+Executor to decode frames above the threshold in
+        """
+        self._large_frame_threshold = (self.__class__.LARGE_FRAME_THRESHOLD
+                                       if (large_frame_threshold is None) else
+                                       large_frame_threshold
+                                      )
+        """
+Size in characters above which frames are decoded in the executor
         """
         self.password = password
         """
 homee user password
+        """
+        self._plans = None
+        """
+Plans registry connected to this instance
+        """
+        self._receiver_task = None
+        """
+Task reading all messages from the homee websocket connection
+        """
+        self._recorder = recorder
+        """
+Traffic recorder all frames received and sent are appended to
         """
         self._registry = None
         """
 Nodes registry connected to this instance
+        """
+        self._registry_listeners = [ ]
+        """
+Registry event listeners and event types added to each registry created
+        """
+        self._relationships = None
+        """
+Relationships registry connected to this instance
+        """
+        self._settings = None
+        """
+homee settings item received last
         """
         self._socket = None
         """
 homee connection websocket
+        """
+        self._stream_large_frames = stream_large_frames
+        """
+True to handle each node of frames above the threshold as soon as it has
+been decoded
         """
         self._token = None
         """
@@ -94,6 +240,10 @@ Authorized homee access token timeout
         """
 homee user name
         """
+        self._users = None
+        """
+Users registry connected to this instance
+        """
     #
 
     async def __aenter__(self):
@@ -107,8 +257,6 @@ awaitable.
         if (self._socket is None or self._socket.closed):
             await self.connect()
         #
-
-        await self._handle_messages()
     #
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -136,26 +284,62 @@ instances of the class.
 
         """
 The following list of attributes are filtered either for performance reasons
-or to catch recursion.
+or to catch recursion. Messages still queued are handled after the socket
+has been closed and use the registries as well.
         """
 
         if (name not in ("access_token",
                          "address",
                          "_address_is_local",
                          "__aexit__",
+                         "cancel_message_waiter",
                          "__class__",
                          "_client_session",
+                         "_connector",
                          "connect",
+                         "connect_socket",
+                         "connector",
+                         "create_message_waiter",
                          "disconnect",
+                         "_dispatch_message",
+                         "groups",
+                         "_groups",
                          "_handle_message",
                          "_handle_messages",
+                         "_handler_task",
+                         "homeegrams",
+                         "_homeegrams",
+                         "_inbound_queue",
+                         "_inbound_queue_overflow_policy",
+                         "_inbound_queue_size",
                          "is_connected",
+                         "_large_frame_executor",
+                         "_large_frame_threshold",
                          "location",
+                         "_message_listeners",
+                         "_message_waiters",
                          "password",
+                         "plans",
+                         "_plans",
+                         "_receive_messages",
+                         "_receiver_task",
+                         "_recorder",
+                         "registry",
+                         "_registry",
+                         "add_registry_listener",
+                         "_registry_listeners",
+                         "relationships",
+                         "_relationships",
+                         "remove_registry_listener",
+                         "_settings",
                          "_socket",
+                         "_stream_large_frames",
                          "_token",
                          "_token_timeout",
-                         "username"
+                         "username",
+                         "users",
+                         "_users",
+                         "wait_for_message"
                         )
             and (self._socket is None or self._socket.closed)
            ): raise IOError("Connection has not been established or has been closed")
@@ -210,6 +394,70 @@ Returns the authorized access token.
         return self._token
     #
 
+    @property
+    def connector(self):
+        """
+Returns the aiohttp connector shared with other connections.
+
+:return: (object) aiohttp connector; None for an own one
+:since:  1.1.0
+        """
+
+        return self._connector
+    #
+
+    @connector.setter
+    def connector(self, connector):
+        """
+Sets the aiohttp connector shared with other connections. It is used for
+the next connection established.
+
+:param connector: aiohttp connector; None for an own one
+
+:since: 1.1.0
+        """
+
+        self._connector = connector
+    #
+
+    @property
+    def groups(self):
+        """
+Returns the groups registry connected to this instance.
+
+:return: (object) Groups registry instance
+:since:  1.1.0
+        """
+
+        if (self._groups is None): self._groups = ItemRegistry()
+        return self._groups
+    #
+
+    @property
+    def homeegrams(self):
+        """
+Returns the homeegrams registry connected to this instance.
+
+:return: (object) Homeegrams registry instance
+:since:  1.1.0
+        """
+
+        if (self._homeegrams is None): self._homeegrams = ItemRegistry()
+        return self._homeegrams
+    #
+
+    @property
+    def inbound_queue_metrics(self):
+        """
+Returns the metrics of the queue of messages received but not handled yet.
+
+:return: (dict) Queue metrics
+:since:  1.1.0
+        """
+
+        return self._inbound_queue.metrics
+    #
+
     @property
     def is_connected(self):
         """
@@ -235,6 +483,19 @@ Returns the URL base location for communication with homee.
         return "{0}{1}".format(self.address, port)
     #
 
+    @property
+    def plans(self):
+        """
+Returns the plans registry connected to this instance.
+
+:return: (object) Plans registry instance
+:since:  1.1.0
+        """
+
+        if (self._plans is None): self._plans = ItemRegistry()
+        return self._plans
+    #
+
     @property
     def registry(self):
         """
@@ -244,10 +505,56 @@ Returns the nodes registry connected to this instance.
 :since:  1.0.0
         """
 
-        if (self._registry is None): self._registry = Registry(self)
+        if (self._registry is None):
+            self._registry = Registry(self)
+
+            for ( callback, event_types ) in self._registry_listeners:
+                self._registry.add_listener(callback, event_types)
+            #
+        #
+
         return self._registry
     #
 
+    @property
+    def relationships(self):
+        """
+Returns the relationships registry connected to this instance. Group
+memberships derived from it are passed to the nodes registry.
+
+:return: (object) Relationships registry instance
+:since:  1.1.0
+        """
+
+        if (self._relationships is None): self._relationships = RelationshipRegistry(self.registry)
+        return self._relationships
+    #
+
+    @property
+    def settings(self):
+        """
+Returns the homee settings received last.
+
+:return: (object) Settings item instance; None if not received yet
+:since:  1.1.0
+        """
+
+        return self._settings
+    #
+
+    @property
+    def users(self):
+        """
+Returns the users registry connected to this instance.
+
+:return: (object) Users registry instance
+:since:  1.1.0
+        """
+
+        if (self._users is None): self._users = ItemRegistry()
+        return self._users
+    #
+
     async def connect(self):
         """
 Establishes a connection to homee.
@@ -255,7 +562,9 @@ Establishes a connection to homee.
 :since: 1.0.0
         """
 
-        self._client_session = ClientSession(raise_for_status = True,
+        self._client_session = ClientSession(connector = self._connector,
+                                             connector_owner = (self._connector is None),
+                                             raise_for_status = True,
                                              timeout = ClientTimeout(total = self.__class__.IO_TIMEOUT)
                                             )
 
@@ -265,10 +574,110 @@ Establishes a connection to homee.
         headers = { "Accept-Charset": "utf-8" }
         url = "{0}://{1}/connection?access_token={2}".format(protocol, self.location, token)
 
-        self._socket = await self._client_session.ws_connect(url,
-                                                             headers = headers,
-                                                             protocols = [ "v2" ]
-                                                            )
+        try:
+            socket = await self._client_session.ws_connect(url,
+                                                           headers = headers,
+                                                           protocols = [ "v2" ]
+                                                          )
+        except WSServerHandshakeError as handled_exception:
+            if (handled_exception.status == 401):
+                self._token = None
+                self._token_timeout = 0
+            #
+
+            raise
+        #
+
+        await self.connect_socket(socket)
+    #
+
+    async def connect_socket(self, socket):
+        """
+Starts receiving and handling messages from the given websocket. It is
+used for the homee websocket connection and for websocket compatible
+instances like the one replaying recorded traffic.
+
+:param socket: Websocket connected
+
+:since: 1.1.0
+        """
+
+        self._socket = socket
+
+        self._inbound_queue = InboundQueue(self._inbound_queue_size, self._inbound_queue_overflow_policy)
+
+        self._receiver_task = asyncio.ensure_future(self._receive_messages())
+        self._handler_task = asyncio.ensure_future(self._handle_messages())
+    #
+
+    def add_message_listener(self, callback):
+        """
+Adds a callback called with each message received from the homee websocket
+connection after it has been handled.
+
+:param callback: Callback receiving the message dictionary
+
+:since: 1.1.0
+        """
+
+        if (callback not in self._message_listeners): self._message_listeners.append(callback)
+    #
+
+    def add_registry_listener(self, callback, event_types = None):
+        """
+Adds a callback called with registry events. It is added to the current
+registry and to each one created after reconnecting.
+
+:param callback: Callback receiving the event instance
+:param event_types: Event types the callback is interested in; None for all
+
+:since: 1.1.0
+        """
+
+        self.remove_registry_listener(callback)
+        self._registry_listeners.append(( callback, event_types ))
+
+        if (self._registry is not None): self._registry.add_listener(callback, event_types)
+    #
+
+    def cancel_message_waiter(self, future):
+        """
+Removes and cancels the waiter for the given future.
+
+:param future: asyncio future created by "create_message_waiter()"
+
+:since: 1.1.0
+        """
+
+        for waiter in self._message_waiters:
+            if (waiter[2] is future):
+                self._message_waiters.remove(waiter)
+                break
+            #
+        #
+
+        future.cancel()
+    #
+
+    def create_message_waiter(self, key = None, predicate = None):
+        """
+Returns a future resolved with the next message received containing the
+given key and matching the given predicate. Each message resolves the oldest
+matching waiter for a key while waiters without a key are resolved with
+every message received.
+
+:param key: Message type key expected; None for any message
+:param predicate: Callable receiving the message dictionary returning true
+                  if it is the one expected
+
+:return: (object) asyncio future
+:since:  1.1.0
+        """
+
+        _return = asyncio.get_event_loop().create_future()
+        self._message_waiters.append(( key, predicate, _return ))
+
+        return _return
     #
 
     async def disconnect(self):
@@ -278,13 +687,84 @@ Disconnects from homee.
 :since: 1.0.0
         """
 
-        self._registry = None
+        if (self._socket is not None): await self._socket.close()
+
+        if (self._receiver_task is not None):
+            tasks = [ self._receiver_task, self._handler_task ]
+            ( _, pending_tasks ) = await asyncio.wait(tasks, timeout = self.__class__.IO_TIMEOUT)
+
+            if (len(pending_tasks) > 0):
+                for task in pending_tasks: task.cancel()
+                await asyncio.wait(pending_tasks)
+            #
+
+            self._handler_task = None
+            self._inbound_queue = None
+            self._receiver_task = None
+        #
 
-        await self._socket.close()
         self._socket = None
 
-        await self._client_session.close()
-        self._client_session = None
+        # Registries are reset after the handler task has finished as it uses them for messages still queued
+        if (self._registry is not None): self._registry.close()
+
+        self._groups = None
+        self._homeegrams = None
+        self._plans = None
+        self._registry = None
+        self._relationships = None
+        self._settings = None
+        self._token = None
+        self._token_timeout = 0
+        self._users = None
+
+        if (self._client_session is not None):
+            await self._client_session.close()
+            self._client_session = None
+        #
+    #
+
+    async def _dispatch_message(self, message, exception = None):
+        """
+Handles a message received and passes it to listeners and waiters.
+
+:param message: Message dictionary
+:param exception: Exception raised while receiving the message
+
+:since: 1.1.0
+        """
+
+        if (exception is None):
+            try: await self._handle_message(message)
+            except Exception as handled_exception: exception = handled_exception
+        #
+
+        if (exception is None):
+            for callback in self._message_listeners[:]:
+                try: callback(message)
+                except Exception: _LOG.exception("Message listener {0!r} failed".format(callback))
+            #
+        #
+
+        is_keyed_waiter_resolved = False
+
+        for waiter in self._message_waiters[:]:
+            ( key, predicate, future ) = waiter
+
+            if (future.done()): continue
+
+            if (key is not None
+                and (is_keyed_waiter_resolved or type(message) is not dict or key not in message)
+               ): continue
+
+            if (predicate is not None and (not predicate(message))): continue
+
+            if (key is not None): is_keyed_waiter_resolved = True
+            self._message_waiters.remove(waiter)
+
+            if (exception is None): future.set_result(message)
+            else: future.set_exception(exception)
+        #
     #
 
     async def _handle_message(self, message):
@@ -304,41 +784,154 @@ Handles a message received from the homee websocket connection.
                                                 message['attribute']
                                                )
         elif ("attribute_history" in message and type(message['attribute_history']) is dict):
+            # History responses are only passed to the waiters of the corresponding request
             pass
         elif ("all" in message and type(message['all']) is dict):
             for type_key in message['all']:
                 await self._handle_message(dict([ ( type_key, message['all'][type_key] ) ]))
             #
+        elif ("group" in message and type(message['group']) is dict):
+            self.groups.set(message['group'])
         elif ("groups" in message and type(message['groups']) is list):
-            pass
+            self.groups.set_all(message['groups'])
+        elif ("homeegram" in message and type(message['homeegram']) is dict):
+            self.homeegrams.set(message['homeegram'])
         elif ("homeegram_history" in message and type(message['homeegram_history']) is dict):
             pass
         elif ("homeegrams" in message and type(message['homeegrams']) is list):
-            pass
+            self.homeegrams.set_all(message['homeegrams'])
         elif ("node" in message and type(message['node']) is dict):
             self.registry.add_or_update_node(Node.from_dict(message['node'], self))
         elif ("node_history" in message and type(message['node_history']) is dict):
             pass
         elif ("nodes" in message and type(message['nodes']) is list):
-            for node in message['nodes']:
+            for ( position, node ) in enumerate(message['nodes'], 1):
                 await self._handle_message(dict([ ( "node", node ) ]))
+                if (position % self.__class__.HANDLE_NODES_BATCH_SIZE == 0): await asyncio.sleep(0)
             #
+        elif ("plan" in message and type(message['plan']) is dict):
+            self.plans.set(message['plan'])
         elif ("plans" in message and type(message['plans']) is list):
-            pass
+            self.plans.set_all(message['plans'])
+        elif ("relationship" in message and type(message['relationship']) is dict):
+            self.relationships.set(message['relationship'])
         elif ("relationships" in message and type(message['relationships']) is list):
-            pass
+            self.relationships.set_all(message['relationships'])
         elif ("settings" in message and type(message['settings']) is dict):
-            pass
+            self._settings = Item(message['settings'])
+        elif ("user" in message and type(message['user']) is dict):
+            self.users.set(message['user'])
         elif ("users" in message and type(message['users']) is list):
-            pass
+            self.users.set_all(message['users'])
         else: raise RuntimeError("Unsupported format detected in API message stream: {0}".format(message))
     #
 
+    async def _handle_messages(self):
+        """
+Handles all messages received in the order queued until the connection has
+been closed.
+
+:since: 1.1.0
+        """
+
+        exception = None
+        handled_count = 0
+
+        try:
+            while True:
+                message = await self._inbound_queue.get()
+                handled_count += 1
+
+                if (isinstance(message, Exception)):
+                    exception = message
+                    break
+                #
+
+                await self._dispatch_message(message)
+
+                # Give other tasks a chance to run while handling a burst of messages
+                if (handled_count % self.__class__.HANDLE_MESSAGES_BATCH_SIZE == 0): await asyncio.sleep(0)
+            #
+        finally:
+            if (exception is None): exception = ConnectionResetError("Connection has been closed")
+
+            for ( key, predicate, future ) in self._message_waiters:
+                if (not future.done()): future.set_exception(exception)
+            #
+
+            self._message_waiters = [ ]
+        #
+    #
+
+    async def _queue_streamed_nodes(self, data):
+        """
+Decodes the nodes of the given frame one at a time and queues each as a
+"node" message as soon as it is complete.
+
+:param data: JSON frame received
+
+:return: (dict) Message decoded without the nodes queued
+:since:  1.1.0
+        """
+
+        decoder = NodeStreamDecoder(data)
+
+        for ( position, node_data ) in enumerate(decoder, 1):
+            FrameParser.normalize_node(node_data)
+            await self._inbound_queue.put({ "node": node_data })
+
+            if (position % self.__class__.HANDLE_NODES_BATCH_SIZE == 0): await asyncio.sleep(0)
+        #
+
+        return decoder.message
+    #
+
+    async def _receive_messages(self):
+        """
+Reads all messages from the homee websocket connection and queues them to
+be handled. This task is the only one receiving from the websocket.
+
+:since: 1.1.0
+        """
+
+        exception = ConnectionResetError("Connection has been closed")
+
+        try:
+            while True:
+                message = await self._socket.receive()
+
+                if (message.type in ( WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.CLOSING )): break
+                elif (message.type == WSMsgType.ERROR):
+                    exception = RuntimeError(message.data)
+                    break
+                elif (message.type == WSMsgType.TEXT):
+                    if (self._recorder is not None): self._recorder.record_inbound(message.data)
+
+                    is_large_frame = (len(message.data) > self._large_frame_threshold)
+
+                    try:
+                        if (is_large_frame and self._large_frame_executor is not None):
+                            data = await asyncio.get_event_loop().run_in_executor(self._large_frame_executor,
+                                                                                  FrameParser.parse,
+                                                                                  message.data
+                                                                                 )
+                        elif (is_large_frame and self._stream_large_frames): data = await self._queue_streamed_nodes(message.data)
+                        else: data = parseJson(message.data)
+                    except ValueError as handled_exception: await self._dispatch_message(None, handled_exception)
+                    else: await self._inbound_queue.put(data)
+                #
+            #
+        except Exception as handled_exception: exception = handled_exception
+        finally: self._inbound_queue.put_final(exception)
+    #
+
     async def receive_and_handle_messages(self, timeout = None):
         """
-Handles all pending messages from the homee websocket connection.
+Waits for pending messages from the homee websocket connection to be
+handled.
 
-:param is_response_expected: True if an API response is expected
+:param timeout: Time in seconds to wait at least; 0 to wait until the
+                connection is closed
 
 :since: 1.0.0
         """
@@ -347,7 +940,7 @@ Handles all pending messages from the homee websocket connection.
             timeout_remaining = (0 if (timeout is None) else timeout)
 
             while True:
-                if (timeout == 0): message = await self._socket.receive()
+                if (timeout == 0): await self.wait_for_message()
                 else:
                     time_started = time()
 
@@ -356,16 +949,40 @@ Handles all pending messages from the homee websocket connection.
                                        self.__class__.API_MESSAGE_TIMEOUT
                                       )
 
-                    message = await self._socket.receive(timeout = receive_timeout)
+                    await self.wait_for_message(timeout = receive_timeout)
 
                     if (timeout_remaining > 0): timeout_remaining -= time() - time_started
                 #
-
-                if message.type == WSMsgType.CLOSED: break
-                elif message.type == WSMsgType.ERROR: raise RuntimeError(message.data)
-                elif message.type == WSMsgType.TEXT: await self._handle_message(parseJson(message.data))
             #
-        except FutureTimeoutError: pass
+        except ( asyncio.TimeoutError, ConnectionResetError, FutureTimeoutError ): pass
+    #
+
+    def remove_message_listener(self, callback):
+        """
+Removes a callback previously added.
+
+:param callback: Callback receiving the message dictionary
+
+:since: 1.1.0
+        """
+
+        if (callback in self._message_listeners): self._message_listeners.remove(callback)
+    #
+
+    def remove_registry_listener(self, callback):
+        """
+Removes a registry event callback previously added.
+
+:param callback: Callback receiving the event instance
+
+:since: 1.1.0
+        """
+
+        for listener in self._registry_listeners[:]:
+            if (listener[0] == callback): self._registry_listeners.remove(listener)
+        #
+
+        if (self._registry is not None): self._registry.remove_listener(callback)
     #
 
     async def send(self, request):
@@ -378,5 +995,29 @@ Sends the given request to the homee API.
         """
 
         await self._socket.send_str(request)
+        if (self._recorder is not None): self._recorder.record_outbound(request)
+    #
+
+    async def wait_for_message(self, key = None, predicate = None, timeout = None, future = None):
+        """
+Waits for the next message received containing the given key and matching
+the given predicate.
+
+:param key: Message type key expected; None for any message
+:param predicate: Callable receiving the message dictionary returning true
+                  if it is the one expected
+:param timeout: Time in seconds to wait; None to wait without timeout
+:param future: Future created by "create_message_waiter()" to wait for
+
+:return: (dict) Message dictionary
+:since:  1.1.0
+        """
+
+        if (future is None): future = self.create_message_waiter(key, predicate)
+
+        try: return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if (not future.done()): self.cancel_message_waiter(future)
+        #
     #
 #
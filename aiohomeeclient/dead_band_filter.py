@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from numbers import Number
+
+from .attribute import ATTRIBUTES
+
+DEAD_BAND_ABSOLUTE = 0
+"""
+Dead-band threshold given in the unit of the attribute value
+"""
+DEAD_BAND_SCALE = 1
+"""
+Dead-band threshold given as a factor of the attribute value range
+"""
+DEAD_BAND_STEP = 2
+"""
+Dead-band threshold given as a multiple of the attribute step value
+"""
+
+class DeadBandFilter(object):
+    """
+The "DeadBandFilter" class suppresses change notifications of numeric
+attribute values as long as they stay within a band around the value last
+notified.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(DeadBandFilter)
+
+:since: 1.1.0
+        """
+
+        self._bands = { }
+        """
+Dead-band threshold and mode per attribute type ID
+        """
+        self._notified_values = { }
+        """
+Value last notified per attribute type ID, node and attribute ID
+        """
+    #
+
+    def _get_band(self, attribute):
+        """
+Returns the dead-band width for the given attribute.
+
+:param attribute: Attribute instance
+
+:return: (float) Dead-band width; 0 if not applicable
+:since:  1.1.0
+        """
+
+        ( threshold, mode ) = self._bands[attribute['type']]
+        _return = 0
+
+        if (mode == DEAD_BAND_ABSOLUTE): _return = threshold
+        elif (mode == DEAD_BAND_STEP):
+            if (isinstance(attribute.step_value, Number)): _return = threshold * attribute.step_value
+        elif (isinstance(attribute.min, Number) and isinstance(attribute.max, Number)):
+            _return = threshold * (attribute.max - attribute.min)
+        #
+
+        return abs(_return)
+    #
+
+    def get_dead_band(self, attribute_type):
+        """
+Returns the dead-band threshold and mode for the given attribute type.
+
+:param attribute_type: Attribute type name
+
+:return: (tuple) Dead-band threshold and mode; None if not defined
+:since:  1.1.0
+        """
+
+        return self._bands.get(ATTRIBUTES[attribute_type])
+    #
+
+    def get_notified_value(self, node_id, attribute, previous_value):
+        """
+Returns the value last notified for the given attribute. Changes filtered
+are not reflected in it.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance
+:param previous_value: Attribute value before the change used if no value
+                       has been notified yet
+
+:return: (mixed) Attribute value last notified
+:since:  1.1.0
+        """
+
+        notified_values = self._notified_values.get(attribute['type'])
+        return (previous_value if (notified_values is None) else notified_values.get(( node_id, attribute.id ), previous_value))
+    #
+
+    def is_change_notified(self, node_id, attribute, previous_value):
+        """
+Returns true if a change of the given attribute should be notified.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance changed
+:param previous_value: Attribute value before the change
+
+:return: (bool) True if the change should be notified
+:since:  1.1.0
+        """
+
+        _return = True
+
+        if (attribute['type'] in self._bands):
+            reference_value = self.get_notified_value(node_id, attribute, previous_value)
+            notified_values = self._notified_values.setdefault(attribute['type'], { })
+
+            value = attribute.value
+            key = ( node_id, attribute.id )
+
+            if (self._is_numeric(value) and self._is_numeric(reference_value)):
+                _return = (abs(value - reference_value) >= self._get_band(attribute))
+            #
+
+            notified_values[key] = (value if (_return) else reference_value)
+        #
+
+        return _return
+    #
+
+    def _is_numeric(self, value):
+        """
+Returns true if the given value is a number.
+
+:param value: Value
+
+:return: (bool) True if numeric
+:since:  1.1.0
+        """
+
+        return (isinstance(value, Number) and (not isinstance(value, bool)))
+    #
+
+    def set_dead_band(self, attribute_type, threshold, mode = DEAD_BAND_ABSOLUTE):
+        """
+Sets the dead-band threshold for the given attribute type.
+
+:param attribute_type: Attribute type name
+:param threshold: Dead-band threshold; 0 to disable the filter
+:param mode: Dead-band threshold mode
+
+:since: 1.1.0
+        """
+
+        if (mode not in ( DEAD_BAND_ABSOLUTE, DEAD_BAND_SCALE, DEAD_BAND_STEP )):
+            raise ValueError("Dead-band mode '{0!r}' given is invalid".format(mode))
+        #
+
+        type_id = ATTRIBUTES[attribute_type]
+
+        if (threshold > 0): self._bands[type_id] = ( threshold, mode )
+        elif (type_id in self._bands): del self._bands[type_id]
+
+        self._notified_values.pop(type_id, None)
+    #
+#
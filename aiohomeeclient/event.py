@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import time
+
+EVENT_ATTRIBUTE_CHANGED = "attribute_changed"
+"""
+Event type of a changed attribute value
+"""
+EVENT_BATTERY_LOW = "battery_low"
+"""
+Event type of a node battery level dropping below the threshold
+"""
+EVENT_BATTERY_RECOVERED = "battery_recovered"
+"""
+Event type of a node battery level rising to or above the threshold again
+"""
+EVENT_NODE_ACTIVE = "node_active"
+"""
+Event type of a node reported again after it has been stale
+"""
+EVENT_NODE_STALE = "node_stale"
+"""
+Event type of a node silent for more than the staleness time
+"""
+EVENT_SITE_CONNECTED = "site_connected"
+"""
+Event type of a managed homee site (re)connected
+"""
+EVENT_SITE_DISCONNECTED = "site_disconnected"
+"""
+Event type of a managed homee site disconnected
+"""
+
+class Event(object):
+    """
+The "Event" class provides the data of a registry event passed to
+listeners.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, _type, **kwargs):
+        """
+Constructor __init__(Event)
+
+:param _type: Event type
+:param kwargs: Event data
+
+:since: 1.1.0
+        """
+
+        self._data = kwargs
+        """
+Event data
+        """
+        self._type = _type
+        """
+Event type
+        """
+
+        if ("timestamp" not in self._data): self._data['timestamp'] = time()
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places (i.e. it is not an instance attribute nor is it found in the
+class tree for self).
+
+:param name: Attribute name
+
+:return: (mixed) Event data value
+:since:  1.1.0
+        """
+
+        if (name.startswith("_") or name not in self._data): raise AttributeError(name)
+        return self._data[name]
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function and by string conversions
+(reverse quotes) to compute the "official" string representation of an
+object.
+
+:return: (str) String representation
+:since:  1.1.0
+        """
+
+        return "<Event {0} {1!r}>".format(self._type, self._data)
+    #
+
+    @property
+    def type(self):
+        """
+Returns the event type.
+
+:return: (str) Event type
+:since:  1.1.0
+        """
+
+        return self._type
+    #
+
+    def copy(self, **kwargs):
+        """
+Returns a copy of this event with the given event data updated.
+
+:param kwargs: Event data to update
+
+:return: (object) Event instance
+:since:  1.1.0
+        """
+
+        data = self._data.copy()
+        data.update(kwargs)
+
+        return self.__class__(self._type, **data)
+    #
+
+    def to_dict(self):
+        """
+Returns the event type and data as a dictionary.
+
+:return: (dict) Event dictionary
+:since:  1.1.0
+        """
+
+        _return = self._data.copy()
+        _return['type'] = self._type
+
+        return _return
+    #
+#
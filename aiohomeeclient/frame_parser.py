@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from json import loads as parseJson
+
+class FrameParser(object):
+    """
+The "FrameParser" class decodes websocket frames received from homee and
+normalizes node data so that nodes are built from it in one pass. Its
+methods are static to be run in executor threads or processes.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    @staticmethod
+    def _get_attribute_sort_key(attribute_dict):
+        """
+Returns the key to sort attribute dictionaries by type and instance.
+
+:param attribute_dict: Attribute dictionary
+
+:return: (tuple) Sort key
+:since:  1.1.0
+        """
+
+        return ( attribute_dict['type'], attribute_dict['instance'] )
+    #
+
+    @staticmethod
+    def normalize_node(node_data):
+        """
+Sets missing attribute instances and sorts the attributes of the given node
+data by type and instance in place.
+
+:param node_data: Node data provided by homee
+
+:since: 1.1.0
+        """
+
+        attributes = node_data.get("attributes")
+
+        if (type(attributes) is list):
+            for attribute in attributes:
+                if ("instance" not in attribute): attribute['instance'] = 0
+            #
+
+            attributes.sort(key = FrameParser._get_attribute_sort_key)
+        #
+    #
+
+    @staticmethod
+    def parse(data):
+        """
+Decodes the given JSON frame and normalizes all node data contained.
+
+:param data: JSON frame received
+
+:return: (mixed) Message decoded
+:since:  1.1.0
+        """
+
+        _return = parseJson(data)
+
+        if (type(_return) is dict):
+            nodes = _return.get("nodes")
+
+            if (type(_return.get("all")) is dict): nodes = _return['all'].get("nodes")
+            elif (type(_return.get("node")) is dict): nodes = [ _return['node'] ]
+
+            if (type(nodes) is list):
+                for node_data in nodes:
+                    if (type(node_data) is dict): FrameParser.normalize_node(node_data)
+                #
+            #
+        #
+
+        return _return
+    #
+#
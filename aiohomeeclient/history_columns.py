@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from array import array
+from numbers import Number
+
+try: from collections.abc import Mapping, Sequence
+except ImportError: from collections import Mapping, Sequence
+
+try: import numpy
+except ImportError: numpy = None
+
+HISTORY_VALUE_KEYS = ( "value", "current_value", "state" )
+"""
+Keys checked in order for the value of a history entry
+"""
+
+class HistoryColumns(object):
+    """
+The "HistoryColumns" class holds history data received from homee as
+columnar arrays of timestamps and values.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, node_id = None, attribute_id = None, homeegram_id = None):
+        """
+Constructor __init__(HistoryColumns)
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param homeegram_id: homee homeegram ID
+
+:since: 1.1.0
+        """
+
+        self.attribute_id = attribute_id
+        """
+homee attribute ID
+        """
+        self.homeegram_id = homeegram_id
+        """
+homee homeegram ID
+        """
+        self.node_id = node_id
+        """
+homee node ID
+        """
+        self.timestamps = array("d")
+        """
+UNIX timestamps of the history entries
+        """
+        self.values = array("d")
+        """
+Values of the history entries; NaN if not numeric
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of history entries
+:since:  1.1.0
+        """
+
+        return len(self.timestamps)
+    #
+
+    def append_entries(self, entries):
+        """
+Appends the given history entries received from homee.
+
+:param entries: List of history entry dictionaries or timestamp and value
+                pairs
+
+:since: 1.1.0
+        """
+
+        timestamps_append = self.timestamps.append
+        values_append = self.values.append
+        nan = float("nan")
+
+        for entry in entries:
+            if (isinstance(entry, Mapping)):
+                timestamp = entry.get("timestamp")
+                value = None
+
+                for key in HISTORY_VALUE_KEYS:
+                    if (key in entry):
+                        value = entry[key]
+                        break
+                    #
+                #
+            elif (isinstance(entry, Sequence) and len(entry) > 1): ( timestamp, value ) = entry[:2]
+            else: continue
+
+            if (not isinstance(timestamp, Number)): continue
+
+            timestamps_append(timestamp)
+            values_append(value if (isinstance(value, Number)) else nan)
+        #
+    #
+
+    def as_numpy(self):
+        """
+Returns NumPy arrays sharing the memory of the timestamps and values
+arrays.
+
+:return: (tuple) Timestamps and values NumPy arrays
+:since:  1.1.0
+        """
+
+        if (numpy is None): raise RuntimeError("NumPy is not available")
+
+        return ( numpy.frombuffer(self.timestamps, dtype = numpy.float64),
+                 numpy.frombuffer(self.values, dtype = numpy.float64)
+               )
+    #
+
+    def extend(self, history_columns):
+        """
+Appends the history entries of the given instance.
+
+:param history_columns: HistoryColumns instance
+
+:since: 1.1.0
+        """
+
+        self.timestamps.extend(history_columns.timestamps)
+        self.values.extend(history_columns.values)
+    #
+
+    def truncate(self, size):
+        """
+Removes all history entries after the given number of entries.
+
+:param size: Number of history entries to keep
+
+:since: 1.1.0
+        """
+
+        del self.timestamps[size:]
+        del self.values[size:]
+    #
+
+    @staticmethod
+    def from_dict(history_data):
+        """
+Returns a new "HistoryColumns" instance for the history data given.
+
+:param history_data: History data provided by homee
+
+:return: (object) HistoryColumns instance
+:since:  1.1.0
+        """
+
+        _return = HistoryColumns(history_data.get("node_id"),
+                                 history_data.get("attribute_id"),
+                                 history_data.get("homeegram_id")
+                                )
+
+        entries = history_data.get("history")
+        if (isinstance(entries, Sequence)): _return.append_entries(entries)
+
+        return _return
+    #
+#
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from functools import partial
+from heapq import merge
+from logging import getLogger
+import asyncio
+
+from aiohttp import TCPConnector
+
+from . import Homee
+from .event import EVENT_SITE_CONNECTED, EVENT_SITE_DISCONNECTED, Event
+
+_LOG = getLogger(__name__)
+"""
+Logger instance
+"""
+
+class HomeeManager(object):
+    """
+The "HomeeManager" class runs connections to many homee sites on one event
+loop. All connections share one aiohttp connector, events of all sites are
+passed to listeners tagged with the site and lost connections are
+re-established with an exponential backoff.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    RECONNECT_DELAY_MAX = 60
+    """
+Maximum time in seconds to wait before reconnecting a site.
+    """
+    RECONNECT_DELAY_MIN = 1
+    """
+Time in seconds to wait before reconnecting a site the first time.
+    """
+
+    def __init__(self, connector = None):
+        """
+Constructor __init__(HomeeManager)
+
+:param connector: aiohttp connector to share; None to create one
+
+:since: 1.1.0
+        """
+
+        self._connector = connector
+        """
+aiohttp connector shared by all connections
+        """
+        self._homees = { }
+        """
+Homee instances per site
+        """
+        self._is_connector_owned = (connector is None)
+        """
+True if the connector has been created by this manager
+        """
+        self._is_running = False
+        """
+True if sites are connected and supervised
+        """
+        self._listeners = [ ]
+        """
+Event listeners and event types they are interested in
+        """
+        self._site_tasks = { }
+        """
+Tasks keeping the connection of each site alive
+        """
+    #
+
+    async def __aenter__(self):
+        """
+Enter the runtime context related to this object. It must return an
+awaitable.
+
+:return: (object) Manager instance
+:since:  1.1.0
+        """
+
+        await self.start()
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+Exit the runtime context related to this object. It must return an
+awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        await self.stop()
+        return False
+    #
+
+    @property
+    def sites(self):
+        """
+Returns the names of all sites managed.
+
+:return: (list) Site names
+:since:  1.1.0
+        """
+
+        return list(self._homees)
+    #
+
+    def add_listener(self, callback, event_types = None):
+        """
+Adds a callback called with events of all sites. Each event carries the
+name of its site as "site".
+
+:param callback: Callback receiving the event instance
+:param event_types: Event types the callback is interested in; None for all
+
+:since: 1.1.0
+        """
+
+        self.remove_listener(callback)
+        self._listeners.append(( callback, (None if (event_types is None) else frozenset(event_types)) ))
+    #
+
+    def add_site(self, site, address, username, password, **kwargs):
+        """
+Adds a homee site. It is connected immediately if the manager is running.
+
+:param site: Unique site name
+:param address: homee address to connect to
+:param username: homee user name
+:param password: homee user password
+:param kwargs: Additional keyword arguments for the homee connection
+
+:return: (object) Homee instance
+:since:  1.1.0
+        """
+
+        if (site in self._homees): raise ValueError("Site '{0}' given is already managed".format(site))
+
+        _return = Homee(address, username, password, connector = self._connector, **kwargs)
+        _return.add_registry_listener(partial(self._on_site_event, site))
+
+        self._homees[site] = _return
+
+        if (self._is_running): self._start_site(site)
+
+        return _return
+    #
+
+    def _emit(self, event):
+        """
+Passes the given event to all listeners interested in its type.
+
+:param event: Event instance
+
+:since: 1.1.0
+        """
+
+        for ( callback, event_types ) in self._listeners[:]:
+            if (event_types is None or event.type in event_types):
+                try: callback(event)
+                except Exception: _LOG.exception("Event listener {0!r} failed".format(callback))
+            #
+        #
+    #
+
+    def _get_connected_homees(self):
+        """
+Returns the site names and Homee instances of all sites connected.
+
+:return: (list) Site name and Homee instance tuples
+:since:  1.1.0
+        """
+
+        return [ ( site, homee ) for ( site, homee ) in self._homees.items() if (homee.is_connected) ]
+    #
+
+    def get_attribute_type_aggregate(self, attribute_type):
+        """
+Returns the aggregate of all attributes of the given type across all sites
+connected.
+
+:param attribute_type: Attribute type name
+
+:return: (dict) Count, sum, minimum, maximum and mean values
+:since:  1.1.0
+        """
+
+        _return = { "count": 0, "sum": 0, "min": None, "max": None, "mean": None }
+
+        for ( site, homee ) in self._get_connected_homees():
+            aggregate = homee.registry.get_attribute_type_aggregate(attribute_type)
+            if (aggregate is None or aggregate.count < 1): continue
+
+            _return['count'] += aggregate.count
+            _return['sum'] += aggregate.sum
+
+            if (_return['min'] is None or aggregate.min < _return['min']): _return['min'] = aggregate.min
+            if (_return['max'] is None or aggregate.max > _return['max']): _return['max'] = aggregate.max
+        #
+
+        if (_return['count'] > 0): _return['mean'] = _return['sum'] / _return['count']
+
+        return _return
+    #
+
+    def get_attribute_values(self, keys, default = None):
+        """
+Returns the values of the given node attributes. Keys are tuples of the
+site name, the node ID, the attribute type name and optionally the
+attribute instance. Values of each site are read under one lock.
+
+:param keys: List of site name, node ID, attribute type name and instance
+             tuples
+:param default: Default value if a site, node or attribute is not available
+
+:return: (list) Attribute values in the order of the keys given
+:since:  1.1.0
+        """
+
+        _return = [ default ] * len(keys)
+        site_keys = { }
+
+        for ( position, key ) in enumerate(keys):
+            site_keys.setdefault(key[0], [ ]).append(( position, key[1:] ))
+        #
+
+        for ( site, homee ) in self._get_connected_homees():
+            if (site not in site_keys): continue
+
+            positions = [ position for ( position, key ) in site_keys[site] ]
+            values = homee.registry.get_attribute_values([ key for ( position, key ) in site_keys[site] ], default)
+
+            for ( position, value ) in zip(positions, values): _return[position] = value
+        #
+
+        return _return
+    #
+
+    def get_battery_levels_below(self, threshold = None):
+        """
+Returns the nodes with battery levels below the given threshold across all
+sites connected sorted ascending.
+
+:param threshold: Battery level threshold; None for the configured ones
+
+:return: (list) Site name, node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        return list(merge(*[ [ ( site, node_id, level ) for ( node_id, level ) in homee.registry.get_battery_levels_below(threshold) ]
+                             for ( site, homee ) in self._get_connected_homees()
+                           ],
+                          key = HomeeManager._get_last_item
+                         ))
+    #
+
+    def get_homee(self, site):
+        """
+Returns the Homee instance of the given site.
+
+:param site: Site name
+
+:return: (object) Homee instance; None if not managed
+:since:  1.1.0
+        """
+
+        return self._homees.get(site)
+    #
+
+    def get_lowest_battery_levels(self, count):
+        """
+Returns the given number of nodes with the lowest battery levels across all
+sites connected sorted ascending.
+
+:param count: Number of nodes
+
+:return: (list) Site name, node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        _return = merge(*[ [ ( site, node_id, level ) for ( node_id, level ) in homee.registry.get_lowest_battery_levels(count) ]
+                           for ( site, homee ) in self._get_connected_homees()
+                         ],
+                        key = HomeeManager._get_last_item
+                       )
+
+        return [ entry for ( entry, _ ) in zip(_return, range(count)) ]
+    #
+
+    def get_nodes(self):
+        """
+Returns all nodes of all sites connected.
+
+:return: (list) Site name and Node instance tuples
+:since:  1.1.0
+        """
+
+        _return = [ ]
+
+        for ( site, homee ) in self._get_connected_homees():
+            _return += [ ( site, node ) for node in homee.registry.get_nodes() ]
+        #
+
+        return _return
+    #
+
+    def get_silent_nodes(self, max_age):
+        """
+Returns the nodes silent for more than the given time across all sites
+connected ordered by silence descending.
+
+:param max_age: Time in seconds
+
+:return: (list) Site name, node ID and monotonic clock time tuples
+:since:  1.1.0
+        """
+
+        return list(merge(*[ [ ( site, node_id, last_update ) for ( node_id, last_update ) in homee.registry.get_silent_nodes(max_age) ]
+                             for ( site, homee ) in self._get_connected_homees()
+                           ],
+                          key = HomeeManager._get_last_item
+                         ))
+    #
+
+    def is_site_connected(self, site):
+        """
+Returns true if the given site is connected.
+
+:param site: Site name
+
+:return: (bool) True if connected
+:since:  1.1.0
+        """
+
+        homee = self._homees.get(site)
+        return (homee is not None and homee.is_connected)
+    #
+
+    def _on_site_event(self, site, event):
+        """
+Passes the given registry event of a site to all listeners.
+
+:param site: Site name
+:param event: Event instance
+
+:since: 1.1.0
+        """
+
+        self._emit(event.copy(site = site))
+    #
+
+    def remove_listener(self, callback):
+        """
+Removes a callback previously added.
+
+:param callback: Callback receiving the event instance
+
+:since: 1.1.0
+        """
+
+        for listener in self._listeners[:]:
+            if (listener[0] == callback): self._listeners.remove(listener)
+        #
+    #
+
+    async def remove_site(self, site):
+        """
+Disconnects and removes a homee site.
+
+:param site: Site name
+
+:since: 1.1.0
+        """
+
+        homee = self._homees.pop(site, None)
+        task = self._site_tasks.pop(site, None)
+
+        if (task is not None):
+            task.cancel()
+            await asyncio.wait([ task ])
+        #
+
+        if (homee is not None): await homee.disconnect()
+    #
+
+    async def _run_site(self, site):
+        """
+Keeps the connection of the given site alive until cancelled.
+
+:param site: Site name
+
+:since: 1.1.0
+        """
+
+        homee = self._homees[site]
+        delay = self.__class__.RECONNECT_DELAY_MIN
+
+        while True:
+            try:
+                # The shared connector is created lazily as it requires a running event loop
+                if (self._connector is None): self._connector = TCPConnector()
+                homee.connector = self._connector
+
+                await homee.connect()
+
+                delay = self.__class__.RECONNECT_DELAY_MIN
+                self._emit(Event(EVENT_SITE_CONNECTED, site = site))
+
+                await homee.wait_for_disconnect()
+            except asyncio.CancelledError: raise
+            except Exception as handled_exception: self._emit(Event(EVENT_SITE_DISCONNECTED, site = site, exception = handled_exception))
+            else: self._emit(Event(EVENT_SITE_DISCONNECTED, site = site, exception = None))
+
+            try: await homee.disconnect()
+            except Exception: pass
+
+            await asyncio.sleep(delay)
+            delay = min(2 * delay, self.__class__.RECONNECT_DELAY_MAX)
+        #
+    #
+
+    async def start(self):
+        """
+Connects all sites and keeps their connections alive.
+
+:since: 1.1.0
+        """
+
+        if (not self._is_running):
+            self._is_running = True
+            for site in self._homees: self._start_site(site)
+        #
+    #
+
+    def _start_site(self, site):
+        """
+Starts the task keeping the connection of the given site alive.
+
+:param site: Site name
+
+:since: 1.1.0
+        """
+
+        self._site_tasks[site] = asyncio.ensure_future(self._run_site(site))
+    #
+
+    async def stop(self):
+        """
+Disconnects all sites and closes the connector if owned.
+
+:since: 1.1.0
+        """
+
+        self._is_running = False
+
+        tasks = list(self._site_tasks.values())
+        self._site_tasks = { }
+
+        for task in tasks: task.cancel()
+        if (len(tasks) > 0): await asyncio.wait(tasks)
+
+        for homee in self._homees.values(): await homee.disconnect()
+
+        if (self._is_connector_owned and self._connector is not None):
+            await self._connector.close()
+            self._connector = None
+        #
+    #
+
+    @staticmethod
+    def _get_last_item(entry):
+        """
+Returns the last item of the given tuple used as the sort key.
+
+:param entry: Tuple
+
+:return: (mixed) Last item
+:since:  1.1.0
+        """
+
+        return entry[-1]
+    #
+#
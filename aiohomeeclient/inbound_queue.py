@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import deque
+import asyncio
+
+OVERFLOW_BLOCK = 0
+"""
+Wait for free space if the queue is full
+"""
+OVERFLOW_DROP_OLDEST = 1
+"""
+Drop the oldest pending attribute update of the same attribute (or the
+oldest pending one of any attribute) if the queue is full
+"""
+OVERFLOW_COALESCE = 2
+"""
+Replace a pending attribute update with the latest value of the same
+attribute unless other messages have been queued in between
+"""
+_REMOVED = object()
+"""
+Marker replacing the message of an entry dropped or returned already as
+messages may be None
+"""
+
+class InboundQueue(object):
+    """
+The "InboundQueue" class provides a bounded queue for messages received
+from homee before they are handled.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, maxsize = 1000, overflow_policy = OVERFLOW_BLOCK):
+        """
+Constructor __init__(InboundQueue)
+
+:param maxsize: Maximum number of pending messages
+:param overflow_policy: Policy applied if the queue is full
+
+:since: 1.1.0
+        """
+
+        if (overflow_policy not in ( OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE )):
+            raise ValueError("Overflow policy '{0!r}' given is invalid".format(overflow_policy))
+        #
+
+        self._attribute_entries = deque()
+        """
+Pending attribute update entries in order received
+        """
+        self._barrier_sequence = 0
+        """
+Sequence number of the latest message queued not being an attribute update
+        """
+        self.coalesced_count = 0
+        """
+Number of attribute updates replaced by a newer value
+        """
+        self.dropped_count = 0
+        """
+Number of attribute updates dropped
+        """
+        self._entries = deque()
+        """
+Pending entries in order received
+        """
+        self._keyed_entries = { }
+        """
+Pending attribute update entries per attribute
+        """
+        self.max_depth = 0
+        """
+Maximum number of pending messages seen
+        """
+        self.maxsize = maxsize
+        """
+Maximum number of pending messages
+        """
+        self._not_empty = asyncio.Event()
+        """
+Event set if messages are pending
+        """
+        self._not_full = asyncio.Event()
+        """
+Event set if the queue is not full
+        """
+        self.overflow_policy = overflow_policy
+        """
+Policy applied if the queue is full
+        """
+        self.put_count = 0
+        """
+Number of messages put into the queue
+        """
+        self._sequence = 0
+        """
+Sequence number of the latest message queued
+        """
+        self.blocked_count = 0
+        """
+Number of times a message had to wait for free space
+        """
+        self._size = 0
+        """
+Number of pending messages
+        """
+
+        self._not_full.set()
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of pending messages
+:since:  1.1.0
+        """
+
+        return self._size
+    #
+
+    @property
+    def depth(self):
+        """
+Returns the number of pending messages.
+
+:return: (int) Number of pending messages
+:since:  1.1.0
+        """
+
+        return self._size
+    #
+
+    @property
+    def metrics(self):
+        """
+Returns the queue metrics.
+
+:return: (dict) Queue metrics
+:since:  1.1.0
+        """
+
+        return { "depth": self._size,
+                 "max_depth": self.max_depth,
+                 "maxsize": self.maxsize,
+                 "put_count": self.put_count,
+                 "blocked_count": self.blocked_count,
+                 "dropped_count": self.dropped_count,
+                 "coalesced_count": self.coalesced_count
+               }
+    #
+
+    def _drop_oldest_attribute_entry(self, key):
+        """
+Drops the oldest pending attribute update for the given attribute or the
+oldest pending one of any attribute.
+
+:param key: Attribute key of the message to be queued
+
+:return: (bool) True if an entry has been dropped
+:since:  1.1.0
+        """
+
+        entry = None
+
+        if (key in self._keyed_entries): entry = self._keyed_entries[key][0]
+        else:
+            while (len(self._attribute_entries) > 0 and entry is None):
+                entry = self._attribute_entries.popleft()
+                if (entry[1] is _REMOVED): entry = None
+            #
+        #
+
+        if (entry is not None):
+            self._remove_keyed_entry(entry)
+
+            entry[1] = _REMOVED
+            self._size -= 1
+
+            self.dropped_count += 1
+        #
+
+        return (entry is not None)
+    #
+
+    async def get(self):
+        """
+Returns the oldest pending message and waits for one if none is pending.
+
+:return: (mixed) Message
+:since:  1.1.0
+        """
+
+        while (self._size < 1):
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        #
+
+        entry = self._entries.popleft()
+        while (entry[1] is _REMOVED): entry = self._entries.popleft()
+
+        _return = entry[1]
+        entry[1] = _REMOVED
+
+        if (entry[0] is not None):
+            self._remove_keyed_entry(entry)
+
+            while (len(self._attribute_entries) > 0 and self._attribute_entries[0][1] is _REMOVED):
+                self._attribute_entries.popleft()
+            #
+        #
+
+        self._size -= 1
+        self._not_full.set()
+
+        return _return
+    #
+
+    def _get_key(self, message):
+        """
+Returns the attribute key for the given message if it is an attribute
+update.
+
+:param message: Message
+
+:return: (tuple) Attribute key; None if not applicable
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (type(message) is dict and len(message) == 1 and type(message.get("attribute")) is dict):
+            _return = ( message['attribute'].get("node_id"), message['attribute'].get("id") )
+        #
+
+        return _return
+    #
+
+    async def put(self, message):
+        """
+Adds a message to the queue and applies the overflow policy if the queue
+is full.
+
+:param message: Message
+
+:since: 1.1.0
+        """
+
+        key = self._get_key(message)
+        self.put_count += 1
+
+        if (key is not None
+            and self.overflow_policy == OVERFLOW_COALESCE
+            and key in self._keyed_entries
+            and self._keyed_entries[key][-1][2] > self._barrier_sequence
+           ):
+            self._keyed_entries[key][-1][1] = message
+            self.coalesced_count += 1
+        else:
+            is_blocked = False
+
+            while (self._size >= self.maxsize):
+                if (self.overflow_policy == OVERFLOW_DROP_OLDEST and self._drop_oldest_attribute_entry(key)): break
+
+                if (not is_blocked):
+                    is_blocked = True
+                    self.blocked_count += 1
+                #
+
+                self._not_full.clear()
+                await self._not_full.wait()
+            #
+
+            self._sequence += 1
+
+            entry = [ key, message, self._sequence ]
+            self._entries.append(entry)
+
+            if (key is None): self._barrier_sequence = self._sequence
+            else:
+                if (self.overflow_policy == OVERFLOW_DROP_OLDEST): self._attribute_entries.append(entry)
+
+                if (key not in self._keyed_entries): self._keyed_entries[key] = deque()
+                self._keyed_entries[key].append(entry)
+            #
+
+            self._size += 1
+            if (self._size > self.max_depth): self.max_depth = self._size
+
+            self._not_empty.set()
+        #
+    #
+
+    def put_final(self, message):
+        """
+Adds the given message without applying the size limit and overflow
+policy. It is used for the final message ending the consumer which must
+never block.
+
+:param message: Message
+
+:since: 1.1.0
+        """
+
+        self.put_count += 1
+        self._sequence += 1
+
+        self._entries.append([ None, message, self._sequence ])
+        self._barrier_sequence = self._sequence
+
+        self._size += 1
+        if (self._size > self.max_depth): self.max_depth = self._size
+
+        self._not_empty.set()
+    #
+
+    def _remove_keyed_entry(self, entry):
+        """
+Removes the given entry from the pending entries of its attribute. The entry
+is always the oldest one pending for the attribute.
+
+:param entry: Queue entry
+
+:since: 1.1.0
+        """
+
+        keyed_entries = self._keyed_entries[entry[0]]
+        keyed_entries.popleft()
+
+        if (len(keyed_entries) < 1): del self._keyed_entries[entry[0]]
+    #
+#
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from urllib.parse import unquote
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
+class Item(Mapping):
+    """
+The "Item" class provides read access to the properties of a homee group,
+homeegram, plan, relationship, user or the settings.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, item_dict):
+        """
+Constructor __init__(Item)
+
+:param item_dict: Item dictionary provided by homee
+
+:since: 1.1.0
+        """
+
+        if (type(item_dict.get("name")) is str): item_dict['name'] = unquote(item_dict['name'])
+
+        self._data = item_dict
+        """
+Item dictionary
+        """
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator object
+:since:  1.1.0
+        """
+
+        return iter(self._data)
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Key
+
+:return: (mixed) Value
+:since:  1.1.0
+        """
+
+        return self._data[key]
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of item properties
+:since:  1.1.0
+        """
+
+        return len(self._data)
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function and by string conversions
+(reverse quotes) to compute the "official" string representation of an
+object.
+
+:return: (str) String representation
+:since:  1.1.0
+        """
+
+        return repr(self._data)
+    #
+
+    @property
+    def id(self):
+        """
+Returns the homee item ID.
+
+:return: (int) homee item ID
+:since:  1.1.0
+        """
+
+        return self._data.get("id")
+    #
+
+    @property
+    def name(self):
+        """
+Returns the item name.
+
+:return: (str) Item name
+:since:  1.1.0
+        """
+
+        return self._data.get("name")
+    #
+#
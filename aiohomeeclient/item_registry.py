@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from threading import RLock
+
+from .item import Item
+
+class ItemRegistry(object):
+    """
+The "ItemRegistry" class holds all homee items of one type like groups,
+homeegrams, plans or users by ID.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(ItemRegistry)
+
+:since: 1.1.0
+        """
+
+        self._items = { }
+        """
+Items by homee item ID
+        """
+        self.lock = RLock()
+        """
+Underlying lock instance
+        """
+        self.timeout = 10
+        """
+Lock timeout in seconds
+        """
+    #
+
+    def __contains__(self, item_id):
+        """
+python.org: Called to implement membership test operators.
+
+:param item_id: homee item ID
+
+:return: (bool) True if known
+:since:  1.1.0
+        """
+
+        return (item_id in self._items)
+    #
+
+    def __enter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:since: 1.1.0
+        """
+
+        self.lock.acquire(timeout = self.timeout)
+    #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        self.lock.release()
+        return False
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator object
+:since:  1.1.0
+        """
+
+        with self: return iter(list(self._items.values()))
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of items
+:since:  1.1.0
+        """
+
+        return len(self._items)
+    #
+
+    def get(self, item_id):
+        """
+Returns the item for the given ID.
+
+:param item_id: homee item ID
+
+:return: (object) Item instance; None if not known
+:since:  1.1.0
+        """
+
+        return self._items.get(item_id)
+    #
+
+    def get_id_for_name(self, name):
+        """
+Returns the ID of the first item with the given name.
+
+:param name: Item name
+
+:return: (int) homee item ID; None if not known
+:since:  1.1.0
+        """
+
+        _return = None
+
+        with self:
+            for item in self._items.values():
+                if (item.name == name):
+                    _return = item.id
+                    break
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def get_ids(self):
+        """
+Returns the IDs of all items.
+
+:return: (list) homee item IDs
+:since:  1.1.0
+        """
+
+        with self: return list(self._items)
+    #
+
+    def remove(self, item_id):
+        """
+Removes the item with the given ID.
+
+:param item_id: homee item ID
+
+:return: (object) Item instance removed; None if not known
+:since:  1.1.0
+        """
+
+        with self: return self._items.pop(item_id, None)
+    #
+
+    def set(self, item_dict):
+        """
+Adds or updates the item described by the given dictionary.
+
+:param item_dict: Item dictionary provided by homee
+
+:return: (object) Item instance
+:since:  1.1.0
+        """
+
+        _return = Item(item_dict)
+        with self: self._items[_return.id] = _return
+
+        return _return
+    #
+
+    def set_all(self, item_dicts):
+        """
+Replaces all items with the ones described by the given list.
+
+:param item_dicts: List of item dictionaries provided by homee
+
+:since: 1.1.0
+        """
+
+        items = [ Item(item_dict) for item_dict in item_dicts ]
+        with self: self._items = { item.id: item for item in items }
+    #
+#
@@ -0,0 +1,641 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from hashlib import sha512
+from json import dumps as dumpJson
+from random import Random
+from time import time
+from urllib.parse import parse_qs, quote
+import asyncio
+import re
+
+from aiohttp import BasicAuth, web, WSMsgType
+
+from .attribute import ATTRIBUTES
+from .connection import Connection
+
+class MockHomeeServer(object):
+    """
+The "MockHomeeServer" class simulates a homee locally for tests and
+benchmarks. It issues access tokens, accepts "v2" websocket connections,
+answers "GET:" requests, applies "PUT:" attribute changes and pushes
+simulated attribute value changes at the rate configured. Attribute history
+requests are answered with one entry every "HISTORY_INTERVAL" seconds within
+the inclusive time range requested.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    GROUP_SIZE = 10
+    """
+Number of simulated nodes per simulated group
+    """
+    HISTORY_INTERVAL = 3600
+    """
+Time in seconds between the simulated attribute history entries
+    """
+    NODE_ATTRIBUTES = ( ( "OnOff", 0, 1, "", 1, 1 ),
+                        ( "Temperature", -20, 50, "%C2%B0C", 0, 21.5 ),
+                        ( "RelativeHumidity", 0, 100, "%25", 0, 45 ),
+                        ( "BatteryLevel", 0, 100, "%25", 0, 100 )
+                      )
+    """
+Attribute type name, minimum, maximum, unit, editable flag and initial
+value of each simulated node attribute
+    """
+    RE_ATTRIBUTE_HISTORY_REQUEST = re.compile("^/?nodes/(\\d+)/attributes/(\\d+)/history\\?(.*)$")
+    """
+RegEx matching an attribute history "GET:" request
+    """
+    RE_ATTRIBUTE_REQUEST = re.compile("^/?nodes/(\\d+)/attributes/(\\d+)\\?(.*)$")
+    """
+RegEx matching an attribute "PUT:" request
+    """
+    RE_NODE_REQUEST = re.compile("^/?nodes/(\\d+)$")
+    """
+RegEx matching a node "GET:" request
+    """
+    TOKEN_MAX_AGE = 3600
+    """
+Lifetime in seconds of access tokens issued
+    """
+    UPDATE_INTERVAL = 0.01
+    """
+Time in seconds between pushing simulated attribute value changes
+    """
+
+    def __init__(self,
+                 host = "127.0.0.1",
+                 port = None,
+                 node_count = 10,
+                 update_rate = 0,
+                 username = None,
+                 password = None,
+                 seed = None
+                ):
+        """
+Constructor __init__(MockHomeeServer)
+
+:param host: Host address to listen on
+:param port: TCP port to listen on; None for the local homee one
+:param node_count: Number of nodes simulated
+:param update_rate: Number of simulated attribute value changes per second
+:param username: homee username accepted; None to accept all
+:param password: homee password accepted
+:param seed: Seed of the simulated attribute value changes
+
+:since: 1.1.0
+        """
+
+        self._attributes = { }
+        """
+Simulated attribute dictionaries per node ID and attribute ID
+        """
+        self._client_sockets = set()
+        """
+Client websockets connected
+        """
+        self._groups = [ ]
+        """
+Simulated group dictionaries
+        """
+        self.host = host
+        """
+Host address to listen on
+        """
+        self._nodes = { }
+        """
+Simulated node dictionaries per node ID
+        """
+        self._password = password
+        """
+homee password accepted
+        """
+        self.port = (Connection.WS_LOCAL_PORT if (port is None) else port)
+        """
+TCP port to listen on
+        """
+        self._random = Random(seed)
+        """
+Random number generator of the simulated attribute value changes
+        """
+        self._relationships = [ ]
+        """
+Simulated relationship dictionaries
+        """
+        self._runner = None
+        """
+aiohttp application runner
+        """
+        self._tokens = set()
+        """
+Access tokens issued
+        """
+        self.update_count = 0
+        """
+Number of attribute value changes pushed
+        """
+        self.update_rate = update_rate
+        """
+Number of simulated attribute value changes per second
+        """
+        self._update_task = None
+        """
+Task pushing simulated attribute value changes
+        """
+        self._username = username
+        """
+homee username accepted
+        """
+
+        self._build_nodes(node_count)
+    #
+
+    async def __aenter__(self):
+        """
+Enter the runtime context related to this object. It must return an
+awaitable.
+
+:return: (object) Server instance
+:since:  1.1.0
+        """
+
+        await self.start()
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+Exit the runtime context related to this object. It must return an
+awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        await self.stop()
+        return False
+    #
+
+    @property
+    def client_count(self):
+        """
+Returns the number of clients connected.
+
+:return: (int) Number of clients
+:since:  1.1.0
+        """
+
+        return len(self._client_sockets)
+    #
+
+    @property
+    def node_count(self):
+        """
+Returns the number of nodes simulated.
+
+:return: (int) Number of nodes
+:since:  1.1.0
+        """
+
+        return len(self._nodes)
+    #
+
+    async def _broadcast(self, message):
+        """
+Sends the given message to all clients connected.
+
+:param message: Message dictionary
+
+:since: 1.1.0
+        """
+
+        data = dumpJson(message)
+
+        for socket in list(self._client_sockets):
+            if (not socket.closed): await socket.send_str(data)
+        #
+    #
+
+    def _build_nodes(self, node_count):
+        """
+Builds the given number of simulated nodes together with groups of
+"GROUP_SIZE" nodes each.
+
+:param node_count: Number of nodes simulated
+
+:since: 1.1.0
+        """
+
+        attribute_id = 1
+        now = int(time())
+
+        for node_id in range(1, 1 + node_count):
+            attributes = [ ]
+            self._attributes[node_id] = { }
+
+            for ( type_name, minimum, maximum, unit, editable, value ) in self.__class__.NODE_ATTRIBUTES:
+                attribute = { "id": attribute_id,
+                              "node_id": node_id,
+                              "instance": 0,
+                              "minimum": minimum,
+                              "maximum": maximum,
+                              "current_value": value,
+                              "target_value": value,
+                              "last_value": value,
+                              "unit": unit,
+                              "step_value": 1,
+                              "editable": editable,
+                              "type": ATTRIBUTES[type_name],
+                              "state": 1,
+                              "last_changed": now,
+                              "changed_by": 1,
+                              "changed_by_id": 0,
+                              "based_on": 1,
+                              "data": "",
+                              "name": ""
+                            }
+
+                attributes.append(attribute)
+                self._attributes[node_id][attribute_id] = attribute
+
+                attribute_id += 1
+            #
+
+            self._nodes[node_id] = { "id": node_id,
+                                     "name": quote("Mock node {0:d}".format(node_id)),
+                                     "profile": 1,
+                                     "image": "default",
+                                     "favorite": 0,
+                                     "order": node_id,
+                                     "protocol": 1,
+                                     "routing": 0,
+                                     "state": 1,
+                                     "state_changed": now,
+                                     "added": now,
+                                     "history": 0,
+                                     "cube_type": 1,
+                                     "note": "",
+                                     "services": 0,
+                                     "phonetic_name": "",
+                                     "owner": 1,
+                                     "security": 0,
+                                     "attributes": attributes
+                                   }
+
+            group_id = 1 + (node_id - 1) // self.__class__.GROUP_SIZE
+
+            if (group_id > len(self._groups)):
+                self._groups.append({ "id": group_id,
+                                      "name": quote("Mock group {0:d}".format(group_id)),
+                                      "image": "default",
+                                      "order": group_id,
+                                      "added": now,
+                                      "state": 1,
+                                      "category": 0,
+                                      "phonetic_name": "",
+                                      "note": "",
+                                      "services": 0,
+                                      "owner": 1
+                                    })
+            #
+
+            self._relationships.append({ "id": node_id,
+                                         "group_id": group_id,
+                                         "node_id": node_id,
+                                         "homeegram_id": 0,
+                                         "order": node_id
+                                       })
+        #
+    #
+
+    def _get_attribute_history(self, node_id, attribute_id, query):
+        """
+Returns the simulated history of the given attribute for the given query of
+an attribute history request.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param query: Query string with "from", "till" and optionally "limit"
+
+:return: (dict) Message dictionary; None if the attribute does not exist
+:since:  1.1.0
+        """
+
+        _return = None
+        attribute = self._attributes.get(node_id, { }).get(attribute_id)
+
+        if (attribute is not None):
+            interval = self.__class__.HISTORY_INTERVAL
+            query = parse_qs(query)
+
+            timestamp_from = int(query.get("from", [ 0 ])[0])
+            timestamp_till = int(query.get("till", [ int(time()) ])[0])
+
+            # Both ends of the time range requested are included
+            timestamps = range(timestamp_from + (-timestamp_from % interval), 1 + timestamp_till, interval)
+            if ("limit" in query): timestamps = timestamps[:int(query['limit'][0])]
+
+            _return = { "attribute_history": { "node_id": node_id,
+                                               "attribute_id": attribute_id,
+                                               "history": [ { "timestamp": timestamp, "value": attribute['current_value'] }
+                                                            for timestamp in timestamps
+                                                          ]
+                                             }
+                      }
+        #
+
+        return _return
+    #
+
+    def _get_response(self, request):
+        """
+Returns the response message for the given "GET:" request.
+
+:param request: homee API "GET:" request
+
+:return: (dict) Message dictionary; None if not supported
+:since:  1.1.0
+        """
+
+        _return = None
+        _type = request[4:].lstrip("/")
+
+        if (_type == "all"):
+            _return = { "all": { "groups": self._groups,
+                                 "homeegrams": [ ],
+                                 "nodes": list(self._nodes.values()),
+                                 "plans": [ ],
+                                 "relationships": self._relationships,
+                                 "settings": self._get_settings(),
+                                 "users": self._get_users()
+                               }
+                      }
+        elif (_type == "groups"): _return = { "groups": self._groups }
+        elif (_type == "homeegrams"): _return = { "homeegrams": [ ] }
+        elif (_type == "nodes"): _return = { "nodes": list(self._nodes.values()) }
+        elif (_type == "plans"): _return = { "plans": [ ] }
+        elif (_type == "relationships"): _return = { "relationships": self._relationships }
+        elif (_type == "settings"): _return = { "settings": self._get_settings() }
+        elif (_type == "users"): _return = { "users": self._get_users() }
+        else:
+            re_result = self.__class__.RE_ATTRIBUTE_HISTORY_REQUEST.match(_type)
+
+            if (re_result is not None):
+                _return = self._get_attribute_history(int(re_result.group(1)), int(re_result.group(2)), re_result.group(3))
+            else:
+                re_result = self.__class__.RE_NODE_REQUEST.match(_type)
+
+                if (re_result is not None and int(re_result.group(1)) in self._nodes):
+                    _return = { "node": self._nodes[int(re_result.group(1))] }
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def _get_settings(self):
+        """
+Returns the simulated homee settings.
+
+:return: (dict) Settings dictionary
+:since:  1.1.0
+        """
+
+        return { "homee_name": quote("Mock homee"), "version": "2.32.0", "uid": "MOCKHOMEE0001" }
+    #
+
+    def _get_users(self):
+        """
+Returns the simulated homee users.
+
+:return: (list) User dictionaries
+:since:  1.1.0
+        """
+
+        username = ("homee" if (self._username is None) else self._username)
+        return [ { "id": 1, "username": quote(username), "role": 2 } ]
+    #
+
+    async def _handle_access_token(self, request):
+        """
+Handles access token requests. The basic authentication credentials are
+checked if a username has been configured.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        if (self._username is not None):
+            try: credentials = BasicAuth.decode(request.headers.get("Authorization", ""))
+            except ValueError: credentials = None
+
+            password = ("" if (self._password is None) else self._password)
+
+            if (credentials is None
+                or credentials.login != self._username
+                or credentials.password != sha512(password.encode("utf-8")).hexdigest()
+               ): raise web.HTTPUnauthorized()
+        #
+
+        token = "mock{0:016x}".format(self._random.getrandbits(64))
+        self._tokens.add(token)
+
+        response = web.Response(text = "access_token={0}".format(token))
+        response.set_cookie("access_token", token, max_age = self.__class__.TOKEN_MAX_AGE)
+
+        return response
+    #
+
+    async def _handle_connection(self, request):
+        """
+Handles a client websocket connection until it has been closed.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp websocket response instance
+:since:  1.1.0
+        """
+
+        if (request.query.get("access_token") not in self._tokens): raise web.HTTPUnauthorized()
+
+        socket = web.WebSocketResponse(protocols = [ "v2" ])
+        await socket.prepare(request)
+
+        self._client_sockets.add(socket)
+
+        try:
+            async for message in socket:
+                if (message.type == WSMsgType.TEXT): await self._handle_request(socket, message.data)
+                elif (message.type == WSMsgType.ERROR): break
+            #
+        finally: self._client_sockets.discard(socket)
+
+        return socket
+    #
+
+    async def _handle_request(self, socket, request):
+        """
+Handles the given homee API request of a client.
+
+:param socket: Client websocket
+:param request: homee API request
+
+:since: 1.1.0
+        """
+
+        if (request.startswith("GET:")):
+            message = self._get_response(request)
+            if (message is not None): await socket.send_str(dumpJson(message))
+        elif (request.startswith("PUT:")):
+            re_result = self.__class__.RE_ATTRIBUTE_REQUEST.match(request[4:])
+
+            if (re_result is not None):
+                node_id = int(re_result.group(1))
+                attribute_id = int(re_result.group(2))
+
+                attribute = self._attributes.get(node_id, { }).get(attribute_id)
+                query = parse_qs(re_result.group(3))
+
+                if (attribute is not None and attribute['editable'] and "target_value" in query):
+                    await self.set_attribute_value(node_id, attribute_id, float(query['target_value'][0]))
+                #
+            #
+        #
+    #
+
+    async def send_message(self, message):
+        """
+Sends the given message to all clients connected as if homee pushed it.
+
+:param message: JSON serializable message; None for a "null" frame
+
+:since: 1.1.0
+        """
+
+        await self._broadcast(message)
+    #
+
+    async def set_attribute_value(self, node_id, attribute_id, value):
+        """
+Sets the value of the given simulated attribute and pushes the change to
+all clients connected.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+:param value: Attribute value
+
+:return: (bool) True if the attribute exists
+:since:  1.1.0
+        """
+
+        attribute = self._attributes.get(node_id, { }).get(attribute_id)
+        _return = (attribute is not None)
+
+        if (_return):
+            value = min(attribute['maximum'], max(attribute['minimum'], value))
+            if (value == int(value)): value = int(value)
+
+            attribute['last_value'] = attribute['current_value']
+            attribute['current_value'] = value
+            attribute['target_value'] = value
+            attribute['last_changed'] = int(time())
+
+            self.update_count += 1
+            await self._broadcast({ "attribute": attribute })
+        #
+
+        return _return
+    #
+
+    async def _simulate_updates(self):
+        """
+Pushes random walk changes of the simulated attribute values at the rate
+configured.
+
+:since: 1.1.0
+        """
+
+        loop = asyncio.get_event_loop()
+
+        node_ids = list(self._nodes)
+        pending = 0.0
+        last_time = loop.time()
+
+        while True:
+            await asyncio.sleep(self.__class__.UPDATE_INTERVAL)
+
+            now = loop.time()
+            pending += (now - last_time) * self.update_rate
+            last_time = now
+
+            while (pending >= 1 and len(node_ids) > 0):
+                pending -= 1
+
+                node_id = self._random.choice(node_ids)
+                attribute = self._random.choice(list(self._attributes[node_id].values()))
+
+                if (attribute['editable']): value = 1 - attribute['current_value']
+                else: value = round(attribute['current_value'] + self._random.uniform(-1, 1), 1)
+
+                await self.set_attribute_value(node_id, attribute['id'], value)
+            #
+        #
+    #
+
+    async def start(self):
+        """
+Starts accepting client connections and pushing simulated attribute value
+changes.
+
+:since: 1.1.0
+        """
+
+        application = web.Application()
+        application.router.add_post("/access_token", self._handle_access_token)
+        application.router.add_get("/connection", self._handle_connection)
+
+        self._runner = web.AppRunner(application)
+        await self._runner.setup()
+
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+        if (self.update_rate > 0): self._update_task = asyncio.ensure_future(self._simulate_updates())
+    #
+
+    async def stop(self):
+        """
+Disconnects all clients and stops the server.
+
+:since: 1.1.0
+        """
+
+        if (self._update_task is not None):
+            self._update_task.cancel()
+            self._update_task = None
+        #
+
+        for socket in list(self._client_sockets): await socket.close()
+        self._client_sockets = set()
+
+        if (self._runner is not None):
+            await self._runner.cleanup()
+            self._runner = None
+        #
+    #
+#
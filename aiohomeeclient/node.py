@@ -8,12 +8,14 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from time import monotonic
 from urllib.parse import unquote
 from weakref import proxy
 
 try: from types import new_class
 except ImportError: new_class = None
 
+from .attribute_aggregates import AGGREGATED_ATTRIBUTE_TYPES, RunningAggregate
 from .attribute_property_interface import AttributePropertyInterface
 from .attribute import ATTRIBUTES, Attribute
 from .node_interfaces import *
@@ -30,32 +32,62 @@ The "Node" class provides methods for an homee node.
 :license:    Mozilla Public License, v. 2.0
     """
 
-    def __init__(self, node_data, connection):
+    def __init__(self, node_data, connection, is_quoted = True):
         """
 Constructor __init__(Node)
 
 :param node_data: Node data provided by homee
 :param connection: homee connection instance
+:param is_quoted: False if names, units and data have already been unquoted
 
 :since: 1.0.0
         """
 
-        self._attributes = self._filter_attributes(node_data.get("attributes", [ ]))
+        self._attributes = self._filter_attributes(node_data.get("attributes", [ ]), is_quoted)
         """
 Sorted and filtered attributes of the node
+        """
+        self._aggregates = { }
+        """
+Running aggregates of all instances per attribute type ID
+        """
+        self._attribute_ids = { }
+        """
+Attributes of the node by homee attribute ID
         """
         self._connection = proxy(connection)
         """
 homee connection instance
+        """
+        self._generation = 0
+        """
+Registry generation the node or one of its attributes has been changed last
         """
         self._id = node_data['id']
         """
 homee node ID
         """
-        self._name = unquote(node_data.get("name", ""))
+        self._last_update = monotonic()
+        """
+Monotonic clock time the node or one of its attributes has been reported
+last
+        """
+        self._name = (unquote(node_data.get("name", "")) if (is_quoted) else node_data.get("name", ""))
         """
 Node name
         """
+
+        for attribute_type in self._attributes:
+            if (attribute_type in AGGREGATED_ATTRIBUTE_TYPES): self._aggregates[attribute_type] = RunningAggregate()
+
+            for attribute in self._attributes[attribute_type]:
+                self._attribute_ids[attribute.id] = attribute
+
+                if (attribute_type in self._aggregates):
+                    self._aggregates[attribute_type].set(attribute.id, attribute.value)
+                #
+            #
+        #
     #
 
     @property
@@ -82,6 +114,19 @@ Returns the firmware version of the node (device) if provided.
         return self.get_attribute("FirmwareRevision")
     #
 
+    @property
+    def generation(self):
+        """
+Returns the registry generation the node or one of its attributes has been
+changed last.
+
+:return: (int) Registry generation
+:since:  1.1.0
+        """
+
+        return self._generation
+    #
+
     @property
     def hardware_revision(self):
         """
@@ -106,6 +151,19 @@ Returns the interfaces implemented.
         return self._interfaces
     #
 
+    @property
+    def last_update(self):
+        """
+Returns the monotonic clock time the node or one of its attributes has been
+reported last.
+
+:return: (float) Monotonic clock time of the last update
+:since:  1.1.0
+        """
+
+        return self._last_update
+    #
+
     @property
     def name(self):
         """
@@ -142,11 +200,12 @@ Returns the software version of the node (device) if provided.
         return self.get_attribute("SoftwareRevision")
     #
 
-    def _filter_attributes(self, attributes):
+    def _filter_attributes(self, attributes, is_quoted = True):
         """
 Returns sorted and filtered attribute instances for the node.
 
 :param attributes: Attributes list of dictionaries
+:param is_quoted: False if names, units and data have already been unquoted
 
 :return: (dict) Sorted and filtered attribute instances
 :since:  1.0.0
@@ -158,14 +217,20 @@ Returns sorted and filtered attribute instances for the node.
             if ("instance" not in attribute): attribute['instance'] = 0
             if (attribute['type'] not in _return): _return[attribute['type']] = [ ]
 
-            position = 0
+            type_attributes = _return[attribute['type']]
 
-            for existing_attribute in _return[attribute['type']]:
-                if (attribute['instance'] < existing_attribute['instance']): break
-                position += 1
-            #
+            if (len(type_attributes) < 1 or attribute['instance'] >= type_attributes[-1]['instance']):
+                type_attributes.append(Attribute(self, attribute, is_quoted))
+            else:
+                position = 0
+
+                for existing_attribute in type_attributes:
+                    if (attribute['instance'] < existing_attribute['instance']): break
+                    position += 1
+                #
 
-            _return[attribute['type']].insert(position, Attribute(self, attribute))
+                type_attributes.insert(position, Attribute(self, attribute, is_quoted))
+            #
         #
 
         return _return
@@ -192,6 +257,33 @@ Returns the attribute for the given type name and instance.
                )
     #
 
+    def get_attribute_aggregate(self, name):
+        """
+Returns the running aggregate of all instances of the given attribute type
+name.
+
+:param name: Attribute type name
+
+:return: (object) RunningAggregate instance; None if not available
+:since:  1.1.0
+        """
+
+        return self._aggregates.get(ATTRIBUTES.get(name))
+    #
+
+    def get_attribute_by_id(self, _id):
+        """
+Returns the attribute for the given homee attribute ID.
+
+:param _id: homee attribute ID
+
+:return: (object) Attribute instance; None if not defined
+:since:  1.1.0
+        """
+
+        return self._attribute_ids.get(_id)
+    #
+
     def get_attribute_instances_count(self, name):
         """
 Returns the number of attribute instances for the given type name.
@@ -317,50 +409,61 @@ Requests the attribute value to change for the given type name and instance.
         await self._connection.send("PUT:/nodes/{0}/attributes/{1:d}?target_value={2}".format(self.id, attribute.id, value))
     #
 
+    def to_dict(self):
+        """
+Returns the node and all of its attributes as a dictionary.
+
+:return: (dict) Node dictionary
+:since:  1.1.0
+        """
+
+        attributes = [ ]
+
+        for type_id in sorted(self._attributes):
+            attributes += [ dict(attribute) for attribute in self._attributes[type_id] ]
+        #
+
+        return { "id": self._id, "name": self._name, "generation": self._generation, "attributes": attributes }
+    #
+
     def _update_attribute_value(self, _id, value):
         """
 Updates the attribute value for the given ID.
 
 :param _id: homee attribute ID
-:param value: Attribute value
+:param value: Attribute value or attribute dictionary
 
-:since: 1.0.0
+:return: (bool) True if the attribute value has changed
+:since:  1.0.0
         """
 
-        is_attribute_found = False
         is_value_changed = False
+        attribute = self._attribute_ids.get(_id)
 
-        for attribute_type in self._attributes:
-            for attribute in self._attributes[attribute_type]:
-                if (attribute.id == _id):
-                    is_attribute_found = True
-
-                    if (attribute.value != value):
-                        is_value_changed = True
-                        attribute._set_value(value)
-                    #
+        if (attribute is not None):
+            previous_value = attribute.value
+            attribute._set_value(value)
 
-                    break
-                #
-            #
+            self._last_update = attribute.last_update
 
-            if (is_attribute_found): break
-        #
+            is_value_changed = (attribute.value != previous_value)
 
-        if (is_attribute_found):
-            if (is_value_changed):
-                pass
+            if (is_value_changed and attribute['type'] in self._aggregates):
+                self._aggregates[attribute['type']].set(_id, attribute.value)
             #
         #
+
+        return is_value_changed
     #
 
     @staticmethod
-    def from_dict(node_data, connection):
+    def from_dict(node_data, connection, is_quoted = True):
         """
 Returns a new "Node" instance for the node data given.
 
 :param node_data: Node data provided by homee
 :param connection: homee connection instance
+:param is_quoted: False if names, units and data have already been unquoted
 
 :return: (object) Node instance
 :since:  1.0.0
@@ -384,7 +487,10 @@ Returns a new "Node" instance for the node data given.
             interfaces.add(base.__name__)
         #
 
-        dynamic_class = new_class(Node.__name__, tuple(bases), { "_interfaces": interfaces })
-        return dynamic_class(node_data, connection)
+        dynamic_class = new_class(Node.__name__,
+                                  tuple(bases),
+                                  exec_body = lambda namespace: namespace.update(_interfaces = interfaces)
+                                 )
+        return dynamic_class(node_data, connection, is_quoted)
     #
 #
@@ -35,13 +35,8 @@ Returns the current charge level.
         _return = 0
 
         if (instance < 0):
-            instances_count = self.get_attribute_instances_count("BatteryLevel")
-
-            for instance in range(0, instances_count):
-                _return += self.get_attribute_value("BatteryLevel", instance, 0)
-            #
-
-            if (instances_count > 1): _return /= instances_count
+            aggregate = self.get_attribute_aggregate("BatteryLevel")
+            if (aggregate is not None and aggregate.count > 0): _return = aggregate.mean
         else: _return = self.get_attribute_value("BatteryLevel", instance, 0)
 
         return _return
@@ -41,18 +41,23 @@ Returns the current value of the given sensor instance.
 
         if (_type is not None):
             if (instance < 0):
+                aggregate = self.get_attribute_aggregate(_type)
                 instances_count = self.get_attribute_instances_count(_type)
-                _return = 0
 
-                for instance in range(0, instances_count):
-                    instance_value = self.get_attribute_value(_type, instance, 0)
+                if (aggregate is None):
+                    _return = 0
 
-                    if (not isinstance(instance_value, Number)): raise TypeError("Can't aggregate non-numeric sensor values")
-                    _return += instance_value
-                #
+                    for instance in range(0, instances_count):
+                        instance_value = self.get_attribute_value(_type, instance, 0)
 
-                if (instances_count > 1): _return /= instances_count
-            else: _return = self.get_attribute_value("BatteryLevel", instance, 0)
+                        if (not isinstance(instance_value, Number)): raise TypeError("Can't aggregate non-numeric sensor values")
+                        _return += instance_value
+                    #
+
+                    if (instances_count > 1): _return /= instances_count
+                elif (aggregate.count < instances_count): raise TypeError("Can't aggregate non-numeric sensor values")
+                else: _return = aggregate.mean
+            else: _return = self.get_attribute_value(_type, instance, 0)
         #
 
         return _return
@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
+from .attribute import ATTRIBUTES, ATTRIBUTES_TYPE_DICT
+from .node import Node
+
+class AttributeSnapshot(Mapping):
+    """
+The "AttributeSnapshot" class is a detached, read-only copy of a node
+attribute. It holds no connection and can be pickled.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_data", )
+    """
+Instance attributes allocated without a "__dict__"
+    """
+
+    def __init__(self, attribute_dict):
+        """
+Constructor __init__(AttributeSnapshot)
+
+:param attribute_dict: Attribute dictionary
+
+:since: 1.1.0
+        """
+
+        object.__setattr__(self, "_data", dict(attribute_dict))
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Key
+
+:return: (mixed) Value
+:since:  1.1.0
+        """
+
+        return self._data[key]
+    #
+
+    def __getstate__(self):
+        """
+python.org: Return the state to be pickled.
+
+:return: (dict) Attribute dictionary
+:since:  1.1.0
+        """
+
+        return self._data
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator object
+:since:  1.1.0
+        """
+
+        return iter(self._data)
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of attribute items
+:since:  1.1.0
+        """
+
+        return len(self._data)
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function and by string conversions
+(reverse quotes) to compute the "official" string representation of an
+object.
+
+:return: (str) String representation
+:since:  1.1.0
+        """
+
+        return "<AttributeSnapshot {0!r}>".format(self._data)
+    #
+
+    def __setattr__(self, name, value):
+        """
+python.org: Called when an attribute assignment is attempted.
+
+:param name: Attribute name
+:param value: Value to be assigned
+
+:since: 1.1.0
+        """
+
+        raise AttributeError("Snapshots are read-only")
+    #
+
+    def __setstate__(self, state):
+        """
+python.org: Upon unpickling, the state is passed to __setstate__().
+
+:param state: Attribute dictionary
+
+:since: 1.1.0
+        """
+
+        object.__setattr__(self, "_data", state)
+    #
+
+    @property
+    def id(self):
+        """
+Returns the homee attribute ID.
+
+:return: (int) homee attribute ID
+:since:  1.1.0
+        """
+
+        return self._data.get("id")
+    #
+
+    @property
+    def instance(self):
+        """
+Returns the homee attribute instance.
+
+:return: (int) homee attribute instance
+:since:  1.1.0
+        """
+
+        return self._data.get("instance", 0)
+    #
+
+    @property
+    def name(self):
+        """
+Returns the attribute type name.
+
+:return: (str) Attribute name
+:since:  1.1.0
+        """
+
+        return ATTRIBUTES_TYPE_DICT[self._data['type']]
+    #
+
+    @property
+    def node_id(self):
+        """
+Returns the homee node ID.
+
+:return: (int) homee node ID
+:since:  1.1.0
+        """
+
+        return self._data.get("node_id")
+    #
+
+    @property
+    def unit(self):
+        """
+Returns the attribute measurement unit.
+
+:return: (str) Attribute unit
+:since:  1.1.0
+        """
+
+        return self._data.get("unit")
+    #
+
+    @property
+    def value(self):
+        """
+Returns the attribute value.
+
+:return: (mixed) Attribute value
+:since:  1.1.0
+        """
+
+        return self._data.get("current_value")
+    #
+#
+
+class NodeSnapshot(object):
+    """
+The "NodeSnapshot" class is a detached, read-only copy of a node and its
+attributes. It holds no connection, can be pickled and sent to worker
+processes and rehydrated against a live connection.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_attributes", "_generation", "_id", "_name" )
+    """
+Instance attributes allocated without a "__dict__"
+    """
+
+    def __init__(self, node_id, name, attributes, generation = 0):
+        """
+Constructor __init__(NodeSnapshot)
+
+:param node_id: homee node ID
+:param name: Node name
+:param attributes: Attribute snapshots sorted by type and instance
+:param generation: Registry generation of the node
+
+:since: 1.1.0
+        """
+
+        object.__setattr__(self, "_attributes", tuple(attributes))
+        object.__setattr__(self, "_generation", generation)
+        object.__setattr__(self, "_id", node_id)
+        object.__setattr__(self, "_name", name)
+    #
+
+    def __getstate__(self):
+        """
+python.org: Return the state to be pickled.
+
+:return: (tuple) Node ID, name, generation and attribute dictionaries
+:since:  1.1.0
+        """
+
+        return ( self._id, self._name, self._generation, [ attribute._data for attribute in self._attributes ] )
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function and by string conversions
+(reverse quotes) to compute the "official" string representation of an
+object.
+
+:return: (str) String representation
+:since:  1.1.0
+        """
+
+        return "<NodeSnapshot {0:d} {1!r}>".format(self._id, self._name)
+    #
+
+    def __setattr__(self, name, value):
+        """
+python.org: Called when an attribute assignment is attempted.
+
+:param name: Attribute name
+:param value: Value to be assigned
+
+:since: 1.1.0
+        """
+
+        raise AttributeError("Snapshots are read-only")
+    #
+
+    def __setstate__(self, state):
+        """
+python.org: Upon unpickling, the state is passed to __setstate__().
+
+:param state: Node ID, name, generation and attribute dictionaries
+
+:since: 1.1.0
+        """
+
+        ( node_id, name, generation, attribute_dicts ) = state
+        self.__init__(node_id, name, [ AttributeSnapshot(attribute_dict) for attribute_dict in attribute_dicts ], generation)
+    #
+
+    @property
+    def attributes(self):
+        """
+Returns all attribute snapshots sorted by type and instance.
+
+:return: (tuple) Attribute snapshots
+:since:  1.1.0
+        """
+
+        return self._attributes
+    #
+
+    @property
+    def generation(self):
+        """
+Returns the registry generation of the node at the time of the snapshot.
+
+:return: (int) Registry generation
+:since:  1.1.0
+        """
+
+        return self._generation
+    #
+
+    @property
+    def id(self):
+        """
+Returns the homee node ID.
+
+:return: (int) homee node ID
+:since:  1.1.0
+        """
+
+        return self._id
+    #
+
+    @property
+    def name(self):
+        """
+Returns the node name.
+
+:return: (str) Node name
+:since:  1.1.0
+        """
+
+        return self._name
+    #
+
+    def get_attribute(self, name, instance = 0):
+        """
+Returns the attribute snapshot for the given type name and instance.
+
+:param name: Attribute type name
+:param instance: Attribute instance
+
+:return: (object) Attribute snapshot; None if not defined
+:since:  1.1.0
+        """
+
+        _return = None
+        type_id = ATTRIBUTES.get(name)
+
+        for attribute in self._attributes:
+            if (attribute['type'] == type_id and attribute.instance == instance):
+                _return = attribute
+                break
+            #
+        #
+
+        return _return
+    #
+
+    def get_attribute_by_id(self, _id):
+        """
+Returns the attribute snapshot for the given homee attribute ID.
+
+:param _id: homee attribute ID
+
+:return: (object) Attribute snapshot; None if not defined
+:since:  1.1.0
+        """
+
+        _return = None
+
+        for attribute in self._attributes:
+            if (attribute.id == _id):
+                _return = attribute
+                break
+            #
+        #
+
+        return _return
+    #
+
+    def get_attribute_value(self, name, instance = 0, default = None):
+        """
+Returns the attribute value for the given type name and instance.
+
+:param name: Attribute type name
+:param instance: Attribute instance
+:param default: Default value if attribute is not defined
+
+:return: (mixed) Attribute value
+:since:  1.1.0
+        """
+
+        attribute = self.get_attribute(name, instance)
+        return (default if (attribute is None) else attribute.value)
+    #
+
+    def rehydrate(self, connection):
+        """
+Returns a new live "Node" instance for this snapshot bound to the given
+homee connection. Names, units and data are already unquoted.
+
+:param connection: homee connection instance
+
+:return: (object) Node instance
+:since:  1.1.0
+        """
+
+        node_data = { "id": self._id,
+                      "name": self._name,
+                      "attributes": [ dict(attribute._data) for attribute in self._attributes ]
+                    }
+
+        return Node.from_dict(node_data, connection, False)
+    #
+
+    def to_dict(self):
+        """
+Returns the node and all of its attributes as a dictionary.
+
+:return: (dict) Node dictionary
+:since:  1.1.0
+        """
+
+        return { "id": self._id,
+                 "name": self._name,
+                 "generation": self._generation,
+                 "attributes": [ dict(attribute) for attribute in self._attributes ]
+               }
+    #
+
+    @staticmethod
+    def from_dict(node_data):
+        """
+Returns a new "NodeSnapshot" instance for the node data given.
+
+:param node_data: Node data as returned by "to_dict()" or provided by homee
+
+:return: (object) NodeSnapshot instance
+:since:  1.1.0
+        """
+
+        attributes = sorted(node_data.get("attributes", [ ]), key = NodeSnapshot._get_attribute_sort_key)
+
+        return NodeSnapshot(node_data['id'],
+                            node_data.get("name", ""),
+                            [ AttributeSnapshot(attribute_dict) for attribute_dict in attributes ],
+                            node_data.get("generation", 0)
+                           )
+    #
+
+    @staticmethod
+    def from_node(node):
+        """
+Returns a new "NodeSnapshot" instance for the given live node.
+
+:param node: Node instance
+
+:return: (object) NodeSnapshot instance
+:since:  1.1.0
+        """
+
+        return NodeSnapshot.from_dict(node.to_dict())
+    #
+
+    @staticmethod
+    def _get_attribute_sort_key(attribute_dict):
+        """
+Returns the key to sort attribute dictionaries by type and instance.
+
+:param attribute_dict: Attribute dictionary
+
+:return: (tuple) Sort key
+:since:  1.1.0
+        """
+
+        return ( attribute_dict['type'], attribute_dict.get("instance", 0) )
+    #
+#
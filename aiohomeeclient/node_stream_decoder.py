@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from json import JSONDecoder
+import re
+
+class NodeStreamDecoder(object):
+    """
+The "NodeStreamDecoder" class decodes the "nodes" array of an "all" or
+"nodes" frame one node at a time. All other values are decoded as usual and
+are available as "message" once all nodes have been iterated.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    RE_WHITESPACE = re.compile("[ \\t\\n\\r]*")
+    """
+RegEx matching JSON whitespace
+    """
+
+    def __init__(self, data):
+        """
+Constructor __init__(NodeStreamDecoder)
+
+:param data: JSON frame received
+
+:since: 1.1.0
+        """
+
+        self._data = data
+        """
+JSON frame received
+        """
+        self._decoder = JSONDecoder()
+        """
+JSON decoder instance
+        """
+        self.message = None
+        """
+Message decoded with an empty "nodes" array once all nodes have been
+iterated
+        """
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator of node dictionaries
+:since:  1.1.0
+        """
+
+        return self._decode()
+    #
+
+    def _decode(self):
+        """
+Decodes the frame and yields each node dictionary as soon as it is
+complete.
+
+:since: 1.1.0
+        """
+
+        position = self._skip_whitespace(0)
+        self._expect(position, "{")
+
+        ( message, position ) = yield from self._decode_object(position, ( ))
+
+        if (self._skip_whitespace(position) != len(self._data)): raise ValueError("Extra data at character {0:d}".format(position))
+        self.message = message
+    #
+
+    def _decode_nodes(self, position):
+        """
+Decodes the "nodes" array starting at the given position and yields each
+node dictionary.
+
+:param position: Position of the opening bracket
+
+:return: (int) Position after the closing bracket
+:since:  1.1.0
+        """
+
+        data = self._data
+        position = self._skip_whitespace(position + 1)
+
+        if (data[position:position + 1] == "]"): return position + 1
+
+        while True:
+            ( node_data, position ) = self._decoder.raw_decode(data, position)
+            yield node_data
+
+            position = self._skip_whitespace(position)
+
+            if (data[position:position + 1] == ","): position = self._skip_whitespace(position + 1)
+            else:
+                self._expect(position, "]")
+                return position + 1
+            #
+        #
+    #
+
+    def _decode_object(self, position, path):
+        """
+Decodes the object starting at the given position. The "nodes" array of
+the frame and of its "all" object are streamed.
+
+:param position: Position of the opening brace
+:param path: Keys of the objects containing this one
+
+:return: (tuple) Object decoded and position after the closing brace
+:since:  1.1.0
+        """
+
+        data = self._data
+        _return = { }
+
+        position = self._skip_whitespace(position + 1)
+        if (data[position:position + 1] == "}"): return ( _return, position + 1 )
+
+        while True:
+            self._expect(position, "\"")
+            ( key, position ) = self._decoder.raw_decode(data, position)
+
+            position = self._skip_whitespace(position)
+            self._expect(position, ":")
+            position = self._skip_whitespace(position + 1)
+
+            if (key == "nodes" and path in ( ( ), ( "all", ) ) and data[position:position + 1] == "["):
+                position = yield from self._decode_nodes(position)
+                _return[key] = [ ]
+            elif (key == "all" and path == ( ) and data[position:position + 1] == "{"):
+                ( _return[key], position ) = yield from self._decode_object(position, ( "all", ))
+            else: ( _return[key], position ) = self._decoder.raw_decode(data, position)
+
+            position = self._skip_whitespace(position)
+
+            if (data[position:position + 1] == ","): position = self._skip_whitespace(position + 1)
+            else:
+                self._expect(position, "}")
+                return ( _return, position + 1 )
+            #
+        #
+    #
+
+    def _expect(self, position, character):
+        """
+Raises a ValueError if the given character is not found at the given
+position.
+
+:param position: Position in the frame
+:param character: Character expected
+
+:since: 1.1.0
+        """
+
+        if (self._data[position:position + 1] != character):
+            raise ValueError("Expecting '{0}' at character {1:d}".format(character, position))
+        #
+    #
+
+    def _skip_whitespace(self, position):
+        """
+Returns the position of the next character not being whitespace.
+
+:param position: Position in the frame
+
+:return: (int) Position
+:since:  1.1.0
+        """
+
+        return self.__class__.RE_WHITESPACE.match(self._data, position).end()
+    #
+#
@@ -8,10 +8,30 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from logging import getLogger
 from threading import RLock
+from uuid import uuid4
 from weakref import proxy
-
+import asyncio
+
+from .attribute import ATTRIBUTES
+from .attribute_aggregates import AttributeAggregates
+from .attribute_history_store import AttributeHistoryStore
+from .attribute_type_index import AttributeTypeIndex
+from .attribute_update_coalescer import AttributeUpdateCoalescer
+from .battery_level_index import BatteryLevelIndex
+from .change_log import ChangeLog
+from .dead_band_filter import DEAD_BAND_ABSOLUTE, DeadBandFilter
+from .event import EVENT_ATTRIBUTE_CHANGED, EVENT_NODE_ACTIVE, EVENT_NODE_STALE, Event
 from .node import Node
+from .node_snapshot import NodeSnapshot
+from .shared_snapshot import SharedSnapshotTable
+from .staleness_index import StalenessIndex
+
+_LOG = getLogger(__name__)
+"""
+Logger instance
+"""
 
 class Registry(object):
     """
@@ -25,6 +45,15 @@ The "Registry" class provides thread-safe access to node instances.
 :license:    Mozilla Public License, v. 2.0
     """
 
+    CHANGE_LOG_SIZE = 4096
+    """
+Maximum number of changes logged for "get_changes_since()".
+    """
+    SHARED_SNAPSHOT_CAPACITY = 4096
+    """
+Minimum number of attribute rows of the shared memory snapshot table.
+    """
+
     def __init__(self, connection):
         """
 Constructor __init__(Registry)
@@ -34,9 +63,57 @@ Constructor __init__(Registry)
 :since: 1.0.0
         """
 
+        self._aggregates = AttributeAggregates()
+        """
+Running aggregates per attribute type and group
+        """
+        self._attribute_type_index = AttributeTypeIndex()
+        """
+Index of attributes per attribute type
+        """
+        self._battery_level_index = BatteryLevelIndex()
+        """
+Index of node battery levels
+        """
+        self._change_log = ChangeLog(self.__class__.CHANGE_LOG_SIZE)
+        """
+Bounded log of changes ordered by generation
+        """
+        self._coalescer = AttributeUpdateCoalescer(self._emit)
+        """
+Coalescer for attribute change events
+        """
         self._connection = proxy(connection)
         """
 homee connection
+        """
+        self._dead_band_filter = DeadBandFilter()
+        """
+Dead-band filter for attribute change events
+        """
+        self._epoch = uuid4().hex
+        """
+Random identifier of this registry as generations restart with each one
+        """
+        self._generation = 0
+        """
+Generation incremented for each change
+        """
+        self.history = None
+        """
+Attribute history store if enabled
+        """
+        self._listeners = [ ]
+        """
+Event listeners and event types they are interested in
+        """
+        self._node_group_ids = { }
+        """
+homee group IDs per node ID
+        """
+        self._node_waiters = { }
+        """
+Futures waiting for a node per node ID
         """
         self._nodes = { }
         """
@@ -45,6 +122,23 @@ Nodes
         self.lock = RLock()
         """
 Underlying lock instance
+        """
+        self.shared_snapshot = None
+        """
+Shared memory snapshot table if enabled
+        """
+        self._shared_snapshot_skipped_node_ids = set()
+        """
+IDs of nodes with attributes not published as the shared memory snapshot
+table is full
+        """
+        self._staleness_index = StalenessIndex()
+        """
+Index of nodes ordered by the time they have been reported last
+        """
+        self._staleness_monitor_task = None
+        """
+Task checking periodically for stale nodes
         """
         self.timeout = 10
         """
@@ -74,6 +168,22 @@ python.org: Exit the runtime context related to this object.
         return False
     #
 
+    def add_listener(self, callback, event_types = None):
+        """
+Adds a callback called with registry events.
+
+:param callback: Callback receiving the event instance
+:param event_types: List of event types to receive; None for all
+
+:since: 1.1.0
+        """
+
+        with self:
+            self.remove_listener(callback)
+            self._listeners.append(( callback, (None if (event_types is None) else frozenset(event_types)) ))
+        #
+    #
+
     def add_node(self, node):
         """
 Adds a new node to this registry.
@@ -86,7 +196,7 @@ Adds a new node to this registry.
         if (not isinstance(node, Node)): raise ValueError("Node '{0!r}' given is invalid".format(node))
 
         with self:
-            if (not self.is_node_known(node.id)): self._nodes[node.id] = node
+            if (not self.is_node_known(node.id)): self._set_node(node)
         #
     #
 
@@ -100,7 +210,324 @@ Adds a node to or updates a node in this registry.
         """
 
         if (not isinstance(node, Node)): raise ValueError("Node '{0!r}' given is invalid".format(node))
-        self._nodes[node.id] = node
+        with self: self._set_node(node)
+    #
+
+    def _emit(self, event):
+        """
+Passes the given event to all listeners interested in it.
+
+:param event: Event instance
+
+:since: 1.1.0
+        """
+
+        for ( callback, event_types ) in self._listeners[:]:
+            if (event_types is None or event.type in event_types):
+                try: callback(event)
+                except Exception: _LOG.exception("Event listener {0!r} failed".format(callback))
+            #
+        #
+    #
+
+    def check_staleness(self, max_age):
+        """
+Emits "node_stale" events for all nodes silent for more than the given time
+not reported as stale before.
+
+:param max_age: Time in seconds
+
+:return: (list) Node ID and monotonic clock time tuples newly stale
+:since:  1.1.0
+        """
+
+        with self:
+            _return = self._staleness_index.update_stale(max_age)
+
+            for ( node_id, last_update ) in _return:
+                self._emit(Event(EVENT_NODE_STALE, node_id = node_id, last_update = last_update, max_age = max_age))
+            #
+        #
+
+        return _return
+    #
+
+    def close(self):
+        """
+Releases the resources held by this registry like the staleness monitor
+task and the shared memory snapshot table. Node waiters are cancelled.
+
+:since: 1.1.0
+        """
+
+        self.stop_staleness_monitor()
+        self.disable_shared_snapshot()
+
+        with self:
+            node_waiters = self._node_waiters
+            self._node_waiters = { }
+        #
+
+        for futures in node_waiters.values():
+            for future in futures: future.cancel()
+        #
+    #
+
+    def disable_shared_snapshot(self):
+        """
+Stops publishing attribute values and releases the shared memory snapshot
+table.
+
+:since: 1.1.0
+        """
+
+        with self:
+            if (self.shared_snapshot is not None):
+                self.shared_snapshot.close()
+                self.shared_snapshot = None
+
+                self._shared_snapshot_skipped_node_ids.clear()
+            #
+        #
+    #
+
+    def enable_history(self, capacity = 512):
+        """
+Enables recording of reported values for tracked attributes in ring
+buffers.
+
+:param capacity: Number of samples stored per attribute
+
+:return: (object) Attribute history store instance
+:since:  1.1.0
+        """
+
+        with self:
+            if (self.history is None): self.history = AttributeHistoryStore(capacity)
+            return self.history
+        #
+    #
+
+    def enable_shared_snapshot(self, name = None, capacity = None):
+        """
+Enables publishing attribute values to a shared memory table readable by
+other processes with "SharedSnapshotReader".
+
+:param name: Shared memory block name; None for a random one
+:param capacity: Maximum number of attribute rows; None for twice the
+                 number of attributes known but at least
+                 "SHARED_SNAPSHOT_CAPACITY"
+
+:return: (object) Shared memory snapshot table instance
+:since:  1.1.0
+        """
+
+        with self:
+            if (self.shared_snapshot is None):
+                if (capacity is None):
+                    attribute_count = sum(len(node._attribute_ids) for node in self._nodes.values())
+                    capacity = max(self.__class__.SHARED_SNAPSHOT_CAPACITY, 2 * attribute_count)
+                #
+
+                self.shared_snapshot = SharedSnapshotTable(name, capacity)
+
+                for node in self._nodes.values(): self._publish_shared_snapshot(node.id, node._attribute_ids.values())
+            #
+
+            return self.shared_snapshot
+        #
+    #
+
+    @property
+    def epoch(self):
+        """
+Returns the random identifier of this registry. Generations are only
+comparable within the same epoch.
+
+:return: (str) Registry epoch
+:since:  1.1.0
+        """
+
+        return self._epoch
+    #
+
+    def flush_coalesced_events(self):
+        """
+Passes on all attribute change events held back by coalescing windows.
+
+:since: 1.1.0
+        """
+
+        with self: self._coalescer.flush()
+    #
+
+    @property
+    def generation(self):
+        """
+Returns the generation incremented for each node added or replaced and each
+attribute value changed.
+
+:return: (int) Registry generation
+:since:  1.1.0
+        """
+
+        return self._generation
+    #
+
+    def get_attribute_type_aggregate(self, attribute_type):
+        """
+Returns the running aggregate of all attributes of the given type across
+all nodes.
+
+:param attribute_type: Attribute type name
+
+:return: (object) RunningAggregate instance; None if not available
+:since:  1.1.0
+        """
+
+        return self._aggregates.get_type_aggregate(attribute_type)
+    #
+
+    def get_attribute_type_values(self, attribute_type, instance = 0, use_alternatives = True):
+        """
+Returns NumPy arrays of node IDs, values and units of the given attribute
+type instance for all nodes implementing it. Nodes not implementing the
+type are included with the first alternative sensor type implemented if
+requested. Non-numeric values are returned as NaN.
+
+:param attribute_type: Attribute type name
+:param instance: Attribute instance
+:param use_alternatives: True to include alternative sensor types
+
+:return: (tuple) Node IDs, values and units NumPy arrays
+:since:  1.1.0
+        """
+
+        with self: return self._attribute_type_index.get_values(attribute_type, instance, use_alternatives)
+    #
+
+    def get_attribute_values(self, keys, default = None):
+        """
+Returns the values of the given node attributes read together while the
+registry is locked once. Keys are tuples of the node ID, the attribute type
+name and optionally the attribute instance.
+
+:param keys: Iterable of node ID, attribute type name and instance tuples
+:param default: Default value if a node or attribute is not defined
+
+:return: (list) Attribute values in the order of the keys given
+:since:  1.1.0
+        """
+
+        _return = [ ]
+
+        type_ids = { }
+
+        with self:
+            for key in keys:
+                node = self._nodes.get(key[0])
+                name = key[1]
+                instance = (key[2] if (len(key) > 2) else 0)
+
+                if (name not in type_ids): type_ids[name] = ATTRIBUTES.get(name)
+                attributes = (None if (node is None) else node._attributes.get(type_ids[name]))
+
+                _return.append(attributes[instance]._data.get("current_value")
+                               if (attributes is not None and instance < len(attributes)) else
+                               default
+                              )
+            #
+        #
+
+        return _return
+    #
+
+    def get_battery_levels_below(self, threshold = None):
+        """
+Returns the node IDs and battery levels below the given threshold sorted
+ascending.
+
+:param threshold: Battery level threshold; None for the configured one
+
+:return: (list) Node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        with self: return self._battery_level_index.get_below(threshold)
+    #
+
+    def get_changes_since(self, generation):
+        """
+Returns the changes newer than the given generation. Only the latest change
+per node attribute is returned. Entries without an attribute ID stand for a
+node added or replaced as a whole.
+
+:param generation: Registry generation known to the caller
+
+:return: (list) Generation, node ID, attribute ID and value tuples ordered
+         by generation; None if changes since the generation given are no
+         longer logged and a full read is required
+:since:  1.1.0
+        """
+
+        with self: return self._change_log.get_since(generation)
+    #
+
+    def get_coalescing_window(self, attribute_type):
+        """
+Returns the coalescing window for attribute change events of the given
+attribute type.
+
+:param attribute_type: Attribute type name
+
+:return: (float) Coalescing window in seconds
+:since:  1.1.0
+        """
+
+        return self._coalescer.get_window(attribute_type)
+    #
+
+    def get_dead_band(self, attribute_type):
+        """
+Returns the dead-band threshold and mode for attribute change events of the
+given attribute type.
+
+:param attribute_type: Attribute type name
+
+:return: (tuple) Dead-band threshold and mode; None if not defined
+:since:  1.1.0
+        """
+
+        return self._dead_band_filter.get_dead_band(attribute_type)
+    #
+
+    def get_group_aggregate(self, group_id, attribute_type):
+        """
+Returns the running aggregate of all attributes of the given type of nodes
+in the given group.
+
+:param group_id: homee group ID
+:param attribute_type: Attribute type name
+
+:return: (object) RunningAggregate instance; None if not available
+:since:  1.1.0
+        """
+
+        return self._aggregates.get_group_aggregate(group_id, attribute_type)
+    #
+
+    def get_lowest_battery_levels(self, count):
+        """
+Returns the node IDs and battery levels of the given number of nodes with
+the lowest battery levels sorted ascending.
+
+:param count: Number of nodes
+
+:return: (list) Node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        with self: return self._battery_level_index.get_lowest(count)
     #
 
     def get_node(self, node_id):
@@ -146,6 +573,48 @@ Returns the node ID for the name given is registered.
         return _return
     #
 
+    def get_nodes(self):
+        """
+Returns all nodes registered.
+
+:return: (list) Node instances
+:since:  1.1.0
+        """
+
+        with self: return list(self._nodes.values())
+    #
+
+    def get_node_snapshots(self, node_ids = None):
+        """
+Returns detached, picklable snapshots of the given nodes taken while the
+registry is locked once.
+
+:param node_ids: homee node IDs; None for all nodes
+
+:return: (list) NodeSnapshot instances of known nodes
+:since:  1.1.0
+        """
+
+        with self:
+            if (node_ids is None): node_ids = list(self._nodes)
+            return [ NodeSnapshot.from_node(self._nodes[node_id]) for node_id in node_ids if (node_id in self._nodes) ]
+        #
+    #
+
+    def get_silent_nodes(self, max_age):
+        """
+Returns the node IDs and times of the last update for nodes silent for
+more than the given time ordered by silence descending.
+
+:param max_age: Time in seconds
+
+:return: (list) Node ID and monotonic clock time tuples
+:since:  1.1.0
+        """
+
+        with self: return self._staleness_index.get_silent(max_age)
+    #
+
     def is_node_known(self, node_id):
         """
 Returns true if the node ID given is registered.
@@ -159,6 +628,272 @@ Returns true if the node ID given is registered.
         return (node_id in self._nodes)
     #
 
+    async def _monitor_staleness(self, max_age, interval):
+        """
+Checks periodically for stale nodes.
+
+:param max_age: Time in seconds a node may be silent
+:param interval: Time in seconds between checks
+
+:since: 1.1.0
+        """
+
+        while True:
+            await asyncio.sleep(interval)
+            self.check_staleness(max_age)
+        #
+    #
+
+    def _on_attribute_value_changed(self, node, attribute, previous_value):
+        """
+Called after an attribute value has changed.
+
+:param node: Node instance
+:param attribute: Attribute instance changed
+:param previous_value: Attribute value notified before the change
+
+:since: 1.1.0
+        """
+
+        self._coalescer.submit(Event(EVENT_ATTRIBUTE_CHANGED,
+                                     node_id = node.id,
+                                     attribute_id = attribute.id,
+                                     attribute_type = attribute.name,
+                                     instance = attribute.instance,
+                                     value = attribute.value,
+                                     previous_value = previous_value,
+                                     skipped_count = 0
+                                    )
+                              )
+    #
+
+    def _publish_shared_snapshot(self, node_id, attributes):
+        """
+Publishes the current values of the given attributes to the shared memory
+snapshot table. A warning is logged once per node if the table is full.
+
+:param node_id: homee node ID
+:param attributes: Attribute instances
+
+:since: 1.1.0
+        """
+
+        if (self.shared_snapshot.publish_attributes(node_id, attributes)):
+            self._shared_snapshot_skipped_node_ids.discard(node_id)
+        elif (node_id not in self._shared_snapshot_skipped_node_ids):
+            self._shared_snapshot_skipped_node_ids.add(node_id)
+
+            _LOG.warning("Shared snapshot table is full with {0:d} rows; attributes of node {1:d} are not published".format(self.shared_snapshot.capacity, node_id))
+        #
+    #
+
+    def remove_listener(self, callback):
+        """
+Removes a callback previously added.
+
+:param callback: Callback receiving the event instance
+
+:since: 1.1.0
+        """
+
+        with self:
+            for listener in self._listeners:
+                if (listener[0] == callback):
+                    self._listeners.remove(listener)
+                    break
+                #
+            #
+        #
+    #
+
+    def _set_node(self, node):
+        """
+Adds or replaces the given node and updates all indexes.
+
+:param node: Node instance to be set
+
+:since: 1.1.0
+        """
+
+        group_ids = self._node_group_ids.get(node.id, ( ))
+        previous_node = self._nodes.get(node.id)
+
+        if (previous_node is not None):
+            self._aggregates.remove_node(previous_node, group_ids)
+            self._attribute_type_index.remove_node(previous_node)
+        #
+
+        self._nodes[node.id] = node
+
+        self._generation += 1
+        node._generation = self._generation
+
+        for attribute in node._attribute_ids.values(): attribute._generation = self._generation
+        self._change_log.append(self._generation, node.id)
+
+        if (self.shared_snapshot is not None): self._publish_shared_snapshot(node.id, node._attribute_ids.values())
+
+        self._aggregates.add_node(node, group_ids)
+        self._attribute_type_index.add_node(node)
+
+        self._update_battery_level(node)
+        self._touch_node(node)
+
+        for future in self._node_waiters.pop(node.id, ( )):
+            if (not future.done()): future.set_result(node)
+        #
+    #
+
+    def set_battery_low_threshold(self, threshold):
+        """
+Sets the battery level below which a node is considered low. Listeners
+receive "battery_low" and "battery_recovered" events for nodes crossing it.
+
+:param threshold: Battery level threshold
+
+:since: 1.1.0
+        """
+
+        with self:
+            for ( node_id, event_type ) in self._battery_level_index.set_threshold(threshold):
+                self._emit(Event(event_type,
+                                 node_id = node_id,
+                                 battery_level = self._battery_level_index.get_level(node_id),
+                                 threshold = threshold
+                                ))
+            #
+        #
+    #
+
+    def set_coalescing_window(self, attribute_type, window):
+        """
+Sets the coalescing window for attribute change events of the given
+attribute type. Listeners receive at most one change event per window and
+attribute carrying the latest value and the number of skipped updates while
+the registry always holds the latest value.
+
+:param attribute_type: Attribute type name
+:param window: Coalescing window in seconds; 0 to disable coalescing
+
+:since: 1.1.0
+        """
+
+        with self: self._coalescer.set_window(attribute_type, window)
+    #
+
+    def set_node_group_ids(self, node_id, group_ids):
+        """
+Sets the homee groups the given node is a member of. Group aggregates are
+updated accordingly.
+
+:param node_id: homee node ID
+:param group_ids: homee group IDs
+
+:since: 1.1.0
+        """
+
+        with self:
+            group_ids = frozenset(group_ids)
+            previous_group_ids = self._node_group_ids.get(node_id, frozenset())
+
+            if (len(group_ids) > 0): self._node_group_ids[node_id] = group_ids
+            else: self._node_group_ids.pop(node_id, None)
+
+            node = self._nodes.get(node_id)
+
+            if (node is not None): self._aggregates.set_node_group_ids(node, previous_group_ids, group_ids)
+        #
+    #
+
+    def set_dead_band(self, attribute_type, threshold, mode = DEAD_BAND_ABSOLUTE):
+        """
+Sets the dead-band threshold for attribute change events of the given
+attribute type. Changes of numeric values are only notified if the value
+differs from the one notified last by at least the threshold given. The
+registry always holds the latest value.
+
+:param attribute_type: Attribute type name
+:param threshold: Dead-band threshold; 0 to disable the filter
+:param mode: Dead-band threshold mode given as an absolute value or
+             relative to the attribute step value or value range
+
+:since: 1.1.0
+        """
+
+        with self: self._dead_band_filter.set_dead_band(attribute_type, threshold, mode)
+    #
+
+    def _update_battery_level(self, node):
+        """
+Updates the battery level index for the given node and emits an event if
+the level has crossed the threshold.
+
+:param node: Node instance
+
+:since: 1.1.0
+        """
+
+        aggregate = node.get_attribute_aggregate("BatteryLevel")
+        level = (None if (aggregate is None) else aggregate.mean)
+
+        event_type = self._battery_level_index.set_level(node.id, level)
+
+        if (event_type is not None):
+            self._emit(Event(event_type,
+                             node_id = node.id,
+                             battery_level = level,
+                             threshold = self._battery_level_index.threshold
+                            ))
+        #
+    #
+
+    def start_staleness_monitor(self, max_age, interval = None):
+        """
+Starts checking periodically for nodes silent for more than the given time.
+Listeners receive a "node_stale" event once per silence period and a
+"node_active" event if the node is reported again.
+
+:param max_age: Time in seconds a node may be silent
+:param interval: Time in seconds between checks; None for a quarter of the
+                 maximum age
+
+:since: 1.1.0
+        """
+
+        self.stop_staleness_monitor()
+
+        if (interval is None): interval = max_age / 4
+        self._staleness_monitor_task = asyncio.ensure_future(self._monitor_staleness(max_age, interval))
+    #
+
+    def stop_staleness_monitor(self):
+        """
+Stops checking periodically for stale nodes.
+
+:since: 1.1.0
+        """
+
+        if (self._staleness_monitor_task is not None):
+            self._staleness_monitor_task.cancel()
+            self._staleness_monitor_task = None
+        #
+    #
+
+    def _touch_node(self, node):
+        """
+Updates the time the given node has been reported last and emits a
+"node_active" event if it has been stale.
+
+:param node: Node instance
+
+:since: 1.1.0
+        """
+
+        if (self._staleness_index.touch(node.id, node.last_update)):
+            self._emit(Event(EVENT_NODE_ACTIVE, node_id = node.id, last_update = node.last_update))
+        #
+    #
+
     def update_node(self, node):
         """
 Updates a node in this registry.
@@ -171,7 +906,7 @@ Updates a node in this registry.
         if (not isinstance(node, Node)): raise ValueError("Node '{0!r}' given is invalid".format(node))
 
         with self:
-            if (self.is_node_known(node.id)): self._nodes[node.id] = node
+            if (self.is_node_known(node.id)): self._set_node(node)
         #
     #
 
@@ -187,9 +922,68 @@ Updates a node attribute in this registry.
         """
 
         with self:
-            if (self.is_node_known(node_id)):
-                self._nodes[node_id]._update_attribute_value(attribute_id, attribute_value)
+            node = self._nodes.get(node_id)
+            attribute = (None if (node is None) else node.get_attribute_by_id(attribute_id))
+
+            if (attribute is not None):
+                previous_value = attribute.value
+                is_value_changed = node._update_attribute_value(attribute_id, attribute_value)
+
+                if (self.history is not None): self.history.record(node_id, attribute)
+                self._touch_node(node)
+
+                if (is_value_changed):
+                    self._generation += 1
+                    attribute._generation = node._generation = self._generation
+                    self._change_log.append(self._generation, node_id, attribute_id, attribute.value)
+
+                    if (self.shared_snapshot is not None): self._publish_shared_snapshot(node_id, [ attribute ])
+
+                    self._aggregates.update_attribute(node_id, attribute, self._node_group_ids.get(node_id, ( )))
+                    if (attribute.name == "BatteryLevel"): self._update_battery_level(node)
+
+                    # Changes within the dead-band are not notified so events report the value notified last
+                    notified_value = self._dead_band_filter.get_notified_value(node_id, attribute, previous_value)
+
+                    if (self._dead_band_filter.is_change_notified(node_id, attribute, previous_value)):
+                        self._on_attribute_value_changed(node, attribute, notified_value)
+                    #
+                #
+            #
+        #
+    #
+
+    async def wait_for_node(self, node_id, timeout = None):
+        """
+Returns the node for the ID given as soon as it has been registered.
+
+:param node_id: homee node ID
+:param timeout: Time in seconds to wait; None to wait without timeout
+
+:return: (object) Node instance
+:since:  1.1.0
+        """
+
+        with self:
+            node = self._nodes.get(node_id)
+            if (node is not None): return node
+
+            future = asyncio.get_event_loop().create_future()
+
+            if (node_id not in self._node_waiters): self._node_waiters[node_id] = [ ]
+            self._node_waiters[node_id].append(future)
+        #
+
+        try: return await asyncio.wait_for(future, timeout)
+        finally:
+            with self:
+                futures = self._node_waiters.get(node_id)
+
+                if (futures is not None and future in futures):
+                    futures.remove(future)
+                    if (len(futures) < 1): del self._node_waiters[node_id]
+                #
             #
         #
     #
-#
\ No newline at end of file
+#
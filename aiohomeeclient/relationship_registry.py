@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from .item_registry import ItemRegistry
+
+class RelationshipRegistry(ItemRegistry):
+    """
+The "RelationshipRegistry" class holds all homee relationships and maintains
+the group memberships of nodes and the nodes of groups derived from them.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, node_registry = None):
+        """
+Constructor __init__(RelationshipRegistry)
+
+:param node_registry: Nodes registry notified of changed group memberships
+
+:since: 1.1.0
+        """
+
+        ItemRegistry.__init__(self)
+
+        self._group_node_ids = { }
+        """
+homee node IDs per group ID
+        """
+        self._node_group_ids = { }
+        """
+homee group IDs per node ID
+        """
+        self._node_registry = node_registry
+        """
+Nodes registry notified of changed group memberships
+        """
+    #
+
+    def _add_membership(self, relationship):
+        """
+Adds the group membership of the given relationship to the indexes.
+
+:param relationship: Relationship item instance
+
+:return: (int) homee node ID affected; None if not a node relationship
+:since:  1.1.0
+        """
+
+        ( group_id, node_id ) = self._get_membership(relationship)
+
+        if (node_id is not None):
+            self._group_node_ids.setdefault(group_id, set()).add(node_id)
+            self._node_group_ids.setdefault(node_id, set()).add(group_id)
+        #
+
+        return node_id
+    #
+
+    def get_group_ids(self, node_id):
+        """
+Returns the IDs of all groups the given node is a member of.
+
+:param node_id: homee node ID
+
+:return: (frozenset) homee group IDs
+:since:  1.1.0
+        """
+
+        with self: return frozenset(self._node_group_ids.get(node_id, ( )))
+    #
+
+    def _get_membership(self, relationship):
+        """
+Returns the group and node IDs of the given relationship.
+
+:param relationship: Relationship item instance
+
+:return: (tuple) homee group and node IDs; None for both if not a node
+         relationship
+:since:  1.1.0
+        """
+
+        # homee sends null for IDs not used by a relationship
+        group_id = (relationship.get("group_id") or 0)
+        node_id = (relationship.get("node_id") or 0)
+
+        return (( group_id, node_id ) if (group_id > 0 and node_id > 0) else ( None, None ))
+    #
+
+    def get_node_ids(self, group_id):
+        """
+Returns the IDs of all nodes in the given group.
+
+:param group_id: homee group ID
+
+:return: (frozenset) homee node IDs
+:since:  1.1.0
+        """
+
+        with self: return frozenset(self._group_node_ids.get(group_id, ( )))
+    #
+
+    def remove(self, item_id):
+        """
+Removes the relationship with the given ID.
+
+:param item_id: homee relationship ID
+
+:return: (object) Item instance removed; None if not known
+:since:  1.1.0
+        """
+
+        with self:
+            _return = ItemRegistry.remove(self, item_id)
+            if (_return is not None): self._update_node_registry([ self._remove_membership(_return) ])
+        #
+
+        return _return
+    #
+
+    def _remove_membership(self, relationship):
+        """
+Removes the group membership of the given relationship from the indexes.
+
+:param relationship: Relationship item instance
+
+:return: (int) homee node ID affected; None if not a node relationship
+:since:  1.1.0
+        """
+
+        ( group_id, node_id ) = self._get_membership(relationship)
+
+        if (node_id is not None):
+            node_ids = self._group_node_ids.get(group_id)
+
+            if (node_ids is not None):
+                node_ids.discard(node_id)
+                if (len(node_ids) < 1): del self._group_node_ids[group_id]
+            #
+
+            group_ids = self._node_group_ids.get(node_id)
+
+            if (group_ids is not None):
+                group_ids.discard(group_id)
+                if (len(group_ids) < 1): del self._node_group_ids[node_id]
+            #
+        #
+
+        return node_id
+    #
+
+    def set(self, item_dict):
+        """
+Adds or updates the relationship described by the given dictionary.
+
+:param item_dict: Relationship dictionary provided by homee
+
+:return: (object) Item instance
+:since:  1.1.0
+        """
+
+        with self:
+            previous_relationship = self._items.get(item_dict.get("id"))
+            node_ids = [ ]
+
+            if (previous_relationship is not None): node_ids.append(self._remove_membership(previous_relationship))
+
+            _return = ItemRegistry.set(self, item_dict)
+            node_ids.append(self._add_membership(_return))
+
+            self._update_node_registry(node_ids)
+        #
+
+        return _return
+    #
+
+    def set_all(self, item_dicts):
+        """
+Replaces all relationships with the ones described by the given list.
+
+:param item_dicts: List of relationship dictionaries provided by homee
+
+:since: 1.1.0
+        """
+
+        with self:
+            node_ids = list(self._node_group_ids)
+
+            ItemRegistry.set_all(self, item_dicts)
+
+            self._group_node_ids = { }
+            self._node_group_ids = { }
+
+            for relationship in self._items.values(): node_ids.append(self._add_membership(relationship))
+
+            self._update_node_registry(node_ids)
+        #
+    #
+
+    def _update_node_registry(self, node_ids):
+        """
+Passes the group memberships of the given nodes to the nodes registry.
+
+:param node_ids: homee node IDs affected
+
+:since: 1.1.0
+        """
+
+        if (self._node_registry is not None):
+            for node_id in set(node_ids):
+                if (node_id is not None):
+                    self._node_registry.set_node_group_ids(node_id, self._node_group_ids.get(node_id, ( )))
+                #
+            #
+        #
+    #
+#
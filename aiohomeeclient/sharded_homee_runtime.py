@@ -0,0 +1,656 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from functools import partial
+from heapq import merge
+from itertools import count
+from logging import getLogger
+from multiprocessing import cpu_count, get_context
+import asyncio
+
+from .event import Event
+from .homee_manager import HomeeManager
+from .node_snapshot import NodeSnapshot
+
+_LOG = getLogger(__name__)
+"""
+Logger instance
+"""
+
+class HomeeShardWorker(object):
+    """
+The "HomeeShardWorker" class runs the homee sites of one shard with an own
+event loop in a worker process. Events are sent to the parent process in
+batches and queries of the parent process are answered over the same pipe.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    QUERY_METHODS = frozenset([ "get_attribute_type_aggregate",
+                                "get_attribute_values",
+                                "get_battery_levels_below",
+                                "get_lowest_battery_levels",
+                                "get_node_snapshots",
+                                "get_silent_nodes",
+                                "is_site_connected"
+                              ])
+    """
+Methods the parent process may call
+    """
+
+    def __init__(self, pipe, sites):
+        """
+Constructor __init__(HomeeShardWorker)
+
+:param pipe: Worker end of the pipe to the parent process
+:param sites: Site name, address, username, password and keyword argument
+              tuples
+
+:since: 1.1.0
+        """
+
+        self._events = [ ]
+        """
+Event dictionaries not sent yet
+        """
+        self._manager = HomeeManager()
+        """
+Manager of the homee sites of this shard
+        """
+        self._pipe = pipe
+        """
+Worker end of the pipe to the parent process
+        """
+        self._sites = sites
+        """
+Site name, address, username, password and keyword argument tuples
+        """
+        self._stopped = None
+        """
+asyncio event set once the parent process requested to stop
+        """
+    #
+
+    def _flush_events(self):
+        """
+Sends all events queued to the parent process.
+
+:since: 1.1.0
+        """
+
+        events = self._events
+        self._events = [ ]
+
+        if (len(events) > 0): self._pipe.send(( "events", events ))
+    #
+
+    def get_node_snapshots(self):
+        """
+Returns snapshots of all nodes of all sites connected.
+
+:return: (list) Site name and NodeSnapshot instance tuples
+:since:  1.1.0
+        """
+
+        return [ ( site, NodeSnapshot.from_node(node) ) for ( site, node ) in self._manager.get_nodes() ]
+    #
+
+    def _handle_request(self, request):
+        """
+Handles a request received from the parent process.
+
+:param request: Request tuple
+
+:since: 1.1.0
+        """
+
+        if (request[0] == "stop"): self._stopped.set()
+        elif (request[0] == "query"):
+            ( _, request_id, method, args ) = request
+
+            try:
+                if (method not in self.__class__.QUERY_METHODS): raise ValueError("Query '{0}' given is invalid".format(method))
+
+                instance = (self if (method == "get_node_snapshots") else self._manager)
+                self._pipe.send(( "result", request_id, getattr(instance, method)(*args), None ))
+            except Exception as handled_exception:
+                self._pipe.send(( "result", request_id, None, "{0}: {1}".format(type(handled_exception).__name__, handled_exception) ))
+            #
+        #
+    #
+
+    def _on_event(self, event):
+        """
+Queues the given event to be sent to the parent process with all other
+events of the current event loop iteration.
+
+:param event: Event instance
+
+:since: 1.1.0
+        """
+
+        data = event.to_dict()
+        if (isinstance(data.get("exception"), BaseException)): data['exception'] = repr(data['exception'])
+
+        if (len(self._events) < 1): asyncio.get_event_loop().call_soon(self._flush_events)
+        self._events.append(data)
+    #
+
+    def _on_pipe_readable(self):
+        """
+Handles all requests available from the parent process.
+
+:since: 1.1.0
+        """
+
+        try:
+            while self._pipe.poll(): self._handle_request(self._pipe.recv())
+        except EOFError: self._stopped.set()
+    #
+
+    async def run(self):
+        """
+Runs the homee sites of this shard until the parent process requests to
+stop.
+
+:since: 1.1.0
+        """
+
+        self._stopped = asyncio.Event()
+
+        for ( site, address, username, password, kwargs ) in self._sites:
+            self._manager.add_site(site, address, username, password, **kwargs)
+        #
+
+        self._manager.add_listener(self._on_event)
+
+        loop = asyncio.get_event_loop()
+        loop.add_reader(self._pipe.fileno(), self._on_pipe_readable)
+
+        try:
+            async with self._manager: await self._stopped.wait()
+        finally:
+            loop.remove_reader(self._pipe.fileno())
+            self._flush_events()
+        #
+    #
+
+    @staticmethod
+    def main(pipe, sites):
+        """
+Entry point of a worker process.
+
+:param pipe: Worker end of the pipe to the parent process
+:param sites: Site name, address, username, password and keyword argument
+              tuples
+
+:since: 1.1.0
+        """
+
+        try: asyncio.run(HomeeShardWorker(pipe, sites).run())
+        finally: pipe.close()
+    #
+#
+
+class ShardedHomeeRuntime(object):
+    """
+The "ShardedHomeeRuntime" class spreads homee sites across worker
+processes each running its own event loop. Events of all sites are passed
+to listeners in the parent process and queries are answered across all
+shards.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    QUERY_TIMEOUT = 10
+    """
+Timeout in seconds to wait for a query result of a worker process.
+    """
+    START_METHOD = "spawn"
+    """
+multiprocessing start method used for worker processes
+    """
+    STOP_TIMEOUT = 10
+    """
+Timeout in seconds to wait for a worker process to stop.
+    """
+
+    def __init__(self, worker_count = None):
+        """
+Constructor __init__(ShardedHomeeRuntime)
+
+:param worker_count: Number of worker processes; None for the number of
+                     CPUs
+
+:since: 1.1.0
+        """
+
+        self._listeners = [ ]
+        """
+Event listeners and event types they are interested in
+        """
+        self._pending_results = { }
+        """
+Futures waiting for query results per request ID
+        """
+        self._request_ids = count(1)
+        """
+Request ID generator
+        """
+        self._sites = [ ]
+        """
+Site name, address, username, password and keyword argument tuples
+        """
+        self.worker_count = (cpu_count() if (worker_count is None) else worker_count)
+        """
+Number of worker processes
+        """
+        self._workers = [ ]
+        """
+Worker process and parent pipe end tuples
+        """
+    #
+
+    async def __aenter__(self):
+        """
+Enter the runtime context related to this object. It must return an
+awaitable.
+
+:return: (object) Runtime instance
+:since:  1.1.0
+        """
+
+        await self.start()
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+Exit the runtime context related to this object. It must return an
+awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        await self.stop()
+        return False
+    #
+
+    def add_listener(self, callback, event_types = None):
+        """
+Adds a callback called with events of all sites. Each event carries the
+name of its site as "site".
+
+:param callback: Callback receiving the event instance
+:param event_types: Event types the callback is interested in; None for all
+
+:since: 1.1.0
+        """
+
+        self.remove_listener(callback)
+        self._listeners.append(( callback, (None if (event_types is None) else frozenset(event_types)) ))
+    #
+
+    def add_site(self, site, address, username, password, **kwargs):
+        """
+Adds a homee site. Sites must be added before the runtime is started.
+
+:param site: Unique site name
+:param address: homee address to connect to
+:param username: homee user name
+:param password: homee user password
+:param kwargs: Additional keyword arguments for the homee connection
+
+:since: 1.1.0
+        """
+
+        if (len(self._workers) > 0): raise RuntimeError("Sites can not be added to a running runtime")
+        if (site in [ entry[0] for entry in self._sites ]): raise ValueError("Site '{0}' given is already managed".format(site))
+
+        self._sites.append(( site, address, username, password, kwargs ))
+    #
+
+    def _emit(self, event):
+        """
+Passes the given event to all listeners interested in its type.
+
+:param event: Event instance
+
+:since: 1.1.0
+        """
+
+        for ( callback, event_types ) in self._listeners[:]:
+            if (event_types is None or event.type in event_types):
+                try: callback(event)
+                except Exception: _LOG.exception("Event listener {0!r} failed".format(callback))
+            #
+        #
+    #
+
+    async def get_attribute_type_aggregate(self, attribute_type):
+        """
+Returns the aggregate of all attributes of the given type across all sites
+connected.
+
+:param attribute_type: Attribute type name
+
+:return: (dict) Count, sum, minimum, maximum and mean values
+:since:  1.1.0
+        """
+
+        _return = { "count": 0, "sum": 0, "min": None, "max": None, "mean": None }
+
+        for aggregate in await self._query_all("get_attribute_type_aggregate", attribute_type):
+            if (aggregate['count'] < 1): continue
+
+            _return['count'] += aggregate['count']
+            _return['sum'] += aggregate['sum']
+
+            if (_return['min'] is None or aggregate['min'] < _return['min']): _return['min'] = aggregate['min']
+            if (_return['max'] is None or aggregate['max'] > _return['max']): _return['max'] = aggregate['max']
+        #
+
+        if (_return['count'] > 0): _return['mean'] = _return['sum'] / _return['count']
+
+        return _return
+    #
+
+    async def get_attribute_values(self, keys, default = None):
+        """
+Returns the values of the given node attributes. Keys are tuples of the
+site name, the node ID, the attribute type name and optionally the
+attribute instance.
+
+:param keys: List of site name, node ID, attribute type name and instance
+             tuples
+:param default: Default value if a site, node or attribute is not available
+
+:return: (list) Attribute values in the order of the keys given
+:since:  1.1.0
+        """
+
+        _return = [ default ] * len(keys)
+
+        shard_keys = { }
+        shards = self._get_shards()
+
+        for ( position, key ) in enumerate(keys):
+            if (key[0] in shards): shard_keys.setdefault(shards[key[0]], [ ]).append(( position, key ))
+        #
+
+        shard_indexes = list(shard_keys)
+
+        results = await asyncio.gather(*[ self._query(shard_index, "get_attribute_values", [ key for ( _, key ) in shard_keys[shard_index] ], default)
+                                          for shard_index in shard_indexes
+                                        ])
+
+        for ( shard_index, values ) in zip(shard_indexes, results):
+            for ( ( position, _ ), value ) in zip(shard_keys[shard_index], values): _return[position] = value
+        #
+
+        return _return
+    #
+
+    async def get_battery_levels_below(self, threshold = None):
+        """
+Returns the nodes with battery levels below the given threshold across all
+sites connected sorted ascending.
+
+:param threshold: Battery level threshold; None for the configured ones
+
+:return: (list) Site name, node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        results = await self._query_all("get_battery_levels_below", threshold)
+        return list(merge(*results, key = ShardedHomeeRuntime._get_last_item))
+    #
+
+    async def get_lowest_battery_levels(self, count):
+        """
+Returns the given number of nodes with the lowest battery levels across all
+sites connected sorted ascending.
+
+:param count: Number of nodes
+
+:return: (list) Site name, node ID and battery level tuples
+:since:  1.1.0
+        """
+
+        results = await self._query_all("get_lowest_battery_levels", count)
+        return list(merge(*results, key = ShardedHomeeRuntime._get_last_item))[:count]
+    #
+
+    async def get_node_snapshots(self):
+        """
+Returns snapshots of all nodes of all sites connected.
+
+:return: (list) Site name and NodeSnapshot instance tuples
+:since:  1.1.0
+        """
+
+        _return = [ ]
+        for result in await self._query_all("get_node_snapshots"): _return += result
+
+        return _return
+    #
+
+    def _get_shards(self):
+        """
+Returns the index of the worker process per site name.
+
+:return: (dict) Worker process index per site name
+:since:  1.1.0
+        """
+
+        return { entry[0]: ( position % self.worker_count ) for ( position, entry ) in enumerate(self._sites) }
+    #
+
+    async def get_silent_nodes(self, max_age):
+        """
+Returns the nodes silent for more than the given time across all sites
+connected ordered by silence descending.
+
+:param max_age: Time in seconds
+
+:return: (list) Site name, node ID and monotonic clock time tuples
+:since:  1.1.0
+        """
+
+        results = await self._query_all("get_silent_nodes", max_age)
+        return list(merge(*results, key = ShardedHomeeRuntime._get_last_item))
+    #
+
+    async def is_site_connected(self, site):
+        """
+Returns true if the given site is connected.
+
+:param site: Site name
+
+:return: (bool) True if connected
+:since:  1.1.0
+        """
+
+        shard_index = self._get_shards().get(site)
+        return (False if (shard_index is None) else await self._query(shard_index, "is_site_connected", site))
+    #
+
+    def _on_pipe_readable(self, shard_index):
+        """
+Handles all messages available from the given worker process.
+
+:param shard_index: Worker process index
+
+:since: 1.1.0
+        """
+
+        pipe = self._workers[shard_index][1]
+
+        try:
+            while pipe.poll():
+                message = pipe.recv()
+
+                if (message[0] == "events"):
+                    for data in message[1]: self._emit(Event(data.pop("type"), **data))
+                elif (message[0] == "result"):
+                    ( _, request_id, result, error ) = message
+                    ( _, future ) = self._pending_results.pop(request_id, ( None, None ))
+
+                    if (future is not None and (not future.done())):
+                        if (error is None): future.set_result(result)
+                        else: future.set_exception(RuntimeError(error))
+                    #
+                #
+            #
+        except EOFError:
+            asyncio.get_event_loop().remove_reader(pipe.fileno())
+
+            for ( request_id, ( future_shard_index, future ) ) in list(self._pending_results.items()):
+                if (future_shard_index == shard_index and (not future.done())):
+                    future.set_exception(ConnectionResetError("Worker process has been stopped"))
+                #
+            #
+        #
+    #
+
+    async def _query(self, shard_index, method, *args):
+        """
+Calls the given query method in the given worker process.
+
+:param shard_index: Worker process index
+:param method: Query method name
+:param args: Query arguments
+
+:return: (mixed) Query result
+:since:  1.1.0
+        """
+
+        request_id = next(self._request_ids)
+        future = asyncio.get_event_loop().create_future()
+
+        self._pending_results[request_id] = ( shard_index, future )
+
+        try:
+            self._workers[shard_index][1].send(( "query", request_id, method, args ))
+            return await asyncio.wait_for(future, self.__class__.QUERY_TIMEOUT)
+        finally: self._pending_results.pop(request_id, None)
+    #
+
+    async def _query_all(self, method, *args):
+        """
+Calls the given query method in all worker processes.
+
+:param method: Query method name
+:param args: Query arguments
+
+:return: (list) Query results per worker process
+:since:  1.1.0
+        """
+
+        return await asyncio.gather(*[ self._query(shard_index, method, *args) for shard_index in range(len(self._workers)) ])
+    #
+
+    def remove_listener(self, callback):
+        """
+Removes a callback previously added.
+
+:param callback: Callback receiving the event instance
+
+:since: 1.1.0
+        """
+
+        for listener in self._listeners[:]:
+            if (listener[0] == callback): self._listeners.remove(listener)
+        #
+    #
+
+    async def start(self):
+        """
+Starts the worker processes connecting all sites.
+
+:since: 1.1.0
+        """
+
+        if (len(self._workers) > 0): return
+
+        context = get_context(self.__class__.START_METHOD)
+        loop = asyncio.get_event_loop()
+
+        shard_sites = [ [ ] for _ in range(self.worker_count) ]
+        shards = self._get_shards()
+
+        for entry in self._sites: shard_sites[shards[entry[0]]].append(entry)
+
+        for sites in shard_sites:
+            if (len(sites) < 1): continue
+
+            ( parent_pipe, worker_pipe ) = context.Pipe()
+
+            process = context.Process(target = HomeeShardWorker.main, args = ( worker_pipe, sites ), daemon = True)
+            process.start()
+
+            worker_pipe.close()
+
+            loop.add_reader(parent_pipe.fileno(), partial(self._on_pipe_readable, len(self._workers)))
+            self._workers.append(( process, parent_pipe ))
+        #
+    #
+
+    async def stop(self):
+        """
+Requests all worker processes to disconnect their sites and waits for them
+to exit.
+
+:since: 1.1.0
+        """
+
+        loop = asyncio.get_event_loop()
+
+        for ( process, pipe ) in self._workers:
+            try: pipe.send(( "stop", ))
+            except OSError: pass
+        #
+
+        for ( process, pipe ) in self._workers:
+            await loop.run_in_executor(None, process.join, self.__class__.STOP_TIMEOUT)
+            if (process.is_alive()): process.terminate()
+
+            loop.remove_reader(pipe.fileno())
+            pipe.close()
+        #
+
+        self._workers = [ ]
+    #
+
+    @staticmethod
+    def _get_last_item(entry):
+        """
+Returns the last item of the given tuple used as the sort key.
+
+:param entry: Tuple
+
+:return: (mixed) Last item
+:since:  1.1.0
+        """
+
+        return entry[-1]
+    #
+#
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from numbers import Number
+from struct import Struct
+from time import sleep, time
+import os
+
+try: import numpy
+except ImportError: numpy = None
+
+HEADER = Struct("<QQQ")
+"""
+Table header of the sequence number, the number of rows used and the row
+capacity
+"""
+ROW = Struct("<qqqdd")
+"""
+Table row of the node ID, attribute ID, attribute type ID, value and
+timestamp
+"""
+ROW_DTYPE = (None
+             if (numpy is None) else
+             numpy.dtype([ ( "node_id", "<i8" ),
+                           ( "attribute_id", "<i8" ),
+                           ( "type", "<i8" ),
+                           ( "value", "<f8" ),
+                           ( "timestamp", "<f8" )
+                         ])
+            )
+"""
+NumPy structured data type of a table row
+"""
+
+_created_names = set()
+"""
+Names of the shared memory blocks created by tables of this process
+"""
+
+class SharedSnapshotTable(object):
+    """
+The "SharedSnapshotTable" class publishes attribute values to a fixed
+layout shared memory table. Each attribute is assigned a row once. Writers
+make the sequence number in the header odd while updating, so readers in
+other processes detect and retry torn reads without taking a lock.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, name = None, capacity = 4096):
+        """
+Constructor __init__(SharedSnapshotTable)
+
+:param name: Shared memory block name; None for a random one
+:param capacity: Maximum number of attribute rows
+
+:since: 1.1.0
+        """
+
+        if (capacity < 1): raise ValueError("Capacity '{0!r}' given is invalid".format(capacity))
+
+        self.capacity = capacity
+        """
+Maximum number of attribute rows
+        """
+        self._memory = SharedMemory(name, True, HEADER.size + ROW.size * capacity)
+        """
+Shared memory block of the table
+        """
+        self._rows = { }
+        """
+Row number per node ID and attribute ID
+        """
+        self._sequence = 0
+        """
+Sequence number incremented before and after each update
+        """
+
+        HEADER.pack_into(self._memory.buf, 0, 0, 0, capacity)
+        _created_names.add(self._memory.name)
+    #
+
+    @property
+    def name(self):
+        """
+Returns the shared memory block name readers attach to.
+
+:return: (str) Shared memory block name
+:since:  1.1.0
+        """
+
+        return self._memory.name
+    #
+
+    def close(self):
+        """
+Closes and unlinks the shared memory block.
+
+:since: 1.1.0
+        """
+
+        if (self._memory is not None):
+            _created_names.discard(self._memory.name)
+
+            self._memory.close()
+            self._memory.unlink()
+
+            self._memory = None
+        #
+    #
+
+    def publish_attribute(self, node_id, attribute, timestamp = None):
+        """
+Publishes the current value of the given attribute.
+
+:param node_id: homee node ID
+:param attribute: Attribute instance
+:param timestamp: UNIX timestamp of the value; None for now
+
+:return: (bool) True if published; false if the table is full
+:since:  1.1.0
+        """
+
+        return self.publish_attributes(node_id, [ attribute ], timestamp)
+    #
+
+    def publish_attributes(self, node_id, attributes, timestamp = None):
+        """
+Publishes the current values of the given attributes as one update.
+
+:param node_id: homee node ID
+:param attributes: Attribute instances
+:param timestamp: UNIX timestamp of the values; None for now
+
+:return: (bool) True if all attributes have been published; false if the
+         table is full
+:since:  1.1.0
+        """
+
+        _return = True
+
+        if (timestamp is None): timestamp = time()
+
+        buffer = self._memory.buf
+        row_count = len(self._rows)
+
+        self._sequence += 1
+        HEADER.pack_into(buffer, 0, self._sequence, row_count, self.capacity)
+
+        for attribute in attributes:
+            key = ( node_id, attribute.id )
+            row = self._rows.get(key)
+
+            if (row is None):
+                if (row_count >= self.capacity):
+                    _return = False
+                    continue
+                #
+
+                row = row_count
+                row_count += 1
+
+                self._rows[key] = row
+            #
+
+            value = attribute.value
+            if (not isinstance(value, Number)): value = float("nan")
+
+            ROW.pack_into(buffer, HEADER.size + ROW.size * row, node_id, attribute.id, attribute['type'], value, timestamp)
+        #
+
+        self._sequence += 1
+        HEADER.pack_into(buffer, 0, self._sequence, row_count, self.capacity)
+
+        return _return
+    #
+#
+
+class SharedSnapshotReader(object):
+    """
+The "SharedSnapshotReader" class reads consistent copies of a shared
+memory table published by "SharedSnapshotTable" in another process.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, name):
+        """
+Constructor __init__(SharedSnapshotReader)
+
+:param name: Shared memory block name
+
+:since: 1.1.0
+        """
+
+        self._memory = SharedSnapshotReader._attach(name)
+        """
+Shared memory block of the table
+        """
+        self._rows = { }
+        """
+Row number per node ID and attribute ID known
+        """
+    #
+
+    def close(self):
+        """
+Detaches from the shared memory block.
+
+:since: 1.1.0
+        """
+
+        if (self._memory is not None):
+            self._memory.close()
+            self._memory = None
+        #
+    #
+
+    def get_value(self, node_id, attribute_id):
+        """
+Returns the value and timestamp published for the given attribute.
+
+:param node_id: homee node ID
+:param attribute_id: homee attribute ID
+
+:return: (tuple) Value and UNIX timestamp; None if not published
+:since:  1.1.0
+        """
+
+        key = ( node_id, attribute_id )
+
+        if (key not in self._rows):
+            for ( row, entry ) in enumerate(self.read()): self._rows[( entry[0], entry[1] )] = row
+        #
+
+        row = self._rows.get(key)
+        if (row is None): return None
+
+        offset = HEADER.size + ROW.size * row
+
+        while True:
+            sequence = self._read_sequence()
+            entry = ROW.unpack_from(self._memory.buf, offset)
+
+            if (HEADER.unpack_from(self._memory.buf, 0)[0] == sequence): break
+        #
+
+        return ( entry[3], entry[4] )
+    #
+
+    def read(self, as_numpy = False):
+        """
+Returns a consistent copy of all rows published.
+
+:param as_numpy: True to return a NumPy structured array
+
+:return: (mixed) List of node ID, attribute ID, attribute type ID, value and
+         timestamp tuples or NumPy structured array
+:since:  1.1.0
+        """
+
+        if (as_numpy and numpy is None): raise RuntimeError("NumPy is not available")
+
+        buffer = self._memory.buf
+
+        while True:
+            sequence = self._read_sequence()
+            row_count = HEADER.unpack_from(buffer, 0)[1]
+
+            data = bytes(buffer[HEADER.size:HEADER.size + ROW.size * row_count])
+
+            if (HEADER.unpack_from(buffer, 0)[0] == sequence): break
+        #
+
+        return (numpy.frombuffer(data, dtype = ROW_DTYPE)
+                if (as_numpy) else
+                list(ROW.iter_unpack(data))
+               )
+    #
+
+    def _read_sequence(self):
+        """
+Returns the sequence number of the table once no update is in progress.
+
+:return: (int) Sequence number
+:since:  1.1.0
+        """
+
+        while True:
+            _return = HEADER.unpack_from(self._memory.buf, 0)[0]
+
+            if (_return % 2 == 0): break
+            sleep(0)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _attach(name):
+        """
+Attaches to the given shared memory block without letting the resource
+tracker of this process unlink it on exit.
+
+:param name: Shared memory block name
+
+:return: (object) Shared memory block
+:since:  1.1.0
+        """
+
+        try: _return = SharedMemory(name, track = False)
+        except TypeError:
+            _return = SharedMemory(name)
+
+            # Python < 3.13 registers blocks attached to with the resource tracker as well
+            if (os.name == "posix" and _return.name not in _created_names):
+                resource_tracker.unregister(_return._name, "shared_memory")
+            #
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import OrderedDict
+from time import monotonic
+
+class StalenessIndex(object):
+    """
+The "StalenessIndex" class keeps node IDs ordered by the time they have
+been reported last. Nodes silent for a given time are found by only visiting
+the ones silent.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(StalenessIndex)
+
+:since: 1.1.0
+        """
+
+        self._last_updates = OrderedDict()
+        """
+Monotonic clock time of the last update per node ID ordered ascending
+        """
+        self._stale_node_ids = set()
+        """
+Node IDs reported as stale
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of nodes indexed
+:since:  1.1.0
+        """
+
+        return len(self._last_updates)
+    #
+
+    def get_last_update(self, node_id):
+        """
+Returns the monotonic clock time the given node has been reported last.
+
+:param node_id: homee node ID
+
+:return: (float) Monotonic clock time; None if not indexed
+:since:  1.1.0
+        """
+
+        return self._last_updates.get(node_id)
+    #
+
+    def get_silent(self, max_age, now = None):
+        """
+Returns the node IDs and times of the last update for nodes silent for
+more than the given time ordered by silence descending.
+
+:param max_age: Time in seconds
+:param now: Monotonic clock time to compare with; None for now
+
+:return: (list) Node ID and monotonic clock time tuples
+:since:  1.1.0
+        """
+
+        if (now is None): now = monotonic()
+
+        limit = now - max_age
+        _return = [ ]
+
+        for ( node_id, last_update ) in self._last_updates.items():
+            if (last_update >= limit): break
+            _return.append(( node_id, last_update ))
+        #
+
+        return _return
+    #
+
+    def remove(self, node_id):
+        """
+Removes the given node ID.
+
+:param node_id: homee node ID
+
+:since: 1.1.0
+        """
+
+        self._last_updates.pop(node_id, None)
+        self._stale_node_ids.discard(node_id)
+    #
+
+    def touch(self, node_id, last_update = None):
+        """
+Sets the time the given node has been reported last.
+
+:param node_id: homee node ID
+:param last_update: Monotonic clock time; None for now
+
+:return: (bool) True if the node has been reported as stale before
+:since:  1.1.0
+        """
+
+        if (last_update is None): last_update = monotonic()
+
+        self._last_updates[node_id] = last_update
+        self._last_updates.move_to_end(node_id)
+
+        _return = (node_id in self._stale_node_ids)
+        if (_return): self._stale_node_ids.discard(node_id)
+
+        return _return
+    #
+
+    def update_stale(self, max_age, now = None):
+        """
+Marks all nodes silent for more than the given time as stale and returns
+the ones newly marked.
+
+:param max_age: Time in seconds
+:param now: Monotonic clock time to compare with; None for now
+
+:return: (list) Node ID and monotonic clock time tuples newly marked
+:since:  1.1.0
+        """
+
+        _return = [ ]
+
+        for ( node_id, last_update ) in self.get_silent(max_age, now):
+            if (node_id not in self._stale_node_ids):
+                self._stale_node_ids.add(node_id)
+                _return.append(( node_id, last_update ))
+            #
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from json import dumps as dumpJson
+
+from aiohttp import web
+
+class StateCacheServer(object):
+    """
+The "StateCacheServer" class serves the registry of one shared homee
+connection as JSON over HTTP. Responses carry ETags derived from registry
+generations to answer conditional requests without a body.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    DEFAULT_PORT = 8765
+    """
+Default TCP port to listen on
+    """
+
+    def __init__(self, homee, host = "127.0.0.1", port = None):
+        """
+Constructor __init__(StateCacheServer)
+
+:param homee: Homee instance to serve the registry of
+:param host: Host address to listen on
+:param port: TCP port to listen on
+
+:since: 1.1.0
+        """
+
+        self._homee = homee
+        """
+Homee instance to serve the registry of
+        """
+        self.host = host
+        """
+Host address to listen on
+        """
+        self._node_bodies = { }
+        """
+ETag and JSON body served last per node ID
+        """
+        self._nodes_body = ( None, None )
+        """
+ETag and JSON body of all nodes served last
+        """
+        self.port = (self.__class__.DEFAULT_PORT if (port is None) else port)
+        """
+TCP port to listen on
+        """
+        self._runner = None
+        """
+aiohttp application runner
+        """
+    #
+
+    async def __aenter__(self):
+        """
+Enter the runtime context related to this object. It must return an
+awaitable.
+
+:return: (object) Server instance
+:since:  1.1.0
+        """
+
+        await self.start()
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+Exit the runtime context related to this object. It must return an
+awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        await self.stop()
+        return False
+    #
+
+    def _get_etag(self, registry, generation, *args):
+        """
+Returns the ETag for the given registry generation. The registry epoch is
+part of it as generations restart for each new connection.
+
+:param registry: Nodes registry instance
+:param generation: Registry generation
+:param args: Additional request parameters the response depends on
+
+:return: (str) ETag
+:since:  1.1.0
+        """
+
+        return "\"{0}\"".format("-".join([ registry.epoch, str(generation) ] + [ str(value) for value in args ]))
+    #
+
+    def _get_response(self, request, etag, body):
+        """
+Returns the response for the given ETag and JSON body. Conditional requests
+matching the ETag get an empty "304 Not Modified" response.
+
+:param request: aiohttp request instance
+:param etag: ETag of the current state
+:param body: JSON body of the current state
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        headers = { "Cache-Control": "no-cache", "ETag": etag, "X-Registry-Epoch": self._homee.registry.epoch }
+
+        return (web.Response(status = 304, headers = headers)
+                if (self._is_not_modified(request, etag)) else
+                web.Response(text = body, content_type = "application/json", headers = headers)
+               )
+    #
+
+    async def _handle_changes(self, request):
+        """
+Handles requests for the changes since the generation given as the "since"
+query parameter. A full resync is required if changes are not available for
+it or if it belongs to another registry epoch than the one given as the
+"epoch" query parameter.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        try: generation = int(request.query.get("since", 0))
+        except ValueError: raise web.HTTPBadRequest()
+
+        epoch = request.query.get("epoch")
+        registry = self._homee.registry
+
+        with registry:
+            current_generation = registry.generation
+
+            changes = (None
+                       if ((epoch is not None and epoch != registry.epoch) or generation > current_generation) else
+                       registry.get_changes_since(generation)
+                      )
+
+            etag = self._get_etag(registry, current_generation, generation)
+        #
+
+        if (changes is None):
+            return web.Response(status = 410,
+                                text = dumpJson({ "resync": True, "epoch": registry.epoch, "generation": current_generation }),
+                                content_type = "application/json"
+                               )
+        #
+
+        return self._get_response(request,
+                                  etag,
+                                  dumpJson({ "epoch": registry.epoch, "generation": current_generation, "changes": changes })
+                                 )
+    #
+
+    async def _handle_node(self, request):
+        """
+Handles requests for a single node.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        try: node_id = int(request.match_info['node_id'])
+        except ValueError: raise web.HTTPNotFound()
+
+        registry = self._homee.registry
+
+        with registry:
+            node = registry.get_node(node_id)
+            if (node is None): raise web.HTTPNotFound()
+
+            etag = self._get_etag(registry, node.generation)
+            ( cached_etag, body ) = self._node_bodies.get(node_id, ( None, None ))
+
+            if (cached_etag != etag and not self._is_not_modified(request, etag)):
+                body = dumpJson(node.to_dict())
+                self._node_bodies[node_id] = ( etag, body )
+            #
+        #
+
+        return self._get_response(request, etag, body)
+    #
+
+    async def _handle_nodes(self, request):
+        """
+Handles requests for all nodes.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        registry = self._homee.registry
+
+        with registry:
+            etag = self._get_etag(registry, registry.generation)
+            ( cached_etag, body ) = self._nodes_body
+
+            if (cached_etag != etag and not self._is_not_modified(request, etag)):
+                body = dumpJson([ node.to_dict() for node in sorted(registry.get_nodes(), key = StateCacheServer._get_node_id) ])
+                self._nodes_body = ( etag, body )
+            #
+        #
+
+        return self._get_response(request, etag, body)
+    #
+
+    def _is_not_modified(self, request, etag):
+        """
+Returns true if the given request is conditional and matches the given
+ETag.
+
+:param request: aiohttp request instance
+:param etag: ETag of the current state
+
+:return: (bool) True if not modified
+:since:  1.1.0
+        """
+
+        if_none_match = request.headers.get("If-None-Match")
+
+        return (if_none_match is not None
+                and (if_none_match.strip() == "*" or etag in [ value.strip() for value in if_none_match.split(",") ])
+               )
+    #
+
+    async def start(self):
+        """
+Connects to homee if required and starts serving HTTP requests.
+
+:since: 1.1.0
+        """
+
+        if (not self._homee.is_connected): await self._homee.connect()
+
+        application = web.Application()
+        application.router.add_get("/changes", self._handle_changes)
+        application.router.add_get("/nodes", self._handle_nodes)
+        application.router.add_get("/nodes/{node_id}", self._handle_node)
+
+        self._runner = web.AppRunner(application)
+        await self._runner.setup()
+
+        await web.TCPSite(self._runner, self.host, self.port).start()
+    #
+
+    async def stop(self):
+        """
+Stops serving HTTP requests. The homee connection is left open.
+
+:since: 1.1.0
+        """
+
+        if (self._runner is not None):
+            await self._runner.cleanup()
+            self._runner = None
+        #
+
+        self._node_bodies = { }
+        self._nodes_body = ( None, None )
+    #
+
+    @staticmethod
+    def _get_node_id(node):
+        """
+Returns the ID of the given node.
+
+:param node: Node instance
+
+:return: (int) homee node ID
+:since:  1.1.0
+        """
+
+        return node.id
+    #
+#
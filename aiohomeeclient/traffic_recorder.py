@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from os import path
+from struct import Struct
+from time import time
+
+DIRECTION_INBOUND = 0
+"""
+Direction of a frame received from homee
+"""
+DIRECTION_OUTBOUND = 1
+"""
+Direction of a frame sent to homee
+"""
+FILE_MAGIC = b"AHTR"
+"""
+Magic bytes at the beginning of a recording file
+"""
+FILE_VERSION = 1
+"""
+Version of the recording file format
+"""
+HEADER = Struct("<4sB")
+"""
+File header layout: magic bytes and format version
+"""
+RECORD = Struct("<dBI")
+"""
+Record header layout: UNIX timestamp, direction and size of the UTF-8 frame
+data following
+"""
+
+class TrafficRecorder(object):
+    """
+The "TrafficRecorder" class appends websocket frames together with their
+direction and the time they have been received or sent to a compact binary
+recording file.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, file_path):
+        """
+Constructor __init__(TrafficRecorder)
+
+:param file_path: Recording file path to append to
+
+:since: 1.1.0
+        """
+
+        is_new = (not path.exists(file_path) or path.getsize(file_path) < 1)
+
+        if (not is_new): TrafficReader.check_header(file_path)
+
+        self._file = open(file_path, "ab")
+        """
+Recording file object appended to
+        """
+        self.record_count = 0
+        """
+Number of frames recorded by this instance
+        """
+
+        if (is_new): self._file.write(HEADER.pack(FILE_MAGIC, FILE_VERSION))
+        else:
+            # Records appended after an incomplete one left by an interrupted recording could not be read
+            complete_size = TrafficReader.get_complete_size(file_path)
+            if (path.getsize(file_path) > complete_size): self._file.truncate(complete_size)
+        #
+    #
+
+    def __enter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:return: (object) Recorder instance
+:since:  1.1.0
+        """
+
+        return self
+    #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        self.close()
+        return False
+    #
+
+    def close(self):
+        """
+Flushes and closes the recording file.
+
+:since: 1.1.0
+        """
+
+        if (self._file is not None):
+            self._file.close()
+            self._file = None
+        #
+    #
+
+    def flush(self):
+        """
+Writes all frames buffered to the recording file.
+
+:since: 1.1.0
+        """
+
+        if (self._file is not None): self._file.flush()
+    #
+
+    def record(self, direction, data, timestamp = None):
+        """
+Appends the given frame to the recording file. Frames are ignored after
+the recorder has been closed.
+
+:param direction: Frame direction
+:param data: Text frame data
+:param timestamp: UNIX timestamp; None for now
+
+:since: 1.1.0
+        """
+
+        if (self._file is not None):
+            data = data.encode("utf-8")
+
+            self._file.write(RECORD.pack((time() if (timestamp is None) else timestamp), direction, len(data)))
+            self._file.write(data)
+
+            self.record_count += 1
+        #
+    #
+
+    def record_inbound(self, data):
+        """
+Appends the given frame received from homee to the recording file.
+
+:param data: Text frame data
+
+:since: 1.1.0
+        """
+
+        self.record(DIRECTION_INBOUND, data)
+    #
+
+    def record_outbound(self, data):
+        """
+Appends the given frame sent to homee to the recording file.
+
+:param data: Text frame data
+
+:since: 1.1.0
+        """
+
+        self.record(DIRECTION_OUTBOUND, data)
+    #
+#
+
+class TrafficReader(object):
+    """
+The "TrafficReader" class iterates the frames of a recording file in the
+order recorded. An incomplete last record left by an interrupted recording
+is ignored.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, file_path):
+        """
+Constructor __init__(TrafficReader)
+
+:param file_path: Recording file path to read
+
+:since: 1.1.0
+        """
+
+        self.file_path = file_path
+        """
+Recording file path to read
+        """
+
+        TrafficReader.check_header(file_path)
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator of UNIX timestamp, direction and frame data
+         tuples
+:since:  1.1.0
+        """
+
+        return self._read()
+    #
+
+    def _read(self):
+        """
+Reads all records of the recording file.
+
+:since: 1.1.0
+        """
+
+        with open(self.file_path, "rb") as file_object:
+            file_object.seek(HEADER.size)
+
+            while True:
+                record_header = file_object.read(RECORD.size)
+                if (len(record_header) < RECORD.size): break
+
+                ( timestamp, direction, size ) = RECORD.unpack(record_header)
+
+                data = file_object.read(size)
+                if (len(data) < size): break
+
+                yield ( timestamp, direction, data.decode("utf-8") )
+            #
+        #
+    #
+
+    @staticmethod
+    def check_header(file_path):
+        """
+Checks the header of the given recording file.
+
+:param file_path: Recording file path
+
+:since: 1.1.0
+        """
+
+        with open(file_path, "rb") as file_object: header = file_object.read(HEADER.size)
+
+        if (len(header) < HEADER.size or HEADER.unpack(header)[0] != FILE_MAGIC):
+            raise ValueError("File '{0}' is not a traffic recording".format(file_path))
+        #
+
+        if (HEADER.unpack(header)[1] != FILE_VERSION):
+            raise ValueError("Traffic recording version '{0:d}' is not supported".format(HEADER.unpack(header)[1]))
+        #
+    #
+
+    @staticmethod
+    def get_complete_size(file_path):
+        """
+Returns the size of the given recording file up to the end of the last
+complete record.
+
+:param file_path: Recording file path
+
+:return: (int) Size in bytes
+:since:  1.1.0
+        """
+
+        _return = HEADER.size
+        file_size = path.getsize(file_path)
+
+        with open(file_path, "rb") as file_object:
+            file_object.seek(_return)
+
+            while True:
+                record_header = file_object.read(RECORD.size)
+                if (len(record_header) < RECORD.size): break
+
+                record_end = _return + RECORD.size + RECORD.unpack(record_header)[2]
+                if (record_end > file_size): break
+
+                _return = record_end
+                file_object.seek(_return)
+            #
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+import asyncio
+
+from aiohttp import WSMessage, WSMsgType
+
+from .traffic_recorder import DIRECTION_INBOUND, TrafficReader
+
+class ReplaySocket(object):
+    """
+The "ReplaySocket" class provides the frames received from homee of a
+recording in place of a homee websocket connection. Frames sent are
+discarded.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, records, speed = None):
+        """
+Constructor __init__(ReplaySocket)
+
+:param records: Iterable of UNIX timestamp, direction and frame data tuples
+:param speed: Factor of the original speed to replay with; None to replay
+              as fast as possible
+
+:since: 1.1.0
+        """
+
+        self.closed = False
+        """
+True if the socket has been closed
+        """
+        self._first_timestamp = None
+        """
+UNIX timestamp of the first frame replayed
+        """
+        self.received_count = 0
+        """
+Number of frames replayed
+        """
+        self._records = iter(records)
+        """
+Iterator of the records to replay
+        """
+        self.sent_count = 0
+        """
+Number of frames sent and discarded
+        """
+        self.speed = speed
+        """
+Factor of the original speed to replay with
+        """
+        self._start_time = None
+        """
+Event loop time the first frame has been replayed
+        """
+    #
+
+    async def close(self):
+        """
+Closes the socket.
+
+:since: 1.1.0
+        """
+
+        self.closed = True
+    #
+
+    async def receive(self):
+        """
+Returns the next frame received from homee in the recording. Frames are
+delayed to match the recorded timing if a speed has been given.
+
+:return: (object) aiohttp websocket message
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (not self.closed):
+            for ( timestamp, direction, data ) in self._records:
+                if (direction != DIRECTION_INBOUND): continue
+
+                if (self.speed):
+                    loop = asyncio.get_event_loop()
+
+                    if (self._first_timestamp is None):
+                        self._first_timestamp = timestamp
+                        self._start_time = loop.time()
+                    #
+
+                    delay = (timestamp - self._first_timestamp) / self.speed - (loop.time() - self._start_time)
+                    if (delay > 0): await asyncio.sleep(delay)
+                #
+
+                if (not self.closed):
+                    self.received_count += 1
+                    _return = WSMessage(WSMsgType.TEXT, data, None)
+                #
+
+                break
+            #
+        #
+
+        if (_return is None):
+            _return = (WSMessage(WSMsgType.CLOSED, None, None)
+                       if (self.closed) else
+                       WSMessage(WSMsgType.CLOSE, None, None)
+                      )
+        #
+
+        return _return
+    #
+
+    async def send_str(self, data):
+        """
+Discards the given frame sent to homee.
+
+:param data: Text frame data
+
+:since: 1.1.0
+        """
+
+        if (self.closed): raise ConnectionResetError("Connection has been closed")
+        self.sent_count += 1
+    #
+#
+
+class TrafficReplayer(object):
+    """
+The "TrafficReplayer" class feeds the frames received from homee of a
+recording into a homee connection. The connection state stays readable
+after the replay has finished until it is disconnected.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, file_path, speed = None):
+        """
+Constructor __init__(TrafficReplayer)
+
+:param file_path: Recording file path to replay
+:param speed: Factor of the original speed to replay with; None to replay
+              as fast as possible
+
+:since: 1.1.0
+        """
+
+        self._reader = TrafficReader(file_path)
+        """
+Reader of the recording file
+        """
+        self.speed = speed
+        """
+Factor of the original speed to replay with
+        """
+    #
+
+    async def replay(self, connection):
+        """
+Replays the recording into the given homee connection not connected and
+returns after all frames have been handled.
+
+:param connection: homee connection instance
+
+:return: (int) Number of frames replayed
+:since:  1.1.0
+        """
+
+        socket = ReplaySocket(self._reader, self.speed)
+        await connection.connect_socket(socket)
+
+        # This waiter is only resolved with the exception raised once all frames have been handled
+        future = connection.create_message_waiter(predicate = self._is_never_expected)
+
+        try: await future
+        except ConnectionResetError: pass
+
+        return socket.received_count
+    #
+
+    @staticmethod
+    def _is_never_expected(message):
+        """
+Returns false for all messages.
+
+:param message: Message dictionary
+
+:return: (bool) False
+:since:  1.1.0
+        """
+
+        return False
+    #
+#
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import deque
+from json import dumps as dumpJson
+from logging import getLogger
+import asyncio
+import re
+
+from aiohttp import web, WSMsgType
+
+_LOG = getLogger(__name__)
+"""
+Logger instance
+"""
+
+class WebsocketProxy(object):
+    """
+The "WebsocketProxy" class shares one homee connection with many local
+websocket clients. Clients connect like to a homee, receive the current
+state replayed followed by all messages received from homee. "GET:" requests
+for cached data types are answered locally while all other requests are
+forwarded to homee through one shared send queue.
+
+homee responses do not identify the request they answer. History responses
+are routed to the client that requested them in the order requested. All
+other messages, including responses to other forwarded requests, are sent
+to all clients.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    CACHED_REQUESTS = ( "GET:all",
+                        "GET:groups",
+                        "GET:homeegrams",
+                        "GET:nodes",
+                        "GET:plans",
+                        "GET:relationships",
+                        "GET:settings",
+                        "GET:users"
+                      )
+    """
+Requests answered from the state cached
+    """
+    CLIENT_QUEUE_SIZE = 1000
+    """
+Maximum number of messages queued for a client before it is disconnected
+as too slow.
+    """
+    RE_HISTORY_REQUEST = re.compile("^GET:/?(?:nodes/(\\d+)/attributes/(\\d+)|nodes/(\\d+)|homeegrams/(\\d+))/history(?:\\?|$)")
+    """
+RegEx matching history requests
+    """
+    SEND_QUEUE_SIZE = 1000
+    """
+Maximum number of requests forwarded but not sent to homee yet
+    """
+    STATE_TIMEOUT = 10
+    """
+Timeout in seconds to wait for the initial state from homee.
+    """
+
+    def __init__(self, connection, host = "127.0.0.1", port = None, path = None):
+        """
+Constructor __init__(WebsocketProxy)
+
+:param connection: homee connection instance to share
+:param host: Host address to listen on
+:param port: TCP port to listen on; None for the local homee one
+:param path: Unix socket path to listen on instead of a TCP port
+
+:since: 1.1.0
+        """
+
+        self._client_queues = { }
+        """
+Queues of messages to be sent per client websocket
+        """
+        self._connection = connection
+        """
+homee connection instance shared
+        """
+        self._history_requesters = { }
+        """
+Client websockets waiting for a history response per history key
+        """
+        self.host = host
+        """
+Host address to listen on
+        """
+        self.path = path
+        """
+Unix socket path to listen on
+        """
+        self.port = (connection.__class__.WS_LOCAL_PORT if (port is None) else port)
+        """
+TCP port to listen on
+        """
+        self._runner = None
+        """
+aiohttp application runner
+        """
+        self._send_queue = None
+        """
+Queue of requests forwarded to homee
+        """
+        self._sender_task = None
+        """
+Task sending all requests forwarded to homee
+        """
+    #
+
+    async def __aenter__(self):
+        """
+Enter the runtime context related to this object. It must return an
+awaitable.
+
+:return: (object) Proxy instance
+:since:  1.1.0
+        """
+
+        await self.start()
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+Exit the runtime context related to this object. It must return an
+awaitable.
+
+:return: (bool) True to suppress exceptions
+:since:  1.1.0
+        """
+
+        await self.stop()
+        return False
+    #
+
+    @property
+    def client_count(self):
+        """
+Returns the number of clients connected.
+
+:return: (int) Number of clients
+:since:  1.1.0
+        """
+
+        return len(self._client_queues)
+    #
+
+    def _broadcast(self, message):
+        """
+Queues the given message received from homee for all clients. History
+responses are only queued for the client having requested them.
+
+:param message: Message dictionary
+
+:since: 1.1.0
+        """
+
+        data = dumpJson(message)
+        history_key = self._get_history_response_key(message)
+
+        if (history_key is not None and history_key in self._history_requesters):
+            requesters = self._history_requesters[history_key]
+            socket = requesters.popleft()
+
+            if (len(requesters) < 1): del self._history_requesters[history_key]
+
+            # Responses for clients disconnected meanwhile are dropped
+            if (socket is not None): self._queue_for_client(socket, data)
+        else:
+            for socket in list(self._client_queues): self._queue_for_client(socket, data)
+        #
+    #
+
+    async def _close_clients(self):
+        """
+Disconnects all clients.
+
+:since: 1.1.0
+        """
+
+        sockets = list(self._client_queues)
+
+        self._client_queues = { }
+        self._history_requesters = { }
+
+        for socket in sockets: await socket.close()
+    #
+
+    def _get_history_request_key(self, request):
+        """
+Returns the key of the history response expected for the given request.
+
+:param request: homee API request
+
+:return: (tuple) History key; None if not a history request
+:since:  1.1.0
+        """
+
+        _return = None
+        re_result = self.__class__.RE_HISTORY_REQUEST.match(request)
+
+        if (re_result is not None):
+            ( node_id, attribute_id, history_node_id, homeegram_id ) = re_result.groups()
+
+            if (attribute_id is not None): _return = ( "attribute_history", int(node_id), int(attribute_id) )
+            elif (history_node_id is not None): _return = ( "node_history", int(history_node_id) )
+            else: _return = ( "homeegram_history", int(homeegram_id) )
+        #
+
+        return _return
+    #
+
+    def _get_history_response_key(self, message):
+        """
+Returns the history key of the given message.
+
+:param message: Message dictionary
+
+:return: (tuple) History key; None if not a history response
+:since:  1.1.0
+        """
+
+        _return = None
+
+        if (type(message.get("attribute_history")) is dict):
+            data = message['attribute_history']
+            _return = ( "attribute_history", data.get("node_id"), data.get("attribute_id") )
+        elif (type(message.get("node_history")) is dict):
+            _return = ( "node_history", message['node_history'].get("node_id") )
+        elif (type(message.get("homeegram_history")) is dict):
+            _return = ( "homeegram_history", message['homeegram_history'].get("homeegram_id") )
+        #
+
+        return _return
+    #
+
+    def _get_state_message(self, request):
+        """
+Returns the response message for the given cached request.
+
+:param request: homee API "GET:" request
+
+:return: (dict) Message dictionary
+:since:  1.1.0
+        """
+
+        connection = self._connection
+        _type = request[4:]
+
+        state = { }
+
+        if (_type in ( "all", "groups" )): state['groups'] = [ dict(item) for item in connection.groups ]
+        if (_type in ( "all", "homeegrams" )): state['homeegrams'] = [ dict(item) for item in connection.homeegrams ]
+        if (_type in ( "all", "nodes" )): state['nodes'] = [ node.to_dict() for node in connection.registry.get_nodes() ]
+        if (_type in ( "all", "plans" )): state['plans'] = [ dict(item) for item in connection.plans ]
+        if (_type in ( "all", "relationships" )): state['relationships'] = [ dict(item) for item in connection.relationships ]
+
+        if (_type in ( "all", "settings" ) and connection.settings is not None):
+            state['settings'] = dict(connection.settings)
+        #
+
+        if (_type in ( "all", "users" )): state['users'] = [ dict(item) for item in connection.users ]
+
+        return ({ "all": state } if (_type == "all") else state)
+    #
+
+    async def _handle_access_token(self, request):
+        """
+Handles access token requests of clients. Authentication is left to the
+shared homee connection.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp response instance
+:since:  1.1.0
+        """
+
+        response = web.Response(text = "access_token=proxy")
+        response.set_cookie("access_token", "proxy", max_age = 3600)
+
+        return response
+    #
+
+    async def _handle_connection(self, request):
+        """
+Handles a client websocket connection until it has been closed.
+
+:param request: aiohttp request instance
+
+:return: (object) aiohttp websocket response instance
+:since:  1.1.0
+        """
+
+        if (self._sender_task is None or self._sender_task.done()): raise web.HTTPServiceUnavailable()
+
+        socket = web.WebSocketResponse(protocols = [ "v2" ])
+        await socket.prepare(request)
+
+        queue = asyncio.Queue(self.__class__.CLIENT_QUEUE_SIZE)
+
+        queue.put_nowait(dumpJson(self._get_state_message("GET:all")))
+        self._client_queues[socket] = queue
+
+        writer_task = asyncio.ensure_future(self._write_to_client(socket, queue))
+
+        try:
+            async for message in socket:
+                if (message.type == WSMsgType.TEXT):
+                    if (message.data in self.__class__.CACHED_REQUESTS):
+                        self._queue_for_client(socket, dumpJson(self._get_state_message(message.data)))
+                    elif (self._sender_task.done()): break
+                    else:
+                        history_key = self._get_history_request_key(message.data)
+
+                        if (history_key is not None):
+                            if (history_key not in self._history_requesters): self._history_requesters[history_key] = deque()
+                            self._history_requesters[history_key].append(socket)
+                        #
+
+                        await self._send_queue.put(message.data)
+                    #
+                elif (message.type == WSMsgType.ERROR): break
+            #
+        finally:
+            self._remove_client(socket)
+            writer_task.cancel()
+        #
+
+        return socket
+    #
+
+    def _queue_for_client(self, socket, data):
+        """
+Queues the given data for the given client. Clients not keeping up are
+disconnected.
+
+:param socket: Client websocket
+:param data: JSON data to be sent
+
+:since: 1.1.0
+        """
+
+        queue = self._client_queues.get(socket)
+
+        if (queue is not None):
+            try: queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._remove_client(socket)
+                asyncio.ensure_future(socket.close())
+            #
+        #
+    #
+
+    def _remove_client(self, socket):
+        """
+Removes the given client websocket. Pending history requests of it are kept
+as placeholders so that later responses are still routed in order.
+
+:param socket: Client websocket
+
+:since: 1.1.0
+        """
+
+        self._client_queues.pop(socket, None)
+
+        for requesters in self._history_requesters.values():
+            for ( position, requester ) in enumerate(requesters):
+                if (requester is socket): requesters[position] = None
+            #
+        #
+    #
+
+    async def _send_requests(self):
+        """
+Sends all requests forwarded by clients to homee in the order queued.
+
+:since: 1.1.0
+        """
+
+        try:
+            while True:
+                request = await self._send_queue.get()
+                await self._connection.send(request)
+            #
+        except Exception:
+            _LOG.exception("Forwarding requests to homee failed")
+
+            # Unblock clients waiting for the full send queue before disconnecting them
+            while (not self._send_queue.empty()): self._send_queue.get_nowait()
+
+            await self._close_clients()
+        #
+    #
+
+    async def start(self):
+        """
+Connects to homee if required, downloads the current state and starts
+accepting client websocket connections.
+
+:since: 1.1.0
+        """
+
+        connection = self._connection
+
+        if (not connection.is_connected): await connection.connect()
+
+        future = connection.create_message_waiter("all")
+
+        try:
+            await connection.send("GET:all")
+            await connection.wait_for_message(timeout = self.__class__.STATE_TIMEOUT, future = future)
+        finally: connection.cancel_message_waiter(future)
+
+        self._send_queue = asyncio.Queue(self.__class__.SEND_QUEUE_SIZE)
+        self._sender_task = asyncio.ensure_future(self._send_requests())
+
+        connection.add_message_listener(self._broadcast)
+
+        application = web.Application()
+        application.router.add_post("/access_token", self._handle_access_token)
+        application.router.add_get("/connection", self._handle_connection)
+
+        self._runner = web.AppRunner(application)
+        await self._runner.setup()
+
+        site = (web.TCPSite(self._runner, self.host, self.port)
+                if (self.path is None) else
+                web.UnixSite(self._runner, self.path)
+               )
+
+        await site.start()
+    #
+
+    async def stop(self):
+        """
+Disconnects all clients and stops accepting client websocket connections.
+The shared homee connection is left open.
+
+:since: 1.1.0
+        """
+
+        if (self._connection.is_connected): self._connection.remove_message_listener(self._broadcast)
+
+        await self._close_clients()
+
+        if (self._runner is not None):
+            await self._runner.cleanup()
+            self._runner = None
+        #
+
+        if (self._sender_task is not None):
+            self._sender_task.cancel()
+            self._sender_task = None
+        #
+
+        self._send_queue = None
+    #
+
+    async def _write_to_client(self, socket, queue):
+        """
+Sends all data queued for the given client websocket.
+
+:param socket: Client websocket
+:param queue: Queue of JSON data to be sent
+
+:since: 1.1.0
+        """
+
+        try:
+            while True:
+                data = await queue.get()
+                await socket.send_str(data)
+            #
+        except Exception:
+            # The client has vanished without closing its websocket
+            self._remove_client(socket)
+            await socket.close()
+        #
+    #
+#
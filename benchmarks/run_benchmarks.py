@@ -0,0 +1,484 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from argparse import ArgumentParser
+from json import dumps as dumpJson, loads as parseJson
+from os import path
+from random import Random
+from time import perf_counter, perf_counter_ns, time
+import asyncio
+import gc
+import platform
+import subprocess
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from aiohomeeclient import Homee
+from aiohomeeclient.mock_homee_server import MockHomeeServer
+
+try: import resource
+except ImportError: resource = None
+
+class BenchmarkSuite(object):
+    """
+The "BenchmarkSuite" class measures the hot paths of the client against a
+local mock homee and reports the results as JSON.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    PASSWORD = "benchmark"
+    """
+Password of the mock homee user
+    """
+    USERNAME = "benchmark"
+    """
+Username of the mock homee user
+    """
+
+    def __init__(self, node_counts, update_count, lookup_count, repeat, seed):
+        """
+Constructor __init__(BenchmarkSuite)
+
+:param node_counts: Numbers of synthetic nodes to benchmark
+:param update_count: Number of attribute updates handled
+:param lookup_count: Number of lookups timed
+:param repeat: Number of times each timing is repeated
+:param seed: Seed of the synthetic requests
+
+:since: 1.1.0
+        """
+
+        self.lookup_count = lookup_count
+        """
+Number of lookups timed
+        """
+        self.node_counts = node_counts
+        """
+Numbers of synthetic nodes to benchmark
+        """
+        self.repeat = repeat
+        """
+Number of times each timing is repeated
+        """
+        self.seed = seed
+        """
+Seed of the synthetic requests
+        """
+        self.update_count = update_count
+        """
+Number of attribute updates handled
+        """
+    #
+
+    async def _benchmark_ingest(self, node_count):
+        """
+Measures decoding and registry build time of a "GET:all" response with
+the given number of nodes.
+
+:param node_count: Number of synthetic nodes
+
+:return: (dict) Benchmark result
+:since:  1.1.0
+        """
+
+        data = self._get_all_frame(node_count)
+
+        parse_times = [ ]
+        build_times = [ ]
+
+        for _ in range(self.repeat):
+            homee = await self._connect()
+
+            try:
+                gc.collect()
+
+                start_time = perf_counter()
+                message = parseJson(data)
+                parse_times.append(perf_counter() - start_time)
+
+                start_time = perf_counter()
+                await homee._connection._handle_message(message)
+                build_times.append(perf_counter() - start_time)
+            finally: await homee.disconnect()
+        #
+
+        return { "nodes": node_count,
+                 "frame_bytes": len(data),
+                 "parse_s": self._get_statistics(parse_times),
+                 "build_s": self._get_statistics(build_times),
+                 "total_s_min": min(parse_times) + min(build_times)
+               }
+    #
+
+    async def _benchmark_lookups(self, node_count):
+        """
+Measures the latency of "Registry.get_node_id_for_name()" and
+"Node.get_attribute()" for the given number of registered nodes.
+
+:param node_count: Number of synthetic nodes
+
+:return: (dict) Benchmark result
+:since:  1.1.0
+        """
+
+        homee = await self._connect()
+
+        try:
+            await homee._connection._handle_message(parseJson(self._get_all_frame(node_count)))
+
+            registry = homee.registry
+            nodes = registry.get_nodes()
+
+            random = Random(self.seed)
+            names = [ random.choice(nodes).name for _ in range(self.lookup_count) ]
+            lookup_nodes = [ random.choice(nodes) for _ in range(self.lookup_count) ]
+
+            name_timings = [ ]
+
+            for name in names:
+                start_time = perf_counter_ns()
+                registry.get_node_id_for_name(name)
+                name_timings.append(perf_counter_ns() - start_time)
+            #
+
+            attribute_timings = [ ]
+
+            for node in lookup_nodes:
+                start_time = perf_counter_ns()
+                node.get_attribute("Temperature")
+                attribute_timings.append(perf_counter_ns() - start_time)
+            #
+        finally: await homee.disconnect()
+
+        return { "nodes": node_count,
+                 "lookups": self.lookup_count,
+                 "get_node_id_for_name_ns": self._get_percentiles(name_timings),
+                 "get_attribute_ns": self._get_percentiles(attribute_timings)
+               }
+    #
+
+    async def _benchmark_memory(self, node_count):
+        """
+Measures the resident memory of a registry with the given number of nodes
+in a fresh interpreter.
+
+:param node_count: Number of synthetic nodes
+
+:return: (dict) Benchmark result; None if not supported
+:since:  1.1.0
+        """
+
+        if (resource is None): return None
+
+        process = await asyncio.create_subprocess_exec(sys.executable,
+                                                       path.abspath(__file__),
+                                                       "--memory-child",
+                                                       str(node_count),
+                                                       "--seed",
+                                                       str(self.seed),
+                                                       stdout = subprocess.PIPE
+                                                      )
+
+        ( output, _ ) = await process.communicate()
+        if (process.returncode != 0): raise RuntimeError("Memory benchmark failed for {0:d} nodes".format(node_count))
+
+        return parseJson(output)
+    #
+
+    async def _benchmark_updates(self, node_count):
+        """
+Measures the throughput of attribute updates handled through
+"Connection._handle_message()".
+
+:param node_count: Number of synthetic nodes
+
+:return: (dict) Benchmark result
+:since:  1.1.0
+        """
+
+        all_message = parseJson(self._get_all_frame(node_count))
+
+        random = Random(self.seed)
+        attributes = [ attribute for node in all_message['all']['nodes'] for attribute in node['attributes'] ]
+
+        messages = [ ]
+
+        for position in range(self.update_count):
+            attribute = dict(random.choice(attributes))
+            attribute['current_value'] = position % 100
+            messages.append({ "attribute": attribute })
+        #
+
+        timings = [ ]
+
+        for _ in range(self.repeat):
+            homee = await self._connect()
+
+            try:
+                await homee._connection._handle_message(parseJson(self._get_all_frame(node_count)))
+                handle_message = homee._connection._handle_message
+
+                gc.collect()
+                start_time = perf_counter()
+
+                for message in messages: await handle_message(message)
+
+                timings.append(perf_counter() - start_time)
+            finally: await homee.disconnect()
+        #
+
+        return { "nodes": node_count,
+                 "updates": self.update_count,
+                 "duration_s": self._get_statistics(timings),
+                 "updates_per_s": self.update_count / min(timings)
+               }
+    #
+
+    async def _connect(self):
+        """
+Returns a new homee instance connected to the mock homee.
+
+:return: (object) Homee instance
+:since:  1.1.0
+        """
+
+        _return = Homee("127.0.0.1", self.__class__.USERNAME, self.__class__.PASSWORD)
+        await _return.connect()
+
+        return _return
+    #
+
+    def _get_all_frame(self, node_count):
+        """
+Returns the JSON "GET:all" response of a mock homee with the given number
+of nodes.
+
+:param node_count: Number of synthetic nodes
+
+:return: (str) JSON frame
+:since:  1.1.0
+        """
+
+        return dumpJson(MockHomeeServer(node_count = node_count, seed = self.seed)._get_response("GET:all"))
+    #
+
+    async def run(self):
+        """
+Runs all benchmarks against a local mock homee.
+
+:return: (dict) Benchmark results
+:since:  1.1.0
+        """
+
+        _return = { "timestamp": time(),
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "parameters": { "node_counts": self.node_counts,
+                                    "updates": self.update_count,
+                                    "lookups": self.lookup_count,
+                                    "repeat": self.repeat,
+                                    "seed": self.seed
+                                  },
+                    "ingest": [ ],
+                    "updates": [ ],
+                    "lookups": [ ],
+                    "memory": [ ]
+                  }
+
+        async with MockHomeeServer(node_count = 1,
+                                   username = self.__class__.USERNAME,
+                                   password = self.__class__.PASSWORD,
+                                   seed = self.seed
+                                  ):
+            for node_count in self.node_counts:
+                _return['ingest'].append(await self._benchmark_ingest(node_count))
+                _return['updates'].append(await self._benchmark_updates(node_count))
+                _return['lookups'].append(await self._benchmark_lookups(node_count))
+
+                memory = await self._benchmark_memory(node_count)
+                if (memory is not None): _return['memory'].append(memory)
+            #
+        #
+
+        return _return
+    #
+
+    async def run_memory_child(self, node_count):
+        """
+Registers the given number of nodes and returns the resident memory used.
+It is run in a fresh interpreter connecting to the mock homee of the
+parent process.
+
+:param node_count: Number of synthetic nodes
+
+:return: (dict) Benchmark result
+:since:  1.1.0
+        """
+
+        homee = await self._connect()
+
+        try:
+            gc.collect()
+
+            rss_before = self._get_current_rss()
+            peak_rss_before = self._get_peak_rss()
+
+            await homee._connection._handle_message(parseJson(self._get_all_frame(node_count)))
+            gc.collect()
+
+            peak_rss_after = self._get_peak_rss()
+            rss_after = self._get_current_rss()
+        finally: await homee.disconnect()
+
+        return { "nodes": node_count,
+                 "peak_rss_bytes": peak_rss_after,
+                 "peak_rss_bytes_per_node": (peak_rss_after - peak_rss_before) / node_count,
+                 "retained_rss_bytes_per_node": (None
+                                                 if (rss_before is None or rss_after is None) else
+                                                 (rss_after - rss_before) / node_count
+                                                )
+               }
+    #
+
+    @staticmethod
+    def _get_current_rss():
+        """
+Returns the current resident set size if available.
+
+:return: (int) Resident set size in bytes; None if not available
+:since:  1.1.0
+        """
+
+        _return = None
+
+        try:
+            with open("/proc/self/statm") as file_object:
+                _return = int(file_object.read().split()[1]) * resource.getpagesize()
+            #
+        except (IOError, ValueError): pass
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_peak_rss():
+        """
+Returns the peak resident set size of this process. The Linux high water
+mark is preferred as "ru_maxrss" is inherited from the parent process.
+
+:return: (int) Peak resident set size in bytes
+:since:  1.1.0
+        """
+
+        _return = None
+
+        try:
+            with open("/proc/self/status") as file_object:
+                for line in file_object:
+                    if (line.startswith("VmHWM:")):
+                        _return = int(line.split()[1]) * 1024
+                        break
+                    #
+                #
+            #
+        except (IOError, ValueError): pass
+
+        if (_return is None):
+            _return = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if (sys.platform != "darwin"): _return *= 1024
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_percentiles(timings):
+        """
+Returns mean and percentiles of the given timings.
+
+:param timings: Timings
+
+:return: (dict) Statistics dictionary
+:since:  1.1.0
+        """
+
+        timings = sorted(timings)
+        count = len(timings)
+
+        return { "mean": sum(timings) / count,
+                 "p50": timings[count // 2],
+                 "p99": timings[min(count - 1, (count * 99) // 100)],
+                 "max": timings[-1]
+               }
+    #
+
+    @staticmethod
+    def _get_statistics(timings):
+        """
+Returns minimum, median and maximum of the given repeated timings.
+
+:param timings: Timings
+
+:return: (dict) Statistics dictionary
+:since:  1.1.0
+        """
+
+        timings = sorted(timings)
+        return { "min": timings[0], "median": timings[len(timings) // 2], "max": timings[-1] }
+    #
+
+    @staticmethod
+    def main():
+        """
+Parses the command line arguments and prints the benchmark results as JSON.
+
+:since: 1.1.0
+        """
+
+        parser = ArgumentParser(description = "Benchmarks the aiohomeeclient hot paths against a local mock homee")
+        parser.add_argument("--nodes", default = "10,100,1000,5000", help = "Comma separated numbers of synthetic nodes")
+        parser.add_argument("--updates", default = 100000, type = int, help = "Number of attribute updates handled")
+        parser.add_argument("--lookups", default = 10000, type = int, help = "Number of lookups timed")
+        parser.add_argument("--repeat", default = 5, type = int, help = "Number of times each timing is repeated")
+        parser.add_argument("--seed", default = 1, type = int, help = "Seed of the synthetic requests")
+        parser.add_argument("--output", help = "File to write the JSON results to instead of stdout")
+        parser.add_argument("--memory-child", type = int, help = "Internal: measure memory for the given number of nodes")
+
+        args = parser.parse_args()
+
+        suite = BenchmarkSuite([ int(value) for value in args.nodes.split(",") ],
+                               args.updates,
+                               args.lookups,
+                               args.repeat,
+                               args.seed
+                              )
+
+        if (args.memory_child is not None): print(dumpJson(asyncio.run(suite.run_memory_child(args.memory_child))))
+        else:
+            results = dumpJson(asyncio.run(suite.run()), indent = 2)
+
+            if (args.output is None): print(results)
+            else:
+                with open(args.output, "w") as file_object: file_object.write(results)
+            #
+        #
+    #
+#
+
+if (__name__ == "__main__"): BenchmarkSuite.main()
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+"""
+(C) Tobias Wolf et al. - All rights reserved
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from json import dumps as dumpJson
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, main
+import asyncio
+import os
+
+from aiohomeeclient import Homee
+from aiohomeeclient.connection import Connection
+from aiohomeeclient.event import EVENT_BATTERY_LOW
+from aiohomeeclient.mock_homee_server import MockHomeeServer
+from aiohomeeclient.traffic_recorder import DIRECTION_INBOUND, DIRECTION_OUTBOUND, TrafficReader, TrafficRecorder
+from aiohomeeclient.traffic_replayer import TrafficReplayer
+
+class LowBatteryMockHomeeServer(MockHomeeServer):
+    """
+Mock homee simulating nodes with a low battery level.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    NODE_ATTRIBUTES = MockHomeeServer.NODE_ATTRIBUTES[:3] + (( "BatteryLevel", 0, 100, "%25", 0, 10 ), )
+    """
+Attribute type name, minimum, maximum, unit, editable flag and initial
+value of each simulated node attribute
+    """
+#
+
+class MockHomeeTestCase(IsolatedAsyncioTestCase):
+    """
+Base test case connecting to a local mock homee.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    NODE_COUNT = 5
+    """
+Number of nodes simulated
+    """
+
+    async def asyncSetUp(self):
+        """
+Starts the mock homee and connects to it.
+
+:since: 1.1.0
+        """
+
+        self.server = self._get_server_class()(node_count = self.__class__.NODE_COUNT)
+        await self.server.start()
+
+        self.homee = Homee("127.0.0.1", "homee", "")
+        self.connection = self.homee._connection
+    #
+
+    async def asyncTearDown(self):
+        """
+Disconnects and stops the mock homee.
+
+:since: 1.1.0
+        """
+
+        await self.homee.disconnect()
+        await self.server.stop()
+    #
+
+    def _get_node_data(self, node_id):
+        """
+Returns the data of a new node copied from the first simulated one.
+
+:param node_id: homee node ID of the new node
+
+:return: (dict) Node data
+:since:  1.1.0
+        """
+
+        _return = dict(self.server._nodes[1])
+        _return['id'] = node_id
+        _return['attributes'] = [ dict(attribute, node_id = node_id) for attribute in _return['attributes'] ]
+
+        return _return
+    #
+
+    def _get_server_class(self):
+        """
+Returns the mock homee class used.
+
+:return: (type) Mock homee class
+:since:  1.1.0
+        """
+
+        return MockHomeeServer
+    #
+
+    async def _wait_for_handler(self):
+        """
+Waits for the handler task to finish after the connection has been closed.
+
+:since: 1.1.0
+        """
+
+        await asyncio.wait_for(asyncio.shield(self.connection._handler_task), 5)
+    #
+#
+
+class TestConnection(MockHomeeTestCase):
+    """
+Tests the homee connection against a local mock homee.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    async def test_close_with_backlog(self):
+        """
+Messages still queued when homee closes the connection are handled.
+
+:since: 1.1.0
+        """
+
+        await self.homee.connect()
+        waiter = self.connection.create_message_waiter()
+
+        for node_id in range(1000, 1200): await self.server.send_message({ "node": self._get_node_data(node_id) })
+        await self.server.stop()
+
+        await self._wait_for_handler()
+
+        self.assertIn("node", await waiter)
+        self.assertEqual(len(self.homee.registry.get_nodes()), 200 + self.__class__.NODE_COUNT)
+    #
+
+    async def test_history_page_boundaries(self):
+        """
+History entries on page boundaries are returned once and the limit applies
+to the merged result.
+
+:since: 1.1.0
+        """
+
+        await self.homee.connect()
+
+        page_duration = Homee.HISTORY_PAGE_DURATION
+        timestamp_from = 100 * page_duration
+        timestamp_till = timestamp_from + 3 * page_duration
+
+        history = await self.homee.get_attribute_history(1, 1, timestamp_from, timestamp_till)
+        timestamps = list(history.timestamps)
+
+        self.assertEqual(len(timestamps), 1 + (timestamp_till - timestamp_from) // MockHomeeServer.HISTORY_INTERVAL)
+        self.assertEqual(timestamps, sorted(set(timestamps)))
+
+        history = await self.homee.get_attribute_history(1, 1, timestamp_from, timestamp_till, 30)
+
+        self.assertEqual(list(history.timestamps), timestamps[:30])
+    #
+
+    async def test_null_frame(self):
+        """
+A JSON "null" frame does not end the handling of later messages.
+
+:since: 1.1.0
+        """
+
+        await self.homee.connect()
+
+        await self.server.send_message(None)
+        await self.server.send_message({ "node": self._get_node_data(1000) })
+
+        await self.homee.wait_for_node(1000, 5)
+
+        self.assertFalse(self.connection._handler_task.done())
+        self.assertEqual(self.connection.inbound_queue_metrics['depth'], 0)
+    #
+
+    async def test_recording_appended_after_truncation(self):
+        """
+Records appended to a recording interrupted in the middle of a record are
+readable and replayed.
+
+:since: 1.1.0
+        """
+
+        with TemporaryDirectory() as directory_path:
+            file_path = path.join(directory_path, "traffic.bin")
+
+            with TrafficRecorder(file_path) as recorder:
+                connection = Connection("127.0.0.1", "homee", "", recorder = recorder)
+
+                await connection.connect()
+                await connection.send("GET:nodes")
+                await connection.wait_for_message("nodes", timeout = 5)
+                await connection.disconnect()
+            #
+
+            record_count = len(list(TrafficReader(file_path)))
+            os.truncate(file_path, path.getsize(file_path) - 3)
+
+            with TrafficRecorder(file_path) as recorder:
+                recorder.record_outbound("GET:nodes/1000")
+                recorder.record_inbound(dumpJson({ "node": self._get_node_data(1000) }))
+            #
+
+            records = list(TrafficReader(file_path))
+
+            self.assertEqual(len(records), 1 + record_count)
+            self.assertEqual([ record[1] for record in records[-2:] ], [ DIRECTION_OUTBOUND, DIRECTION_INBOUND ])
+
+            connection = Connection("127.0.0.1", "homee", "")
+
+            try:
+                await TrafficReplayer(file_path).replay(connection)
+                self.assertTrue(connection.registry.is_node_known(1000))
+            finally: await connection.disconnect()
+        #
+    #
+#
+
+class TestRegistryListeners(MockHomeeTestCase):
+    """
+Tests registry listeners against a local mock homee.
+
+:author:     Tobias Wolf et al.
+:copyright:  Tobias Wolf et al. - All rights reserved
+:package:    aiohomee
+:subpackage: client
+:since:      1.1.0
+:license:    Mozilla Public License, v. 2.0
+    """
+
+    NODE_COUNT = 25
+    """
+Number of nodes simulated
+    """
+
+    def _get_server_class(self):
+        """
+Returns the mock homee class used.
+
+:return: (type) Mock homee class
+:since:  1.1.0
+        """
+
+        return LowBatteryMockHomeeServer
+    #
+
+    async def test_raising_listener(self):
+        """
+A raising listener neither fails connecting nor stops registering nodes.
+
+:since: 1.1.0
+        """
+
+        self.homee.add_registry_listener(_raise_value_error, ( EVENT_BATTERY_LOW, ))
+
+        with self.assertLogs("aiohomeeclient.registry", "ERROR"): await self.homee.connect()
+
+        self.assertEqual(len(self.homee.registry.get_nodes()), self.__class__.NODE_COUNT)
+    #
+#
+
+def _raise_value_error(event):
+    """
+Listener raising for every event.
+
+:param event: Event instance
+
+:since: 1.1.0
+    """
+
+    raise ValueError("Listener failed for event '{0}'".format(event.type))
+#
+
+if (__name__ == "__main__"): main()